@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+저지연 효과음 엔진
+- 배포 환경별 믹서 프로필 (샘플레이트 / 버퍼 크기)로 pygame.mixer 초기화
+  AUDIO_PROFILE=desktop|pi 로 강제 가능, 지정하지 않으면 라즈베리파이 여부로 자동 선택
+- 효과음은 시작할 때 한 번만 불러서 믹서 형식(샘플레이트, 채널 수)으로 변환해 둠
+- 채널 풀 + 우선순위: 빈 채널이 없으면 우선순위가 같거나 낮은 가장 오래된 소리를 끊고 재생
+  (채널 0은 배경음악 스트리밍용으로 예약, bgm_player.BGM_CHANNEL)
+- 루프백 지연 측정: 이벤트 시점부터 믹서가 소리를 가져갈 때까지 + 출력 버퍼 한 개 분량
+  SDL dummy / disk 드라이버에서도 실행 가능 (disk는 출력 파일에서 실제 소리 시작 위치까지 확인)
+
+    python audio_engine.py                         # 모든 프로필 지연 측정 (SDL dummy 드라이버)
+    python audio_engine.py --driver disk --profile pi --trials 50
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pygame
+
+from audio_synth import SAMPLE_RATE, cached_render, render_coin
+from bgm_player import BGM_CHANNEL, to_mixer_dtype
+from tracing import get_tracer
+
+# 프로필별 믹서 설정 (buffer: 콜백 한 번에 섞는 샘플 수, 작을수록 지연이 짧음)
+PROFILES = {
+    'desktop': {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 512},
+    'pi': {'frequency': 22050, 'size': -16, 'channels': 2, 'buffer': 256},
+}
+POOL_SIZE = 8  # 효과음 채널 수 (배경음악 채널 제외)
+
+# 효과음 이름 → (파일, 우선순위, 파일이 없을 때 쓸 PCM 렌더러)
+SFX = {
+    'boop': ("boop-sfx.wav", 1, None),            # 런처 버튼
+    'confirm': ("confirmbeep-sfx.wav", 2, None),  # 캐릭터 게임 점수
+    'coin': ("coin-sfx.mp3", 2, render_coin),     # 음식 게임 먹기
+}
+
+
+def is_raspberry_pi():
+    try:
+        with open("/proc/device-tree/model", encoding="utf-8", errors="ignore") as f:
+            return "Raspberry Pi" in f.read()
+    except OSError:
+        return False
+
+
+def detect_profile():
+    """AUDIO_PROFILE 환경변수 → 없으면 하드웨어로 판단"""
+    profile = os.environ.get('AUDIO_PROFILE')
+    if profile in PROFILES:
+        return profile
+    return 'pi' if is_raspberry_pi() else 'desktop'
+
+
+def init_mixer(profile=None):
+    """프로필대로 믹서 초기화 (이미 같은 형식으로 열려 있으면 그대로 사용)"""
+    profile = profile or detect_profile()
+    settings = PROFILES[profile]
+    wanted = (settings['frequency'], settings['size'], settings['channels'])
+    current = pygame.mixer.get_init()
+    if current is not None and current != wanted:
+        pygame.mixer.quit()  # pygame.init()이 기본값으로 먼저 열었거나 다른 프로필
+        current = None
+    if current is None:
+        pygame.mixer.pre_init(**settings)
+        pygame.mixer.init(**settings)
+    pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), POOL_SIZE + BGM_CHANNEL + 1))
+    pygame.mixer.set_reserved(BGM_CHANNEL + 1)
+    return profile
+
+
+def resample(pcm, src_rate, dst_rate):
+    """(N, C) PCM 선형 보간 리샘플링 (float32)"""
+    pcm = np.asarray(pcm, dtype=np.float32)
+    if pcm.ndim == 1:
+        pcm = pcm[:, None]
+    if src_rate == dst_rate or len(pcm) < 2:
+        return pcm
+    frames = max(1, int(round(len(pcm) * dst_rate / src_rate)))
+    src = np.arange(frames) * (src_rate / dst_rate)
+    xp = np.arange(len(pcm))
+    return np.stack([np.interp(src, xp, pcm[:, c]) for c in range(pcm.shape[1])], axis=1).astype(np.float32)
+
+
+def make_mixer_sound(pcm, sample_rate):
+    """int16 범위 PCM 배열 → 현재 믹서 형식의 Sound (샘플레이트/채널 수 변환 포함)"""
+    frequency, size, channels = pygame.mixer.get_init()
+    pcm = resample(pcm, sample_rate, frequency)
+    if pcm.shape[1] != channels:
+        pcm = np.repeat(pcm.mean(axis=1, keepdims=True), channels, axis=1)
+    return pygame.sndarray.make_sound(to_mixer_dtype(pcm, size, channels))
+
+
+class AudioEngine:
+    def __init__(self, profile=None, pool_size=POOL_SIZE):
+        self.profile = init_mixer(profile)
+        self.settings = PROFILES[self.profile]
+        self.sounds = {}    # 이름 → (Sound, 우선순위)
+        self.pool = [pygame.mixer.Channel(i) for i in range(BGM_CHANNEL + 1, BGM_CHANNEL + 1 + pool_size)]
+        self.active = {}    # 채널 번호 → (우선순위, 시작 시각)
+        self.lock = threading.Lock()
+        self.tracer = get_tracer()
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def load(self, name, path=None, pcm=None, sample_rate=None, priority=1):
+        """효과음 미리 불러오기 (파일은 pygame이 믹서 형식으로 디코딩, PCM 배열은 직접 변환)"""
+        if pcm is not None:
+            sound = make_mixer_sound(pcm, sample_rate)
+        else:
+            sound = pygame.mixer.Sound(path)
+        self.sounds[name] = (sound, priority)
+        return sound
+
+    def preload(self, names=None):
+        """SFX 표의 효과음을 한 번에 불러오기 (이미 불러온 것은 건너뜀)"""
+        for name in names or SFX:
+            if name in self.sounds:
+                continue
+            path, priority, renderer = SFX[name]
+            try:
+                if os.path.exists(path):
+                    self.load(name, path=path, priority=priority)
+                elif renderer is not None:
+                    # 파일이 없으면 생성된 사운드 사용
+                    pcm = cached_render(name, renderer)
+                    self.load(name, pcm=pcm, sample_rate=SAMPLE_RATE, priority=priority)
+            except (pygame.error, OSError, ValueError) as e:
+                print(f"[!] 효과음 로드 실패 ({path}): {e}")
+
+    def play(self, name, priority=None):
+        """효과음 재생 (재생한 채널 반환, 채널이 모자라 버렸으면 None)"""
+        entry = self.sounds.get(name)
+        if entry is None:
+            return None
+        sound, default_priority = entry
+        priority = default_priority if priority is None else priority
+        try:
+            with self.lock:
+                index = self._acquire(priority)
+                if index is None:
+                    self.dropped += 1
+                    return None
+                channel = self.pool[index]
+                channel.play(sound)
+                self.active[index] = (priority, time.perf_counter())
+                self.played += 1
+            self.tracer.instant("sfx", {'name': name, 'channel': index})
+            return channel
+        except pygame.error:
+            return None  # 믹서가 이미 종료됨
+
+    def _acquire(self, priority):
+        """빈 채널 번호 → 없으면 우선순위가 같거나 낮은 소리 중 가장 오래된 채널을 끊고 사용"""
+        victim = None
+        for index, channel in enumerate(self.pool):
+            if not channel.get_busy():
+                return index
+            playing = self.active.get(index, (0, 0.0))  # (우선순위, 시작 시각)
+            if playing[0] <= priority and (victim is None or playing < self.active.get(victim, (0, 0.0))):
+                victim = index
+        if victim is not None:
+            self.pool[victim].stop()
+            self.stolen += 1
+        return victim
+
+    def stop_all(self):
+        for channel in self.pool:
+            channel.stop()
+        self.active.clear()
+
+    def get_stats(self):
+        frequency, buffer = self.settings['frequency'], self.settings['buffer']
+        return {
+            'profile': self.profile,
+            'mixer': pygame.mixer.get_init(),
+            'buffer_ms': buffer * 1000.0 / frequency,
+            'loaded': sorted(self.sounds),
+            'played': self.played,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+        }
+
+
+_engine = None
+
+
+def get_engine():
+    """프로세스 공용 엔진 (처음 호출할 때 믹서 초기화, 호스트에서 게임을 바꿔도 효과음 유지)"""
+    global _engine
+    if _engine is None or pygame.mixer.get_init() is None:
+        _engine = AudioEngine()
+    return _engine
+
+
+# ----------------------------------------------------------------------------
+# 루프백 지연 측정
+# ----------------------------------------------------------------------------
+
+def measure_latency(engine, trials=20, interval=0.12):
+    """이벤트 → 들리기까지 지연 측정 (ms)
+
+    1ms 클릭음을 재생하고 채널이 끝날 때까지 기다림: 클릭은 콜백 한 번 안에 다 섞이므로
+    끝난 시점 = 믹서가 소리를 가져간 시점. 섞인 버퍼는 출력 버퍼 한 개 분량 뒤에 들리므로 그만큼 더함.
+    """
+    frequency = pygame.mixer.get_init()[0]
+    click = np.full((max(1, frequency // 1000), 2), 16000, dtype=np.float32)
+    engine.load('_click', pcm=click, sample_rate=frequency, priority=99)
+    buffer_ms = engine.settings['buffer'] * 1000.0 / frequency
+
+    mix_delays, events = [], []
+    time.sleep(0.2)  # 오디오 장치가 안정될 때까지
+    for i in range(trials):
+        time.sleep(interval + (i % 5) * 0.007)  # 콜백 주기와 맞물리지 않도록 간격을 조금씩 바꿈
+        start = time.perf_counter()
+        channel = engine.play('_click')
+        if channel is None:
+            continue
+        while channel.get_busy():
+            if time.perf_counter() - start > 1.0:
+                break
+            time.sleep(0.0002)
+        mix_delays.append((time.perf_counter() - start) * 1000.0)
+        events.append(start)
+    engine.sounds.pop('_click', None)
+
+    delays = np.array(mix_delays)
+    return {
+        'profile': engine.profile,
+        'driver': os.environ.get('SDL_AUDIODRIVER', 'system'),
+        'trials': len(delays),
+        'buffer_ms': buffer_ms,
+        'mix_delay_ms': float(delays.mean()) if len(delays) else None,
+        'latency_ms': float(delays.mean() + buffer_ms) if len(delays) else None,
+        'latency_p95_ms': float(np.percentile(delays, 95) + buffer_ms) if len(delays) else None,
+        'events': events,
+    }
+
+
+def analyze_disk_output(path, frequency, channels, events):
+    """disk 드라이버 출력 파일에서 클릭 시작 위치를 찾아 이벤트 간격과 비교 (지터 ms)"""
+    data = np.fromfile(path, dtype=np.int16)
+    data = data[:len(data) // channels * channels].reshape(-1, channels)
+    loud = np.abs(data[:, 0].astype(np.int32)) > 8000
+    onsets = np.flatnonzero(loud[1:] & ~loud[:-1]) + 1
+    if loud[:1].any():
+        onsets = np.r_[0, onsets]
+    result = {'rendered': len(onsets), 'expected': len(events), 'jitter_ms': None}
+    if len(onsets) == len(events) and len(events) > 1:
+        audio_gaps = np.diff(onsets) * 1000.0 / frequency
+        event_gaps = np.diff(events) * 1000.0
+        result['jitter_ms'] = float(np.std(audio_gaps - event_gaps))
+    return result
+
+
+def main():
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="효과음 이벤트 → 출력 지연 측정")
+    parser.add_argument("--profile", nargs="*", choices=sorted(PROFILES), default=sorted(PROFILES),
+                        help="측정할 믹서 프로필 (기본: 전체)")
+    parser.add_argument("--driver", choices=["dummy", "disk", "system"], default="dummy",
+                        help="SDL 오디오 드라이버 (system: 실제 장치)")
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.driver != "system":
+        os.environ['SDL_AUDIODRIVER'] = args.driver
+    for profile in args.profile:
+        disk_file = None
+        if args.driver == "disk":
+            fd, disk_file = tempfile.mkstemp(suffix=".raw", prefix="sdlaudio_")
+            os.close(fd)
+            os.environ['SDL_DISKAUDIOFILE'] = disk_file
+        pygame.mixer.quit()
+        engine = AudioEngine(profile)
+        result = measure_latency(engine, args.trials)
+        frequency, _, channels = pygame.mixer.get_init()
+        pygame.mixer.quit()  # disk 드라이버 출력 파일 닫기
+
+        print(f"🔊 [{profile}] {frequency}Hz, 버퍼 {engine.settings['buffer']} ({result['buffer_ms']:.1f}ms): "
+              f"믹서 반영 {result['mix_delay_ms']:.1f}ms → 예상 출력 지연 평균 {result['latency_ms']:.1f}ms "
+              f"/ p95 {result['latency_p95_ms']:.1f}ms ({result['trials']}회)")
+        if disk_file:
+            disk = analyze_disk_output(disk_file, frequency, channels, result['events'])
+            jitter = "-" if disk['jitter_ms'] is None else f"{disk['jitter_ms']:.2f}ms"
+            print(f"   disk 출력: 클릭 {disk['rendered']}/{disk['expected']}개 기록, 간격 지터 {jitter}")
+            os.remove(disk_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+절차적 사운드 합성 + 디스크 PCM 캐시
+- coin 효과음 / 배경음악 / 테스트 멜로디를 샘플 단위 Python 루프 대신 NumPy 배열 연산으로 생성
+- 긴 음원은 CHUNK_SAMPLES 단위로 나눠 계산해서 임시 메모리 사용량을 일정하게 유지
+- 결과는 (렌더러 코드 + 파라미터) 해시 이름의 .npy로 캐시 → 다음 실행부터는 mmap으로 바로 로드
+- 출력 형식: (샘플 수, 2) int16 스테레오 (pygame.sndarray.make_sound와 같은 배열)
+
+    python audio_synth.py        # 전체 렌더링 시간 / 캐시 로드 시간 / 기존 루프 방식과 비교
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 22050
+CHUNK_SAMPLES = 1 << 16
+CACHE_DIR = "audio_cache"
+
+# 배경음악 코드 진행 (C - F - G - Am), 4초씩
+CHORD_PROGRESSION = np.array([
+    [261.63, 329.63, 392.00],  # C major
+    [349.23, 440.00, 523.25],  # F major
+    [392.00, 493.88, 587.33],  # G major
+    [220.00, 261.63, 329.63],  # A minor
+])
+
+# 렌더링/캐시 로드 시간 기록 (이름, 방식, ms)
+render_stats = []
+
+
+def to_stereo_pcm(wave_data, out=None):
+    """float 파형 → 정수로 자른(int() 방식) (N, 2) int16 스테레오"""
+    samples = np.trunc(wave_data).astype(np.int16)
+    if out is None:
+        out = np.empty((len(samples), 2), dtype=np.int16)
+    out[:, 0] = samples
+    out[:, 1] = samples
+    return out
+
+
+def render_chunked(fn, frames, sample_rate=SAMPLE_RATE):
+    """fn(t) (t: 초 단위 시간 배열)을 CHUNK_SAMPLES씩 계산해서 (frames, 2) int16으로 모음"""
+    out = np.empty((frames, 2), dtype=np.int16)
+    for start in range(0, frames, CHUNK_SAMPLES):
+        stop = min(frames, start + CHUNK_SAMPLES)
+        t = np.arange(start, stop, dtype=np.float64) / sample_rate
+        to_stereo_pcm(fn(t), out[start:stop])
+    return out
+
+
+def render_coin(sample_rate=SAMPLE_RATE, duration=0.4):
+    """coin-sfx 스타일 효과음 (높은 음에서 내려가는 금속성 소리)"""
+    frames = int(duration * sample_rate)
+
+    def coin(t):
+        frequency = 1200 * (1 - t * 0.7)  # 1200Hz에서 360Hz로 감소
+        phase = 2 * np.pi * frequency * t
+        wave_data = np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.3 * np.sin(3 * phase)
+        envelope = np.exp(-t * 8) * (1 - t * 0.5)
+        return np.clip(np.trunc(3000 * wave_data * envelope), -32767, 32767)
+
+    return render_chunked(coin, frames, sample_rate)
+
+
+def render_bgm(style="student", duration=60, tempo=120, sample_rate=SAMPLE_RATE):
+    """배경음악 (코드 진행 + 멜로디 + 리듬, 앞뒤 2초 페이드)
+
+    style: 'student' 밝고 경쾌한 멜로디, 'food' 부드럽고 재미있는 멜로디
+    """
+    frames = int(duration * sample_rate)
+    melody_ratios = (1.0, 1.5) if style == "student" else (0.75, 1.25)
+
+    def bgm(t):
+        chord = CHORD_PROGRESSION[(t // 4).astype(np.int64) % len(CHORD_PROGRESSION)]
+        melody_freq = chord[:, 0] * 2  # 옥타브 위
+        melody = (0.3 * np.sin(2 * np.pi * melody_freq * melody_ratios[0] * t) +
+                  0.2 * np.sin(2 * np.pi * melody_freq * melody_ratios[1] * t))
+        harmony = 0.15 * np.sin(2 * np.pi * chord * t[:, None]).sum(axis=1)
+
+        beat = (t * tempo / 60 * 4).astype(np.int64) % 4
+        rhythm = np.where(beat == 0,
+                          0.2 * np.sin(2 * np.pi * 80 * t) * np.exp(-(t % 1) * 5),
+                          0.1 * np.sin(2 * np.pi * 60 * t) * np.exp(-(t % 0.5) * 8))
+
+        final_wave = melody + harmony + rhythm
+        fade = np.ones_like(t)
+        fade_in = t < 2
+        fade_out = ~fade_in & (t > duration - 2)
+        fade[fade_in] = t[fade_in] / 2
+        fade[fade_out] = (duration - t[fade_out]) / 2
+        return np.clip(final_wave * fade * 0.5, -1.0, 1.0) * 32767
+
+    return render_chunked(bgm, frames, sample_rate)
+
+
+def render_test_melody(style="student", duration=10, sample_rate=SAMPLE_RATE):
+    """간단한 테스트 멜로디 (student: 도레미파솔, food: 펜타토닉)"""
+    frames = int(duration * sample_rate)
+    if style == "student":
+        base, step, rate, ratio, decay = 261.63, 1.2, 2, 1.5, 0.5
+    else:
+        base, step, rate, ratio, decay = 220, 1.5, 1.5, 0.75, 0.3
+
+    def melody(t):
+        freq = base * step ** np.floor(t * rate)
+        wave_data = 0.3 * np.sin(2 * np.pi * freq * t) + 0.2 * np.sin(2 * np.pi * freq * ratio * t)
+        wave_data *= np.exp(-(t % 2) * decay)
+        return np.clip(wave_data, -1, 1) * 16000
+
+    return render_chunked(melody, frames, sample_rate)
+
+
+def cache_key(name, renderer, params):
+    """렌더러 코드와 파라미터로 만든 캐시 해시 (코드나 파라미터가 바뀌면 새로 렌더링)"""
+    try:
+        source = inspect.getsource(renderer)
+    except (OSError, TypeError):
+        source = renderer.__qualname__
+    payload = json.dumps({'name': name, 'params': params, 'source': source}, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def write_wav(path, pcm, sample_rate=SAMPLE_RATE):
+    """(N, 2) int16 PCM을 WAV 파일로 저장"""
+    pcm = np.ascontiguousarray(pcm, dtype=np.int16)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(pcm.shape[1] if pcm.ndim > 1 else 1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+
+
+def cached_render(name, renderer, cache_dir=CACHE_DIR, wav=False, **params):
+    """캐시가 있으면 mmap으로 로드, 없으면 렌더링 후 .npy(+ wav=True면 .wav)로 저장
+
+    반환값은 읽기 전용 (N, 2) int16 배열 (np.memmap)
+    """
+    path = os.path.join(cache_dir, f"{name}_{cache_key(name, renderer, params)}.npy")
+    start = time.perf_counter()
+    if os.path.exists(path):
+        try:
+            pcm = np.load(path, mmap_mode="r")
+            render_stats.append((name, "cache", (time.perf_counter() - start) * 1000.0))
+            return pcm
+        except (OSError, ValueError):
+            pass  # 깨진 캐시는 다시 렌더링
+
+    pcm = renderer(**params)
+    render_stats.append((name, "render", (time.perf_counter() - start) * 1000.0))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, pcm)
+        os.replace(tmp_path, path)
+        if wav:
+            write_wav(path[:-4] + ".wav", pcm, params.get('sample_rate', SAMPLE_RATE))
+        return np.load(path, mmap_mode="r")
+    except OSError as e:
+        print(f"[!] 사운드 캐시 저장 실패 ({path}): {e}")
+        return pcm
+
+
+def _coin_loop(sample_rate=SAMPLE_RATE, duration=0.4):
+    """기존 방식 (샘플마다 math.sin) - 벤치마크 비교용"""
+    import math
+    arr = []
+    for i in range(int(duration * sample_rate)):
+        t = i / sample_rate
+        frequency = 1200 * (1 - t * 0.7)
+        wave1 = math.sin(2 * math.pi * frequency * t)
+        wave2 = 0.5 * math.sin(2 * math.pi * frequency * 2 * t)
+        wave3 = 0.3 * math.sin(2 * math.pi * frequency * 3 * t)
+        envelope = math.exp(-t * 8) * (1 - t * 0.5)
+        value = max(-32767, min(32767, int(3000 * (wave1 + wave2 + wave3) * envelope)))
+        arr.append([value, value])
+    return np.array(arr, dtype=np.int16)
+
+
+def benchmark(cache_dir=os.path.join(CACHE_DIR, "benchmark")):
+    """음원별 벡터 렌더링 / 캐시 로드 시간 (coin은 기존 루프와도 비교)"""
+    import shutil
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    jobs = [
+        ("coin", render_coin, {}),
+        ("bgm_student", render_bgm, {'style': "student"}),
+        ("bgm_food", render_bgm, {'style': "food"}),
+        ("test_student", render_test_melody, {'style': "student"}),
+        ("test_food", render_test_melody, {'style': "food"}),
+    ]
+    print(f"{'음원':<14} {'샘플 수':>9} {'렌더링(ms)':>11} {'캐시 로드(ms)':>13}")
+    for name, renderer, params in jobs:
+        render_stats.clear()
+        pcm = cached_render(name, renderer, cache_dir=cache_dir, **params)
+        cached_render(name, renderer, cache_dir=cache_dir, **params)
+        (_, _, render_ms), (_, _, load_ms) = render_stats
+        print(f"{name:<14} {len(pcm):>9} {render_ms:>11.1f} {load_ms:>13.2f}")
+
+    start = time.perf_counter()
+    legacy = _coin_loop()
+    loop_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    vectorized = render_coin()
+    vector_ms = (time.perf_counter() - start) * 1000.0
+    diff = int(np.abs(legacy.astype(np.int32) - vectorized).max())
+    print(f"\ncoin: 기존 루프 {loop_ms:.1f}ms → NumPy {vector_ms:.2f}ms (최대 오차 {diff})")
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    benchmark()
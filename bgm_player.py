@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+배경음악 스트리밍 플레이어
+- 미리 디코딩된 PCM(.npy 또는 16bit WAV)을 mmap으로 열고 고정 크기 청크로 나눠
+  예약된 믹서 채널에 Channel.queue()로 이어 붙여 재생 (무한 반복)
+- 한 번 연 음원은 계속 유지 → 게임 재시작 시 다시 디코딩하지 않고 바로 처음부터 재생
+- 메모리에는 재생 중인 청크 두세 개만 올라감 (음원 길이와 상관없이 일정)
+- MP3는 처음 한 번만 pygame으로 디코딩해서 audio_cache/에 WAV로 저장한 뒤 같은 방식으로 재생
+- 음원 샘플레이트/채널 수가 믹서와 다르면 청크 단위로 선형 보간 변환
+
+    player = get_player()
+    player.play(find_bgm("student-bgm.mp3", "student_bgm_data.npy"))
+    player.stop()
+"""
+
+import hashlib
+import os
+import struct
+import threading
+
+import numpy as np
+import pygame
+
+from audio_synth import CACHE_DIR, SAMPLE_RATE, write_wav
+from tracing import get_tracer
+
+BGM_CHANNEL = 0       # 배경음악 전용 채널 번호 (set_reserved로 효과음 자동 배정에서 제외)
+CHUNK_MS = 500        # 한 번에 큐에 넣는 길이
+DEFAULT_VOLUME = 0.3  # 효과음보다 작은 볼륨 (30%)
+
+
+class PcmSource:
+    """mmap으로 연 PCM 음원 (data: (프레임 수, 채널 수) int16)"""
+
+    def __init__(self, path, data, sample_rate):
+        self.path = path
+        self.data = data
+        self.sample_rate = sample_rate
+
+    def __len__(self):
+        return len(self.data)
+
+
+def find_bgm(*candidates):
+    """후보 중 처음으로 존재하는 음원 경로 (없으면 None)"""
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def open_wav_mmap(path):
+    """16bit PCM WAV의 data 청크를 mmap으로 열기 (RIFF 청크를 직접 찾아서 오프셋 계산)"""
+    with open(path, "rb") as f:
+        riff, _, form = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or form != b"WAVE":
+            raise ValueError(f"WAV 파일이 아닙니다: {path}")
+        channels = sample_rate = bits = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"data 청크가 없습니다: {path}")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt = f.read(size)
+                audio_format, channels, sample_rate = struct.unpack("<HHI", fmt[:8])
+                bits = struct.unpack("<H", fmt[14:16])[0]
+                if audio_format != 1 or bits != 16:
+                    raise ValueError(f"16bit PCM WAV만 지원합니다: {path}")
+                f.seek(size % 2, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if channels is None:
+                    raise ValueError(f"fmt 청크가 없습니다: {path}")
+                offset = f.tell()
+                frames = min(size, os.path.getsize(path) - offset) // (2 * channels)
+                data = np.memmap(path, dtype="<i2", mode="r", offset=offset, shape=(frames, channels))
+                return data, sample_rate
+            else:
+                f.seek(size + size % 2, os.SEEK_CUR)
+
+
+def decode_to_cache(path, cache_dir=CACHE_DIR):
+    """MP3 등 압축 음원을 한 번만 디코딩해서 WAV 캐시 경로 반환 (파일이 바뀌면 다시 디코딩)"""
+    stat = os.stat(path)
+    frequency, size, channels = pygame.mixer.get_init()
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{frequency}|{size}|{channels}"
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cached = os.path.join(cache_dir, f"{stem}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.wav")
+    if os.path.exists(cached):
+        return cached
+
+    samples = pygame.sndarray.array(pygame.mixer.Sound(path))
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    if samples.dtype == np.float32:
+        samples = np.clip(samples * 32767, -32768, 32767)
+    elif samples.dtype != np.int16:
+        raise ValueError(f"지원하지 않는 믹서 형식입니다: {samples.dtype}")
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cached}.{os.getpid()}.tmp"
+    write_wav(tmp_path, samples.astype(np.int16), frequency)
+    os.replace(tmp_path, cached)
+    return cached
+
+
+def open_pcm(path):
+    """음원을 PcmSource로 열기 (.npy는 audio_synth 샘플레이트로 간주)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 1:
+            data = data[:, None]
+        return PcmSource(path, data, SAMPLE_RATE)
+    if ext != ".wav":
+        path = decode_to_cache(path)
+    data, sample_rate = open_wav_mmap(path)
+    return PcmSource(path, data, sample_rate)
+
+
+class BgmPlayer:
+    def __init__(self, volume=DEFAULT_VOLUME, chunk_ms=CHUNK_MS, channel_index=BGM_CHANNEL):
+        self.volume = volume
+        self.chunk_ms = chunk_ms
+        self.channel_index = channel_index
+        self.tracer = get_tracer()
+        self.sources = {}    # 경로 → PcmSource (한 번 연 음원은 유지)
+        self.source = None
+        self.channel = None
+        self.mixer = None    # pygame.mixer.get_init() (샘플레이트, 샘플 크기, 채널 수)
+        self.position = 0    # 믹서 샘플레이트 기준 다음 청크 시작 프레임
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def load(self, path):
+        """음원 열기 (이미 열었으면 그대로 반환)"""
+        source = self.sources.get(path)
+        if source is None:
+            source = open_pcm(path)
+            self.sources[path] = source
+        return source
+
+    def play(self, path, volume=None):
+        """음원을 처음부터 무한 반복 재생 (실패하면 False)"""
+        if not path:
+            return False
+        try:
+            source = self.load(path)
+            mixer = pygame.mixer.get_init()
+            if mixer is None or len(source) == 0:
+                return False
+            self.stop()
+            if pygame.mixer.get_num_channels() <= self.channel_index:
+                pygame.mixer.set_num_channels(self.channel_index + 1)
+            pygame.mixer.set_reserved(self.channel_index + 1)
+            with self.lock:
+                self.source = source
+                self.mixer = mixer
+                self.position = 0
+                self.channel = pygame.mixer.Channel(self.channel_index)
+                self.channel.set_volume(self.volume if volume is None else volume)
+                self.channel.play(self._next_chunk())
+                self.channel.queue(self._next_chunk())
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="bgm-stream", daemon=True)
+            self.thread.start()
+            return True
+        except (pygame.error, OSError, ValueError) as e:
+            print(f"[!] 배경음악 재생 실패 ({path}): {e}")
+            return False
+
+    def stop(self):
+        """재생 정지 (열어 둔 음원은 유지)"""
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        with self.lock:
+            if self.channel is not None:
+                try:
+                    self.channel.stop()
+                except pygame.error:
+                    pass  # 믹서가 이미 종료됨
+                self.channel = None
+
+    def is_playing(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def close(self):
+        self.stop()
+        self.sources.clear()
+        self.source = None
+
+    def _run(self):
+        """큐가 비면 다음 청크를 넣어서 끊김 없이 이어 재생"""
+        interval = self.chunk_ms / 4000.0
+        while not self.stop_event.wait(interval):
+            try:
+                with self.lock:
+                    if self.channel is None:
+                        return
+                    if self.channel.get_queue() is None:
+                        with self.tracer.span("bgm.chunk"):
+                            chunk = self._next_chunk()
+                        if not self.channel.get_busy():
+                            self.channel.play(chunk)  # 밀려서 끊긴 경우 바로 다시 시작
+                        else:
+                            self.channel.queue(chunk)
+            except (pygame.error, ValueError):
+                return  # pygame.mixer.quit() 이후 / 믹서가 다른 형식으로 다시 초기화됨
+
+    def _next_chunk(self):
+        """현재 위치에서 chunk_ms 길이만큼 믹서 형식의 Sound 생성 (끝에 닿으면 처음으로 이어짐)"""
+        frequency, size, channels = self.mixer
+        source = self.source
+        total = len(source) * frequency // source.sample_rate  # 믹서 샘플레이트 기준 전체 길이
+        frames = max(1, frequency * self.chunk_ms // 1000)
+        index = np.arange(self.position, self.position + frames) % total
+        self.position = int((self.position + frames) % total)
+
+        if source.sample_rate == frequency:
+            if index[0] < index[-1]:
+                pcm = np.asarray(source.data[index[0]:index[-1] + 1], dtype=np.float32)
+            else:
+                pcm = np.asarray(source.data[index], dtype=np.float32)
+        else:
+            src = index * (source.sample_rate / frequency)
+            i0 = src.astype(np.int64)
+            i1 = np.minimum(i0 + 1, len(source) - 1)
+            frac = (src - i0)[:, None].astype(np.float32)
+            lo = np.asarray(source.data[i0], dtype=np.float32)
+            hi = np.asarray(source.data[i1], dtype=np.float32)
+            pcm = lo + (hi - lo) * frac
+
+        if pcm.shape[1] != channels:
+            mono = pcm.mean(axis=1, keepdims=True)
+            pcm = np.repeat(mono, channels, axis=1)
+        return pygame.sndarray.make_sound(to_mixer_dtype(pcm, size, channels))
+
+
+def to_mixer_dtype(pcm, size, channels):
+    """int16 범위 float 배열 → 믹서 샘플 형식 (16bit 정수 / 32bit float 믹서만 지원)"""
+    if size == 32:
+        out = (pcm / 32768.0).astype(np.float32)
+    elif size == -16:
+        out = np.clip(np.rint(pcm), -32768, 32767).astype(np.int16)
+    else:
+        raise ValueError(f"지원하지 않는 믹서 샘플 크기입니다: {size}")
+    return np.ascontiguousarray(out[:, 0] if channels == 1 else out)
+
+
+_player = None
+
+
+def get_player():
+    """프로세스 공용 플레이어 (호스트에서 게임을 바꿔도 열어 둔 음원 유지)"""
+    global _player
+    if _player is None:
+        _player = BgmPlayer()
+    return _player
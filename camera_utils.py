@@ -12,6 +12,8 @@ import subprocess
 import time
 import platform
 
+from tracing import get_tracer
+
 class CameraManager:
     def __init__(self):
         self.camera = None
@@ -20,6 +22,7 @@ class CameraManager:
         self.height = 480
         self.fps = 30
         self.is_mac = platform.system() == "Darwin"
+        self.tracer = get_tracer()  # TRACE=1이면 초기화/프레임 읽기를 타임라인에 기록
         
         # 라즈베리파이 특화 초기화
         if not self.is_mac:
@@ -478,6 +481,10 @@ class CameraManager:
         
     def initialize_camera(self):
         """최적의 카메라 초기화"""
+        with self.tracer.span("camera.init"):
+            return self._initialize_camera()
+        
+    def _initialize_camera(self):
         print(f"📷 카메라 초기화 중...")
         
         # 맥에서는 간단한 순서로 시도
@@ -553,7 +560,8 @@ class CameraManager:
         if self.camera is None:
             return False, None
             
-        ret, frame = self.camera.read()
+        with self.tracer.span("camera.read"):
+            ret, frame = self.camera.read()
         return ret, frame
         
     def release(self):
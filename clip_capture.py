@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+녹화 영상 카메라 (벤치마크 / 재현용)
+- 영상 파일을 cv2.VideoCapture와 같은 방식(read/isOpened/release/get/set)으로 읽어서 카메라 대신 사용
+- 게임에서 CAMERA_CLIP=영상 경로 로 설정하면 카메라를 열지 않고 영상을 읽음
+- 영상이 끝나면 read()가 (False, None)을 돌려주고 finished=True → 게임은 ESC와 같이 종료
+- 실제 카메라처럼 기다리지 않고 디코딩되는 대로 바로 프레임을 내줌 (최대 속도)
+
+    CAMERA_CLIP=clips/hands.mp4 python food_eating_game.py
+    CAMERA_CLIP_LOOPS=3         영상 반복 횟수 (짧은 영상으로 길게 측정)
+    CAMERA_CLIP_FRAMES=600      최대 프레임 수
+    CAMERA_CLIP_PRELOAD=1       시작 전에 전체 프레임을 메모리에 디코딩 (capture 단계에서 디코딩 시간 제외)
+"""
+
+import os
+
+import cv2
+
+CLIP_ENV = "CAMERA_CLIP"
+
+
+def clip_path():
+    """CAMERA_CLIP으로 지정한 영상 경로 (없으면 None)"""
+    return os.environ.get(CLIP_ENV) or None
+
+
+class ClipCapture:
+    def __init__(self, path, loops=1, max_frames=None, preload=False):
+        self.path = path
+        self.loops = max(1, loops)
+        self.max_frames = max_frames
+        self.loop = 0
+        self.frames_read = 0
+        self.finished = False
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.frames = None
+        if preload and self.cap.isOpened():
+            self.frames = []
+            while True:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                self.frames.append(frame)
+            self.cap.release()
+            self.cap = None
+
+    def isOpened(self):
+        if self.frames is not None:
+            return bool(self.frames)
+        return self.cap is not None and self.cap.isOpened()
+
+    def read(self):
+        if self.finished or (self.max_frames is not None and self.frames_read >= self.max_frames):
+            self.finished = True
+            return False, None
+        frame = self._next_frame()
+        if frame is None:
+            self.finished = True
+            return False, None
+        self.frames_read += 1
+        return True, frame
+
+    def _next_frame(self):
+        while True:
+            if self.frames is not None:
+                index = self.frames_read - self.loop * len(self.frames)
+                if index < len(self.frames):
+                    # 게임이 프레임에 바로 그리므로 원본은 두고 복사본을 넘김 (카메라도 매번 새 배열)
+                    return self.frames[index].copy()
+            elif self.cap is not None:
+                ret, frame = self.cap.read()
+                if ret:
+                    return frame
+            self.loop += 1
+            if self.loop >= self.loops:
+                return None
+            if self.frames is None:
+                # 되감기(CAP_PROP_POS_FRAMES)는 코덱에 따라 부정확해서 다시 열기
+                self.cap.release()
+                self.cap = cv2.VideoCapture(self.path)
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.height
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.frames_read
+        return 0.0
+
+    def set(self, prop, value):
+        return False  # 해상도/FPS는 영상 그대로
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        self.frames = None
+
+
+def open_clip(path=None):
+    """녹화 영상 열기 (환경변수 설정 반영), 실패하면 None"""
+    path = path or clip_path()
+    max_frames = os.environ.get('CAMERA_CLIP_FRAMES')
+    cap = ClipCapture(path,
+                      loops=int(os.environ.get('CAMERA_CLIP_LOOPS', 1)),
+                      max_frames=int(max_frames) if max_frames else None,
+                      preload=os.environ.get('CAMERA_CLIP_PRELOAD') == '1')
+    if not cap.isOpened():
+        print(f"❌ 녹화 영상을 열 수 없습니다: {path}")
+        cap.release()
+        return None
+    print(f"🎞️ 녹화 영상 사용: {path} ({cap.width}x{cap.height}, {cap.fps:.0f}fps)")
+    return cap
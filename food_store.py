@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+음식 엔티티 저장소 (배열 기반)
+- 위치/속도/크기/종류를 NumPy 열(column)로 보관
+- 이동, 화면 밖 제거, 커비식 빨아들이기, 먹기 판정을 각각 한 번의 벡터 연산으로 처리
+- 그리기는 Surface.blits() 한 번으로 처리
+"""
+
+import numpy as np
+import pygame
+
+FOOD_SCALE = 5.0  # 원본 이미지를 5배 크게
+
+_food_images = {}
+
+
+def load_food_image(food_type):
+    """food/snack{n}.png를 5배 스케일로 한 번만 로드해 캐시"""
+    image = _food_images.get(food_type)
+    if image is None:
+        original_image = pygame.image.load(f"food/snack{food_type}.png")
+        original_width, original_height = original_image.get_size()
+
+        # 원본 비율을 유지하면서 5배 크게 스케일링
+        new_width = int(original_width * FOOD_SCALE)
+        new_height = int(original_height * FOOD_SCALE)
+        image = pygame.transform.scale(original_image, (new_width, new_height))
+        _food_images[food_type] = image
+    return image
+
+
+class FoodStore:
+    COLUMN_NAMES = ('x', 'y', 'prev_x', 'prev_y', 'speed', 'width', 'height', 'food_type')
+
+    def __init__(self, screen_width, screen_height, capacity=64):
+        """화면 크기와 초기 용량 설정 (용량이 부족하면 두 배로 늘림)"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_x = np.zeros(capacity, dtype=np.float64)  # 이전 스텝 위치 (렌더링 보간용)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.food_type = np.zeros(capacity, dtype=np.int32)
+
+    def columns(self):
+        """모든 열 배열 (압축/확장 시 함께 처리)"""
+        return tuple(getattr(self, name) for name in self.COLUMN_NAMES)
+
+    def __len__(self):
+        return self.count
+
+    def grow(self):
+        """용량을 두 배로 확장"""
+        capacity = len(self.x) * 2
+        for name in self.COLUMN_NAMES:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y, food_type, speed):
+        """음식 하나 추가"""
+        if self.count == len(self.x):
+            self.grow()
+
+        image = load_food_image(food_type)
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.speed[i] = speed
+        self.width[i], self.height[i] = image.get_size()
+        self.food_type[i] = food_type
+        self.count += 1
+
+    def keep_only(self, mask):
+        """mask가 True인 음식만 남기고 앞쪽으로 모음"""
+        keep = np.flatnonzero(mask)
+        k = len(keep)
+        for column in self.columns():
+            column[:k] = column[keep]
+        self.count = k
+
+    def update(self):
+        """전체 음식 이동 + 화면 밖 음식 제거 (고정 스텝 1회)"""
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        speed = self.speed[:n]
+
+        # 위치에 따른 다양한 움직임 (왼쪽/오른쪽 밖에서는 대각선, 화면 안에서는 아래로)
+        from_left = x < 0
+        from_right = ~from_left & (x > self.screen_width - self.width[:n])
+        from_top = ~(from_left | from_right)
+
+        x += np.where(from_left, speed, np.where(from_right, -speed, 0.0))
+        y += np.where(from_top, speed, speed * 0.5)
+
+        # 화면을 벗어난 음식 제거 (5배 큰 크기와 작은 화면 고려)
+        off_screen = (y > self.screen_height) | (x < -300) | (x > self.screen_width + 200)
+        if off_screen.any():
+            self.keep_only(~off_screen)
+
+    def attract_and_eat(self, mouth_x, mouth_y, attraction_radius=300, eat_radius=50,
+                        attraction_strength=300):
+        """입 쪽으로 빨아들이고 먹은 음식 수 반환"""
+        n = self.count
+        if n == 0:
+            return 0
+
+        x = self.x[:n]
+        y = self.y[:n]
+
+        # 음식 중심점과 입까지의 거리 (5배 큰 크기 고려)
+        dx = mouth_x - (x + self.width[:n] // 2)
+        dy = mouth_y - (y + self.height[:n] // 2)
+        distance = np.hypot(dx, dy)
+
+        # 커비처럼 강력하게 빨아들이는 효과 (거리에 따른 힘을 제곱으로 더 강하게)
+        pulled = (distance < attraction_radius) & (distance > 0)
+        if pulled.any():
+            d = distance[pulled]
+            force_multiplier = (attraction_radius - d) / attraction_radius
+            attraction_force = attraction_strength * force_multiplier * force_multiplier
+            x[pulled] += dx[pulled] / d * attraction_force
+            y[pulled] += dy[pulled] / d * attraction_force
+
+        # 실제로 먹기 (이동 전 거리 기준)
+        eaten = distance < eat_radius
+        eaten_count = int(eaten.sum())
+        if eaten_count:
+            self.keep_only(~eaten)
+        return eaten_count
+
+    def draw(self, screen, alpha=1.0):
+        """모든 음식을 한 번의 blits 호출로 그림 (alpha로 이전/현재 위치 보간)"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        screen.blits(
+            [(load_food_image(food_type), (fx, fy))
+             for fx, fy, food_type in zip(x.tolist(), y.tolist(), self.food_type[:n].tolist())],
+            doreturn=False
+        )
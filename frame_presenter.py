@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+OpenCV 화면 출력 전용 스레드 (프레젠터)
+- 게임 루프는 완성된 프레임을 더블 버퍼에 복사만 하고 바로 다음 프레임 처리
+- imshow / waitKey(HighGUI 이벤트 처리, WINDOW_NORMAL 창 스케일링)는 프레젠터 스레드에서 실행
+- 출력이 밀리면 오래된 프레임은 버리고 항상 최신 프레임만 표시
+- 키 입력은 큐로 게임 루프에 전달 (poll_key는 waitKey처럼 입력이 없으면 -1)
+- macOS는 GUI를 메인 스레드에서만 다룰 수 있어서 동기 방식으로 동작 (PRESENTER_THREAD=0으로 강제 가능)
+- PRESENTER_HEADLESS=1이면 창 없이 프레임 수만 셈 (벤치마크용, 키 입력 없음)
+"""
+
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from tracing import get_tracer
+
+
+def threaded_present_supported():
+    """별도 스레드에서 HighGUI를 써도 되는 환경인지 확인"""
+    if os.environ.get('PRESENTER_THREAD', '1') == '0':
+        return False
+    return sys.platform != 'darwin'
+
+
+class FramePresenter:
+    def __init__(self, window_name, size=None, position=None, threaded=None, stats_window=120, headless=None):
+        """window_name: 창 이름, size: (너비, 높이), position: (x, y), threaded/headless: None이면 자동 판단"""
+        self.window_name = window_name
+        self.size = size
+        self.position = position
+        self.headless = os.environ.get('PRESENTER_HEADLESS') == '1' if headless is None else headless
+        if self.headless:
+            threaded = False
+        self.threaded = threaded_present_supported() if threaded is None else threaded
+
+        # 더블 버퍼: 게임 루프는 표시 중이 아닌 버퍼에 쓰고, 프레젠터는 대기 중인 버퍼를 가져감
+        self.buffers = [None, None]
+        self.pending = None      # 표시 대기 중인 버퍼 번호
+        self.displaying = None   # 프레젠터가 imshow 중인 버퍼 번호
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.keys = queue.Queue()
+        self.tracer = get_tracer()
+
+        # 통계
+        self.submitted = 0
+        self.presented = 0
+        self.dropped = 0
+        self.submit_times = collections.deque(maxlen=stats_window)
+        self.present_times = collections.deque(maxlen=stats_window)
+        self.present_stamps = collections.deque(maxlen=stats_window)
+
+    def create_window(self):
+        """창 생성 (imshow와 같은 스레드에서 호출해야 함)"""
+        if self.headless:
+            return
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        if self.size:
+            cv2.resizeWindow(self.window_name, *self.size)
+        if self.position:
+            cv2.moveWindow(self.window_name, *self.position)
+
+    def start(self):
+        """창을 만들고 (스레드 모드면) 프레젠터 스레드 시작"""
+        if not self.threaded:
+            self.create_window()
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="frame-presenter", daemon=True)
+        self.thread.start()
+
+    def present(self, frame):
+        """완성된 프레임 넘기기 (스레드 모드에서는 복사만 하고 바로 반환)"""
+        start = time.perf_counter()
+        self.submitted += 1
+
+        if not self.threaded:
+            self._show(frame)
+            self.submit_times.append(time.perf_counter() - start)
+            return
+
+        with self.lock:
+            if self.pending is not None:
+                # 프레젠터가 아직 가져가지 않은 프레임은 버림 (최신 프레임 우선)
+                self.dropped += 1
+                self.pending = None
+                self.tracer.counter("presenter.dropped", self.dropped)
+            index = 1 if self.displaying == 0 else 0
+
+        buffer = self.buffers[index]
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty_like(frame)
+            self.buffers[index] = buffer
+        np.copyto(buffer, frame)
+
+        with self.lock:
+            self.pending = index
+        self.frame_ready.set()
+        self.submit_times.append(time.perf_counter() - start)
+
+    def poll_key(self):
+        """입력된 키 하나 반환 (cv2.waitKey(1) & 0xFF와 같은 값, 없으면 -1)"""
+        if not self.threaded:
+            self._pump_keys()
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return -1
+
+    def _pump_keys(self):
+        """HighGUI 이벤트 처리 후 눌린 키를 큐에 넣기"""
+        if self.headless:
+            return
+        with self.tracer.span("present.waitKey"):
+            key = cv2.waitKey(1)
+        if key != -1 and key & 0xFF != 0xFF:
+            self.keys.put(key & 0xFF)
+
+    def _show(self, frame):
+        start = time.perf_counter()
+        if not self.headless:
+            cv2.imshow(self.window_name, frame)
+        now = time.perf_counter()
+        self.tracer.complete("present.imshow", start, now - start)
+        with self.lock:
+            self.present_times.append(now - start)
+            self.present_stamps.append(now)
+            self.presented += 1
+
+    def _run(self):
+        """프레젠터 스레드: 새 프레임이 오면 표시, 없어도 키 입력/창 이벤트는 계속 처리"""
+        try:
+            self.create_window()
+            while not self.stop_event.is_set():
+                self.frame_ready.wait(0.01)
+                self.frame_ready.clear()
+
+                with self.lock:
+                    index = self.pending
+                    self.pending = None
+                    self.displaying = index
+
+                if index is not None:
+                    # imshow는 이미지를 창 내부 버퍼로 복사하므로 반환 후 바로 버퍼 반납
+                    self._show(self.buffers[index])
+                    with self.lock:
+                        self.displaying = None
+
+                self._pump_keys()
+        except Exception as e:
+            print(f"[X] 화면 출력 스레드 오류: {e}")
+            self.keys.put(27)  # 게임 루프도 종료되도록 ESC 전달
+        finally:
+            self._destroy_window()
+
+    def _destroy_window(self):
+        if self.headless:
+            return
+        try:
+            cv2.destroyWindow(self.window_name)
+        except cv2.error:
+            pass
+
+    def get_stats(self):
+        """출력 통계 (시간 단위: ms)"""
+        def summary(samples):
+            if not samples:
+                return 0.0, 0.0
+            values = np.array(samples) * 1000.0
+            return float(values.mean()), float(np.percentile(values, 95))
+
+        with self.lock:
+            present_times = list(self.present_times)
+            stamps = list(self.present_stamps)
+            presented = self.presented
+        submit_avg, submit_p95 = summary(self.submit_times)
+        present_avg, present_p95 = summary(present_times)
+        fps = (len(stamps) - 1) / (stamps[-1] - stamps[0]) if len(stamps) > 1 and stamps[-1] > stamps[0] else 0.0
+        return {
+            'threaded': self.threaded,
+            'headless': self.headless,
+            'submitted': self.submitted,
+            'presented': presented,
+            'dropped': self.dropped,
+            'submit_ms': submit_avg,
+            'submit_p95_ms': submit_p95,
+            'present_ms': present_avg,
+            'present_p95_ms': present_p95,
+            'present_fps': fps,
+        }
+
+    def close(self):
+        """프레젠터 스레드 정지 및 창 닫기"""
+        if self.thread is not None:
+            self.stop_event.set()
+            self.frame_ready.set()
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        else:
+            self._destroy_window()
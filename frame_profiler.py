@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+프레임 단계별 시간 측정 + 화면 HUD
+- 게임 루프에서 단계 시간 기록: 순서대로 진행되는 단계는 start_frame() 후 단계가 끝날 때마다 lap("hands"),
+  함수 안 등 떨어진 구간은 with profiler.stage("hands"): ..., 프레임 끝에 end_frame()
+- 단계별 최근 window 프레임 평균 / p95, FPS 그래프, 추론(count) 초당 횟수를 HUD로 표시
+- 꺼져 있으면 stage()가 미리 만든 빈 컨텍스트를 돌려줄 뿐이라 비용이 거의 없음
+- HUD 패널은 초당 HUD_REFRESH번만 다시 그리고 매 프레임은 복사만 함
+  (OpenCV 프레임: draw_opencv, pygame 화면: draw_pygame)
+- TRACE=1이면 단계/프레임 시간을 tracing 타임라인에도 구간으로 기록
+
+    FRAME_HUD=1     시작부터 HUD 표시 (게임 중 토글: 음식 게임 F3, 캐릭터 게임 P)
+    FRAME_PROFILE=1 HUD 없이 측정만 (벤치마크용)
+
+벤치마크 (pipeline_benchmark.py가 게임 프로세스에 설정):
+    FRAME_PROFILE_WINDOW=N  통계에 쓸 최근 프레임 수 (기본 120)
+    FRAME_PROFILE_WARMUP=N  처음 N 프레임은 버리고 측정 (모델 첫 추론 등)
+    FRAME_PROFILE_ALLOC=1   tracemalloc으로 프레임별 최대 메모리 할당량 기록 (느려지므로 별도 실행)
+    FRAME_PROFILE_OUT=경로  종료 시 get_report() 결과를 JSON으로 저장
+"""
+
+import atexit
+import collections
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from tracing import get_tracer
+
+HUD_REFRESH = 4.0          # HUD 패널 갱신 횟수 (초당)
+PANEL_WIDTH = 250
+LINE_HEIGHT = 15
+GRAPH_HEIGHT = 40
+
+
+class _NullStage:
+    """측정이 꺼져 있을 때 쓰는 빈 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.profiler.add(self.name, end - self.start, end)
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, enabled=None, show=None, window=120):
+        """enabled: 측정 여부, show: HUD 표시 여부 (None이면 환경변수로 결정)"""
+        self.show = os.environ.get('FRAME_HUD') == '1' if show is None else show
+        self.always_collect = os.environ.get('FRAME_PROFILE') == '1' if enabled is None else enabled
+        self.tracer = get_tracer()
+        self.enabled = self.always_collect or self.show or self.tracer.enabled
+        self.window = window
+        self.stages = {}          # 단계 이름 → 최근 프레임별 시간(ms) (처음 나온 순서 유지)
+        self.frame = {}           # 이번 프레임 단계별 누적 시간(초)
+        self.frame_times = collections.deque(maxlen=window)
+        self.events = {}          # count() 이름 → 최근 발생 시각
+        self.frames = 0
+        self.last_frame = None
+        self.lap_time = None      # 마지막 lap() 시각
+        self.panel = None         # HUD 패널 (BGR)
+        self.panel_time = 0.0
+        self.surface = None       # draw_pygame용 패널 Surface
+        self.warmup = 0           # 남은 워밍업 프레임 (끝나면 reset)
+        self.first_frame = None   # 측정 시작 후 첫 end_frame() 시각 (처리량 계산용)
+        self.track_alloc = False
+        self.allocs = collections.deque(maxlen=window)  # 프레임별 최대 할당량(KB)
+        self.alloc_base = 0
+
+    def stage(self, name):
+        """단계 시간 측정 컨텍스트 (꺼져 있으면 아무것도 안 함)"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def start_frame(self):
+        """프레임 시작 (이후 lap()은 이 시점부터 잼)"""
+        if self.enabled:
+            self.lap_time = time.perf_counter()
+
+    def lap(self, name):
+        """직전 lap()/start_frame() 이후 시간을 name 단계에 기록"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.lap_time is not None:
+            self.add(name, now - self.lap_time, now)
+        self.lap_time = now
+
+    def add(self, name, seconds, end=None):
+        """단계 시간 직접 추가 (같은 프레임에서 여러 번 호출되면 합산, end를 주면 타임라인에도 기록)"""
+        self.frame[name] = self.frame.get(name, 0.0) + seconds
+        if end is not None:
+            self.tracer.complete(name, end - seconds, seconds)
+
+    def count(self, name):
+        """추론 등 이벤트 발생 기록 (초당 횟수 표시용)"""
+        if self.enabled:
+            events = self.events.get(name)
+            if events is None:
+                events = self.events[name] = collections.deque(maxlen=self.window)
+            events.append(time.perf_counter())
+
+    def end_frame(self):
+        """프레임 끝: 단계별 시간을 기록하고 다음 프레임 준비"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) * 1000.0)
+            self.tracer.complete("frame", self.last_frame, now - self.last_frame)
+        else:
+            self.first_frame = now
+        self.last_frame = now
+        self.frames += 1
+        if self.track_alloc:
+            # 지난 end_frame() 이후 최대 사용량 - 그때 사용량 = 이번 프레임에 잠깐이라도 잡힌 메모리
+            current, peak = tracemalloc.get_traced_memory()
+            self.allocs.append((peak - self.alloc_base) / 1024.0)
+            tracemalloc.reset_peak()
+            self.alloc_base = current
+
+        for name in self.frame:
+            if name not in self.stages:
+                self.stages[name] = collections.deque(maxlen=self.window)
+        for name, samples in self.stages.items():
+            samples.append(self.frame.get(name, 0.0) * 1000.0)
+        self.frame.clear()
+        self.lap_time = None
+
+        if self.warmup and self.frames >= self.warmup:
+            self.warmup = 0
+            self.reset()
+            self.last_frame = self.first_frame = now
+
+    def toggle(self):
+        """HUD 표시 켜기/끄기 (끄면 측정도 멈춤, FRAME_PROFILE=1 / TRACE=1이면 측정은 계속)"""
+        self.show = not self.show
+        self.enabled = self.always_collect or self.show or self.tracer.enabled
+        self.last_frame = None
+        self.panel = self.surface = None
+        return self.show
+
+    def reset(self):
+        self.stages.clear()
+        self.frame.clear()
+        self.frame_times.clear()
+        self.events.clear()
+        self.allocs.clear()
+        self.frames = 0
+        self.last_frame = self.first_frame = None
+
+    def get_stats(self):
+        """단계별 평균/p50/p95/p99(ms), FPS, 이벤트 초당 횟수"""
+        stages = {}
+        for name, samples in self.stages.items():
+            if samples:
+                stages[name] = summarize(samples)
+        frame_ms = float(np.mean(self.frame_times)) if self.frame_times else 0.0
+        rates = {}
+        for name, events in self.events.items():
+            if len(events) > 1 and events[-1] > events[0]:
+                rates[name] = (len(events) - 1) / (events[-1] - events[0])
+        return {
+            'frames': self.frames,
+            'fps': 1000.0 / frame_ms if frame_ms > 0 else 0.0,
+            'frame_ms': frame_ms,
+            'stages': stages,
+            'rates': rates,
+        }
+
+    def get_report(self):
+        """벤치마크 보고서: get_stats() + 전체 처리량, 프레임 시간 분포, 최대 RSS, 프레임별 할당량"""
+        report = self.get_stats()
+        elapsed = self.last_frame - self.first_frame if self.first_frame is not None else 0.0
+        report['throughput_fps'] = (self.frames - 1) / elapsed if elapsed > 0 else 0.0
+        report['frame'] = summarize(self.frame_times) if self.frame_times else None
+        report['peak_rss_mb'] = peak_rss_mb()
+        report['alloc_kb'] = None
+        if self.allocs:
+            values = np.fromiter(self.allocs, dtype=np.float64)
+            report['alloc_kb'] = {'avg': float(values.mean()), 'p95': float(np.percentile(values, 95)),
+                                  'max': float(values.max())}
+        return report
+
+    def write_report(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f)
+
+    # ------------------------------------------------------------------
+    # HUD
+    # ------------------------------------------------------------------
+
+    def render_panel(self):
+        """HUD 패널 (BGR 배열) - HUD_REFRESH 주기로만 다시 그림"""
+        now = time.perf_counter()
+        if self.panel is not None and now - self.panel_time < 1.0 / HUD_REFRESH:
+            return self.panel
+        self.panel_time = now
+
+        stats = self.get_stats()
+        lines = [f"FPS {stats['fps']:5.1f}  frame {stats['frame_ms']:5.1f}ms"]
+        lines += [f"{name:<11}{s['avg_ms']:6.2f} p95 {s['p95_ms']:6.2f}" for name, s in stats['stages'].items()]
+        if stats['rates']:
+            lines.append("  ".join(f"{name} {rate:.0f}/s" for name, rate in stats['rates'].items()))
+
+        height = LINE_HEIGHT * len(lines) + GRAPH_HEIGHT + 12
+        panel = np.zeros((height, PANEL_WIDTH, 3), dtype=np.uint8)
+        for i, line in enumerate(lines):
+            cv2.putText(panel, line, (5, LINE_HEIGHT * (i + 1)), cv2.FONT_HERSHEY_PLAIN, 0.9,
+                        (255, 255, 255), 1, cv2.LINE_AA)
+
+        # 프레임 시간 그래프 (가로선: 16.7ms = 60FPS, 33.3ms = 30FPS)
+        top = height - GRAPH_HEIGHT - 4
+        scale = GRAPH_HEIGHT / 50.0
+        for ms, color in ((16.7, (0, 160, 0)), (33.3, (0, 160, 200))):
+            y = int(top + GRAPH_HEIGHT - ms * scale)
+            cv2.line(panel, (5, y), (PANEL_WIDTH - 5, y), color, 1)
+        if len(self.frame_times) > 1:
+            values = np.minimum(np.fromiter(self.frame_times, dtype=np.float64), 50.0)
+            xs = np.linspace(5, PANEL_WIDTH - 5, len(values))
+            ys = top + GRAPH_HEIGHT - values * scale
+            points = np.stack([xs, ys], axis=1).astype(np.int32)
+            cv2.polylines(panel, [points], False, (255, 255, 255), 1)
+
+        self.panel = panel
+        return panel
+
+    def draw_opencv(self, frame, position=(10, 10), alpha=0.75):
+        """OpenCV(BGR) 프레임에 HUD 그리기"""
+        if not self.show:
+            return
+        panel = self.render_panel()
+        x, y = position
+        h = min(panel.shape[0], frame.shape[0] - y)
+        w = min(panel.shape[1], frame.shape[1] - x)
+        if h <= 0 or w <= 0:
+            return
+        roi = frame[y:y + h, x:x + w]
+        cv2.addWeighted(panel[:h, :w], alpha, roi, 1 - alpha, 0, dst=roi)
+
+    def draw_pygame(self, surface, position=(10, 10), alpha=190):
+        """pygame 화면에 HUD 그리기"""
+        if not self.show:
+            return
+        import pygame
+
+        previous = self.panel
+        panel = self.render_panel()
+        if panel is not previous or self.surface is None:
+            rgb = np.ascontiguousarray(panel[:, :, ::-1])
+            self.surface = pygame.image.frombuffer(rgb.tobytes(), (rgb.shape[1], rgb.shape[0]), 'RGB')
+            self.surface.set_alpha(alpha)
+        surface.blit(self.surface, position)
+
+
+def summarize(samples):
+    """프레임별 시간(ms) → 평균 / p50 / p95 / p99"""
+    values = np.fromiter(samples, dtype=np.float64)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'avg_ms': float(values.mean()), 'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99)}
+
+
+def peak_rss_mb():
+    """프로세스 최대 메모리 사용량 (MB, resource 모듈이 없는 Windows에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+_profiler = None
+
+
+def get_profiler():
+    """프로세스 공용 프로파일러 (벤치마크에서 게임 실행 후 결과를 읽을 수 있음)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = FrameProfiler(window=int(os.environ.get('FRAME_PROFILE_WINDOW', 120)))
+        _profiler.warmup = int(os.environ.get('FRAME_PROFILE_WARMUP', 0))
+        if os.environ.get('FRAME_PROFILE_ALLOC') == '1':
+            tracemalloc.start()
+            _profiler.track_alloc = True
+        out = os.environ.get('FRAME_PROFILE_OUT')
+        if out:
+            atexit.register(_profiler.write_report, out)
+    return _profiler
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+게임 호스트 (게임 전환 시 모델/카메라를 유지하는 단일 프로세스)
+- cv2 / mediapipe import, MediaPipe 그래프 생성, 카메라 열기를 프로세스당 한 번만 수행
+- 런처의 효과음 대기(600ms) 동안 백그라운드 스레드에서 카메라를 열고 더미 프레임으로 모델 워밍업
+  (게임 모듈 import는 pygame 화면을 건드릴 수 있어서 메인 스레드에서 수행)
+- 게임은 같은 프로세스 안에서 플러그인처럼 실행 (main()이 끝나면 런처 화면으로 복귀)
+- 게임 쪽은 active_host()로 호스트 실행 여부를 확인하고 공유 모델/카메라를 사용
+
+게임 모듈 규칙:
+    main()           게임 실행 (호스트에서 실행 중이면 pygame.quit() / 로깅 종료 안 함)
+    warm_up(host)    (선택) 필요한 모델을 host에서 받아 더미 프레임으로 한 번 실행
+"""
+
+import importlib
+import os
+import threading
+import time
+
+from game_log import get_logger
+
+log = get_logger("host")
+
+# 런처 버튼의 스크립트 이름 → 게임 모듈 이름
+GAMES = {
+    "student_moving_game.py": "student_moving_game",
+    "food_eating_game.py": "food_eating_game",
+}
+
+_active_host = None
+
+
+def active_host():
+    """현재 게임을 실행 중인 GameHost (단독 실행이면 None)"""
+    return _active_host
+
+
+class SharedCamera:
+    """게임이 release()해도 실제로 닫지 않는 카메라 래퍼 (호스트 종료 시 닫음)"""
+
+    def __init__(self, cap):
+        self.cap = cap
+
+    def __getattr__(self, name):
+        return getattr(self.cap, name)
+
+    def release(self):
+        pass
+
+
+class GameHost:
+    def __init__(self):
+        self.cameras = {}   # 카메라 인덱스 → cv2.VideoCapture
+        self.models = {}    # (종류, 옵션) → MediaPipe 솔루션 객체
+        self.modules = {}   # 스크립트 이름 → 게임 모듈
+        self.warmed = set()
+        self.lock = threading.RLock()
+        self.warm_thread = None
+        self.timings = {}   # 단계별 소요 시간 (ms)
+
+    def _timed(self, name, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.timings[name] = (time.perf_counter() - start) * 1000.0
+        return result
+
+    def _get_model(self, kind, factory, options):
+        key = (kind, tuple(sorted(options.items())))
+        with self.lock:
+            model = self.models.get(key)
+            if model is None:
+                model = self._timed(f"model:{kind}", factory, **options)
+                self.models[key] = model
+            return model
+
+    def get_hands(self, **options):
+        """옵션이 같은 MediaPipe Hands는 한 번만 생성해서 공유"""
+        import mediapipe as mp
+        return self._get_model('hands', mp.solutions.hands.Hands, options)
+
+    def get_face_mesh(self, **options):
+        """옵션이 같은 MediaPipe FaceMesh는 한 번만 생성해서 공유"""
+        import mediapipe as mp
+        return self._get_model('face_mesh', mp.solutions.face_mesh.FaceMesh, options)
+
+    def open_camera(self, camera_index):
+        """카메라를 한 번만 열고 게임 사이에 유지 (게임의 기존 초기화 방식과 동일)"""
+        import cv2
+
+        with self.lock:
+            cap = self.cameras.get(camera_index)
+            if cap is not None and cap.isOpened():
+                return SharedCamera(cap)
+
+            start = time.perf_counter()
+            cap = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)  # DirectShow 백엔드 우선
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            cap.set(cv2.CAP_PROP_FPS, 30)
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            if not cap.isOpened():
+                cap = cv2.VideoCapture(camera_index)
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            if cap.isOpened():
+                cap.read()  # 첫 프레임은 느리므로 미리 받아둠
+                self.cameras[camera_index] = cap
+            self.timings['camera'] = (time.perf_counter() - start) * 1000.0
+            return SharedCamera(cap)
+
+    def load_game(self, script_name):
+        """게임 모듈 import (한 번만)"""
+        module = self.modules.get(script_name)
+        if module is None:
+            module = self._timed(f"import:{script_name}", importlib.import_module, GAMES[script_name])
+            self.modules[script_name] = module
+        return module
+
+    def warm_up(self, script_name, camera_index=0):
+        """카메라 열기 + 게임 모델 생성/워밍업 (이미 했으면 바로 반환)"""
+        with self.lock:
+            if script_name in self.warmed:
+                return
+            start = time.perf_counter()
+            self.open_camera(camera_index)
+            module = self.load_game(script_name)
+            if hasattr(module, 'warm_up'):
+                module.warm_up(self)
+            self.warmed.add(script_name)
+            self.timings[f"warm:{script_name}"] = (time.perf_counter() - start) * 1000.0
+            log.info("🔥 %s 워밍업 완료 (%.0fms)", script_name, self.timings[f"warm:{script_name}"])
+
+    def prepare(self, script_name, camera_index=0):
+        """게임 모듈 import(메인 스레드) 후 카메라/모델 워밍업은 백그라운드에서 시작"""
+        self.load_game(script_name)
+        self.warm_up_async(script_name, camera_index)
+
+    def warm_up_async(self, script_name, camera_index=0):
+        """런처 효과음 대기 중에 백그라운드에서 워밍업 시작"""
+        if self.warm_thread is not None and self.warm_thread.is_alive():
+            return
+        self.warm_thread = threading.Thread(target=self._warm_up_safe, args=(script_name, camera_index),
+                                            name="game-host-warmup", daemon=True)
+        self.warm_thread.start()
+
+    def _warm_up_safe(self, script_name, camera_index):
+        try:
+            self.warm_up(script_name, camera_index)
+        except Exception as e:
+            log.warning("[!] 워밍업 실패 (%s): %s", script_name, e)
+
+    def run(self, script_name, camera_index=0):
+        """게임을 현재 프로세스에서 실행하고 끝나면 반환"""
+        global _active_host
+
+        start = time.perf_counter()
+        if self.warm_thread is not None:
+            self.warm_thread.join()
+            self.warm_thread = None
+        self.warm_up(script_name, camera_index)
+        module = self.load_game(script_name)
+        self.timings[f"switch:{script_name}"] = (time.perf_counter() - start) * 1000.0
+        print(f"⚡ 게임 전환: {script_name} ({self.timings[f'switch:{script_name}']:.0f}ms, 카메라: {camera_index})")
+
+        os.environ['CAMERA_INDEX'] = str(camera_index)
+        _active_host = self
+        try:
+            module.main()
+        except SystemExit:
+            pass
+        finally:
+            _active_host = None
+
+    def close(self):
+        """카메라/모델 정리 (호스트 종료 시)"""
+        with self.lock:
+            for cap in self.cameras.values():
+                cap.release()
+            self.cameras.clear()
+            for model in self.models.values():
+                try:
+                    model.close()
+                except Exception:
+                    pass
+            self.models.clear()
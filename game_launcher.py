@@ -2,8 +2,15 @@ import pygame
 import subprocess
 import sys
 import os
-import cv2
-from PIL import Image, ImageDraw, ImageFont
+from text_renderer import TextRenderer
+from game_host import GameHost
+from game_log import setup_logging, shutdown_logging
+from startup_profile import in_background, mark_first_frame, step
+from audio_engine import get_engine as get_audio_engine
+from sampling_profiler import get_sampler
+
+# 게임을 런처 프로세스 안에서 실행 (GAME_HOST=0이면 기존처럼 새 프로세스로 실행)
+USE_GAME_HOST = os.environ.get('GAME_HOST', '1') != '0'
 
 # USB 웹캠 감지 함수
 def detect_usb_camera():
@@ -42,24 +49,22 @@ def detect_usb_camera():
         return 0, [{'index': 0, 'name': '기본 카메라'}]
 
 # Pygame 초기화
-pygame.init()
-pygame.mixer.init()
+with step("pygame.init"):
+    # 믹서를 프로필(버퍼 크기/샘플레이트)대로 먼저 열어야 pygame.init()이 기본값으로 열지 않음
+    audio = get_audio_engine()
+    pygame.init()
 
-# 효과음 로드
-try:
-    if os.path.exists("boop-sfx.wav"):
-        boop_sound = pygame.mixer.Sound("boop-sfx.wav")
-    else:
-        boop_sound = None
-except:
-    boop_sound = None
+# 효과음 로드 (게임 효과음까지 미리 불러서 호스트에서 게임을 실행할 때 다시 불러오지 않음)
+with step("sounds"):
+    audio.preload()
 
 # 화면 설정 (고정 600x800)
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 800
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("INTERACTIVE GAME")
+with step("display"):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("INTERACTIVE GAME")
 
 # 색상 정의
 WHITE = (255, 255, 255)
@@ -73,16 +78,13 @@ GRAY = (128, 128, 128)
 DARK_GRAY = (64, 64, 64)
 
 # 폰트 설정 (600x800에 맞춤)
-try:
-    font_title = pygame.font.Font("neodgm.ttf", 60)
-    font_large = pygame.font.Font("neodgm.ttf", 45)
-    font_medium = pygame.font.Font("neodgm.ttf", 35)
-    font_small = pygame.font.Font("neodgm.ttf", 25)
-except:
-    font_title = pygame.font.Font(None, 60)
-    font_large = pygame.font.Font(None, 45)
-    font_medium = pygame.font.Font(None, 35)
-    font_small = pygame.font.Font(None, 25)
+# 텍스트 Surface LRU 캐시 (버튼/제목 텍스트는 한 번만 렌더링)
+with step("fonts"):
+    text_renderer = TextRenderer("neodgm.ttf")
+    font_title = text_renderer.font(60)
+    font_large = text_renderer.font(45)
+    font_medium = text_renderer.font(35)
+    font_small = text_renderer.font(25)
 
 class GameButton:
     def __init__(self, x, y, width, height, title, description, script_name, color):
@@ -124,11 +126,7 @@ class GameButton:
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 # 효과음 재생
-                if boop_sound:
-                    try:
-                        boop_sound.play()
-                    except:
-                        pass
+                audio.play('boop')
                 return True
         return False
 
@@ -180,11 +178,28 @@ def run_game(script_name, camera_index=0):
     except Exception as e:
         print(f"게임 실행 오류: {e}")
 
+def reset_display():
+    """게임이 끝난 뒤 런처 화면 다시 설정"""
+    global screen
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("INTERACTIVE GAME")
+    pygame.event.clear()
+
 def main():
     clock = pygame.time.Clock()
     
-    # USB 웹캠 감지 및 카메라 설정
-    default_camera, available_cameras = detect_usb_camera()
+    # 샘플링 프로파일러 (F9 또는 SIGUSR1: 시작/저장, 호스트에서 실행한 게임까지 이어서 기록)
+    sampler = get_sampler()
+    
+    # 게임 호스트 (모델/카메라를 게임 사이에 유지)
+    host = None
+    if USE_GAME_HOST:
+        setup_logging("game_launcher")
+        host = GameHost()
+    
+    # USB 웹캠 감지 (Windows PowerShell 조회가 최대 2초 걸리므로 메뉴를 먼저 띄우고 백그라운드에서 진행)
+    camera_detection = in_background("detect_camera", detect_usb_camera)
+    default_camera = None
     
     # 화면 비율 확인
     is_portrait = SCREEN_HEIGHT > SCREEN_WIDTH
@@ -249,6 +264,7 @@ def main():
     waiting_for_sound = False
     sound_start_time = 0
     selected_game = None
+    game_prepared = False
     
     running = True
     while running:
@@ -259,6 +275,8 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+                elif event.key == pygame.K_F9:
+                    sampler.toggle()
             
             # 버튼 이벤트 처리
             for button in buttons:
@@ -267,6 +285,9 @@ def main():
                     waiting_for_sound = True
                     sound_start_time = pygame.time.get_ticks()
                     selected_game = button.script_name
+                    game_prepared = False
+                    if default_camera is None:
+                        default_camera, available_cameras = camera_detection.result()
                     break
         
         # 효과음 재생 완료 후 게임 실행
@@ -274,6 +295,12 @@ def main():
             current_time = pygame.time.get_ticks()
             # boop-sfx는 약 500ms 정도이므로 600ms 후에 게임 실행
             if current_time - sound_start_time >= 600:
+                if host is not None:
+                    # 같은 프로세스에서 게임 실행 후 런처로 복귀
+                    host.run(selected_game, default_camera)
+                    reset_display()
+                    waiting_for_sound = False
+                    continue
                 run_game(selected_game, default_camera)
                 running = False
         
@@ -337,8 +364,18 @@ def main():
         screen.blit(req_text, req_rect)
         
         pygame.display.flip()
+        mark_first_frame()
+        
+        # "게임 실행 중..." 화면을 그린 뒤 효과음 대기 시간 동안 게임 준비 (카메라/모델 워밍업)
+        if waiting_for_sound and host is not None and not game_prepared:
+            host.prepare(selected_game, default_camera)
+            game_prepared = True
+        
         clock.tick(60)
     
+    if host is not None:
+        host.close()
+        shutdown_logging()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+게임용 로깅 유틸리티
+- 표준 logging 기반 레벨 로그 (GAME_LOG_LEVEL 환경변수로 조절)
+- 호출 위치별 속도 제한 (매 프레임 찍히는 로그 폭주 방지)
+- 최근 로그를 메모리 링 버퍼에 보관
+- 콘솔/파일 출력은 백그라운드 스레드(QueueListener)에서 처리해 렌더링 루프를 막지 않음
+"""
+
+import collections
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+ROOT_LOGGER_NAME = "game"
+
+_listener = None
+_ring_handler = None
+_setup_lock = threading.Lock()
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, interval=1.0):
+        """같은 호출 위치의 로그는 interval초에 한 번만 통과"""
+        super().__init__()
+        self.interval = interval
+        self.last_emit = {}
+        self.suppressed = {}
+
+    def filter(self, record):
+        # WARNING 이상은 항상 통과
+        if record.levelno >= logging.WARNING or self.interval <= 0:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = record.created
+        last = self.last_emit.get(key)
+        if last is not None and now - last < self.interval:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            return False
+
+        self.last_emit[key] = now
+        skipped = self.suppressed.pop(key, 0)
+        if skipped:
+            record.msg = f"{record.msg} (+{skipped}건 생략)"
+        return True
+
+
+class RingBufferHandler(logging.Handler):
+    def __init__(self, capacity=500):
+        """최근 capacity개의 로그를 메모리에 보관"""
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(self.format(record))
+
+    def get_lines(self, count=None):
+        """최근 로그 문자열 목록 반환"""
+        lines = list(self.records)
+        return lines if count is None else lines[-count:]
+
+
+def get_logger(name):
+    """game.<name> 로거 반환"""
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def setup_logging(app_name, level=None, log_file=None, rate_limit=None, ring_size=500):
+    """로깅 초기화 (한 프로세스에서 한 번만 적용)
+
+    level: 기본값은 GAME_LOG_LEVEL 환경변수 또는 INFO
+    log_file: 기본값은 GAME_LOG_FILE 환경변수 또는 logs/<app_name>.log ("" 이면 파일 출력 안 함)
+    rate_limit: 같은 위치 로그 최소 간격(초), 기본값은 GAME_LOG_RATE_LIMIT 또는 1.0
+    """
+    global _listener, _ring_handler
+
+    with _setup_lock:
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        if _listener is not None:
+            return root
+
+        if level is None:
+            level = os.environ.get("GAME_LOG_LEVEL", "INFO")
+        if log_file is None:
+            log_file = os.environ.get("GAME_LOG_FILE", os.path.join("logs", f"{app_name}.log"))
+        if rate_limit is None:
+            rate_limit = float(os.environ.get("GAME_LOG_RATE_LIMIT", "1.0"))
+
+        root.setLevel(level.upper() if isinstance(level, str) else level)
+        root.propagate = False
+
+        # 실제 출력 핸들러들 (백그라운드 스레드에서 실행)
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [console_handler]
+
+        if log_file:
+            try:
+                log_dir = os.path.dirname(log_file)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8"
+                )
+                file_handler.setFormatter(logging.Formatter(
+                    "%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+                ))
+                handlers.append(file_handler)
+            except Exception as e:
+                print(f"[!] 로그 파일을 열 수 없습니다 ({log_file}): {e}")
+
+        _ring_handler = RingBufferHandler(ring_size)
+        _ring_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s: %(message)s"
+        ))
+        handlers.append(_ring_handler)
+
+        # 게임 루프에서는 큐에 넣기만 함 (속도 제한은 큐에 넣기 전에 적용)
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(RateLimitFilter(rate_limit))
+        root.addHandler(queue_handler)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        return root
+
+
+def get_recent_logs(count=None):
+    """링 버퍼에 보관된 최근 로그 반환"""
+    if _ring_handler is None:
+        return []
+    return _ring_handler.get_lines(count)
+
+
+def shutdown_logging():
+    """남은 로그를 모두 내보내고 백그라운드 스레드 종료"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+            for handler in logging.getLogger(ROOT_LOGGER_NAME).handlers[:]:
+                logging.getLogger(ROOT_LOGGER_NAME).removeHandler(handler)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+학습형 제스처 분류기 (최근접 이웃 / 중심점)
+- 손목 기준 + 손 크기로 정규화한 랜드마크 벡터를 사용해서 아이 손 크기/카메라 거리에 덜 민감
+- 한 손 제스처(핀치 등)와 두 손 제스처(하트)를 따로 학습
+- 프레임의 모든 손(또는 손 쌍)을 행렬 연산 한 번으로 분류
+- 모델은 .npz 파일 하나 (장소별로 gesture_recorder.py로 다시 보정, 코드 수정 없음)
+"""
+
+import os
+
+import numpy as np
+
+WRIST = 0
+MIDDLE_MCP = 9
+
+# 두 손으로 만드는 제스처 (나머지 라벨은 한 손 제스처)
+PAIR_GESTURES = ('heart',)
+NONE_LABEL = 'none'
+
+DEFAULT_MODEL_PATH = "gesture_model.npz"
+
+
+def hand_features(hands):
+    """(N, 21, 3) 손 배열 → 손목 기준, 손 크기(손목~중지 MCP)로 나눈 (N, 42) 특징"""
+    xy = hands[:, :, :2] - hands[:, WRIST:WRIST + 1, :2]
+    scale = np.maximum(np.linalg.norm(xy[:, MIDDLE_MCP], axis=1), 1e-6)
+    return (xy / scale[:, None, None]).reshape(len(hands), -1).astype(np.float32)
+
+
+def pair_features(left, right):
+    """(P, 21, 3) 왼손/오른손 배열 → 두 손목 중점 기준, 평균 손 크기로 나눈 (P, 84) 특징"""
+    center = (left[:, WRIST, :2] + right[:, WRIST, :2]) / 2
+    scale = (np.linalg.norm(left[:, MIDDLE_MCP, :2] - left[:, WRIST, :2], axis=1) +
+             np.linalg.norm(right[:, MIDDLE_MCP, :2] - right[:, WRIST, :2], axis=1)) / 2
+    scale = np.maximum(scale, 1e-6)
+    xy = np.concatenate([left[:, :, :2], right[:, :, :2]], axis=1) - center[:, None, :]
+    return (xy / scale[:, None, None]).reshape(len(left), -1).astype(np.float32)
+
+
+class PrototypeSet:
+    def __init__(self, prototypes, labels, reject_distance=np.inf):
+        """prototypes: (M, D) 대표 벡터, labels: (M,) 라벨 문자열"""
+        self.prototypes = np.asarray(prototypes, dtype=np.float32)
+        self.labels = np.asarray(labels)
+        self.reject_distance = float(reject_distance)
+        self.sq_norms = (self.prototypes ** 2).sum(axis=1)
+
+    def __len__(self):
+        return len(self.prototypes)
+
+    def classify(self, features):
+        """(N, D) 특징을 한 번의 행렬 곱으로 분류 → (라벨 배열, 거리 배열)"""
+        if len(features) == 0 or len(self.prototypes) == 0:
+            return np.full(len(features), NONE_LABEL, dtype=object), np.full(len(features), np.inf)
+
+        # ||x - p||^2 = ||x||^2 - 2 x·p + ||p||^2
+        sq = (features ** 2).sum(axis=1)[:, None] - 2.0 * features @ self.prototypes.T + self.sq_norms[None, :]
+        nearest = sq.argmin(axis=1)
+        distance = np.sqrt(np.maximum(sq[np.arange(len(features)), nearest], 0.0))
+        labels = self.labels[nearest].astype(object)
+        labels[distance > self.reject_distance] = NONE_LABEL
+        return labels, distance
+
+
+def fit_prototypes(features, labels, mode='centroid', reject_scale=1.5):
+    """학습 샘플로 PrototypeSet 생성 (mode: 'centroid' 라벨별 평균, 'knn' 샘플 전체)"""
+    features = np.asarray(features, dtype=np.float32)
+    labels = np.asarray(labels)
+    classes = sorted(set(labels.tolist()))
+    centroids = np.stack([features[labels == c].mean(axis=0) for c in classes])
+
+    # 거부 거리: 각 샘플과 자기 라벨 중심점 사이 거리의 95% 지점 × reject_scale
+    own = centroids[np.searchsorted(classes, labels)]
+    spread = np.linalg.norm(features - own, axis=1)
+    reject_distance = float(np.percentile(spread, 95) * reject_scale) if len(spread) else np.inf
+    if reject_distance <= 0:
+        reject_distance = np.inf
+
+    if mode == 'knn':
+        return PrototypeSet(features, labels, reject_distance)
+    return PrototypeSet(centroids, np.array(classes), reject_distance)
+
+
+class GestureClassifier:
+    def __init__(self, hand_set=None, pair_set=None, metadata=None):
+        """한 손 제스처 / 두 손 제스처 분류기 묶음"""
+        self.hand_set = hand_set
+        self.pair_set = pair_set
+        self.metadata = metadata or {}
+
+    @property
+    def hand_labels(self):
+        return set(self.hand_set.labels.tolist()) if self.hand_set is not None else set()
+
+    @property
+    def pair_labels(self):
+        return set(self.pair_set.labels.tolist()) if self.pair_set is not None else set()
+
+    def classify_hands(self, hands):
+        """(N, 21, 3) 손 배열의 한 손 제스처 라벨/거리"""
+        if self.hand_set is None:
+            return np.full(len(hands), NONE_LABEL, dtype=object), np.full(len(hands), np.inf)
+        return self.hand_set.classify(hand_features(hands))
+
+    def classify_pairs(self, left, right):
+        """(P, 21, 3) 왼손/오른손 쌍의 두 손 제스처 라벨/거리"""
+        if self.pair_set is None:
+            return np.full(len(left), NONE_LABEL, dtype=object), np.full(len(left), np.inf)
+        return self.pair_set.classify(pair_features(left, right))
+
+    def save(self, path=DEFAULT_MODEL_PATH):
+        """모델을 .npz 파일로 저장"""
+        arrays = {}
+        for name, prototype_set in (('hand', self.hand_set), ('pair', self.pair_set)):
+            if prototype_set is None:
+                continue
+            arrays[f"{name}_prototypes"] = prototype_set.prototypes
+            arrays[f"{name}_labels"] = prototype_set.labels.astype(str)
+            arrays[f"{name}_reject"] = np.float32(prototype_set.reject_distance)
+        for key, value in self.metadata.items():
+            arrays[f"meta_{key}"] = np.asarray(value)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        """.npz 모델 파일 로드"""
+        with np.load(path, allow_pickle=False) as data:
+            sets = {}
+            for name in ('hand', 'pair'):
+                if f"{name}_prototypes" in data:
+                    sets[name] = PrototypeSet(data[f"{name}_prototypes"], data[f"{name}_labels"],
+                                              float(data[f"{name}_reject"]))
+            metadata = {key[5:]: data[key].tolist() for key in data.files if key.startswith("meta_")}
+        return cls(sets.get('hand'), sets.get('pair'), metadata)
+
+
+def save_samples(path, samples):
+    """라벨 샘플 목록을 .npz로 저장 (손은 최대 2개, 빈 자리는 NaN)"""
+    hands = np.full((len(samples), 2, 21, 3), np.nan, dtype=np.float32)
+    hand_count = np.zeros(len(samples), dtype=np.int8)
+    for i, (sample_hands, _) in enumerate(samples):
+        n = min(len(sample_hands), 2)
+        hands[i, :n] = sample_hands[:n]
+        hand_count[i] = n
+    labels = np.array([label for _, label in samples], dtype=str)
+    np.savez_compressed(path, hands=hands, hand_count=hand_count, labels=labels)
+
+
+def load_samples(paths):
+    """save_samples로 저장한 파일들을 (hands, label) 목록으로 로드"""
+    samples = []
+    for path in paths:
+        with np.load(path, allow_pickle=False) as data:
+            for hands, n, label in zip(data['hands'], data['hand_count'], data['labels']):
+                samples.append((hands[:n], str(label)))
+    return samples
+
+
+def train_classifier(samples, mode='centroid', reject_scale=1.5, metadata=None):
+    """라벨 샘플로 분류기 학습
+
+    samples: (hands, label) 목록, hands는 (손 개수, 21, 3) 배열 (화면 왼쪽 손부터)
+    두 손 제스처 라벨은 손 쌍 분류기로, 나머지 라벨은 각 손마다 한 손 분류기로 학습하고
+    'none' 라벨은 양쪽 모두의 배경 샘플로 사용
+    """
+    hand_x, hand_y, pair_x, pair_y = [], [], [], []
+    for hands, label in samples:
+        hands = np.asarray(hands, dtype=np.float32)
+        if len(hands) >= 2 and (label in PAIR_GESTURES or label == NONE_LABEL):
+            pair_x.append(pair_features(hands[0:1], hands[1:2])[0])
+            pair_y.append(label)
+        if label not in PAIR_GESTURES:
+            for feature in hand_features(hands):
+                hand_x.append(feature)
+                hand_y.append(label)
+
+    hand_set = None
+    if len(set(hand_y) - {NONE_LABEL}):
+        hand_set = fit_prototypes(hand_x, hand_y, mode, reject_scale)
+    pair_set = None
+    if len(set(pair_y) - {NONE_LABEL}):
+        pair_set = fit_prototypes(pair_x, pair_y, mode, reject_scale)
+
+    metadata = dict(metadata or {})
+    metadata.setdefault('mode', mode)
+    metadata.setdefault('samples', len(samples))
+    return GestureClassifier(hand_set, pair_set, metadata)
+
+
+def load_default_classifier():
+    """GESTURE_MODEL 환경변수 또는 gesture_model.npz가 있으면 로드, 없으면 None"""
+    path = os.environ.get("GESTURE_MODEL", DEFAULT_MODEL_PATH)
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        classifier = GestureClassifier.load(path)
+        print(f"✓ 제스처 모델 로드: {path} ({sorted(classifier.hand_labels | classifier.pair_labels)})")
+        return classifier
+    except Exception as e:
+        print(f"[!] 제스처 모델 로드 실패 ({path}): {e}")
+        return None
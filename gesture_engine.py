@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+통합 제스처 인식 엔진 (두 게임 공용)
+- 프레임의 손/얼굴 랜드마크를 NumPy 배열로 바꿔 하트/핀치/입 벌리기를 한 번에 계산
+- 제스처별 진입/해제 히스테리시스(연속 프레임 수, 임계값 구간)와 쿨다운
+- 상태가 바뀌면 구독자에게 이벤트 전달 ('start' / 'end')
+- 프레임 사이 손 위치를 이어 붙여 손마다 고정 ID 부여 (핀치 상태는 손 ID별로 관리)
+- 학습된 제스처 모델(gesture_model.npz)이 있으면 하트/핀치 판정에 규칙 대신 모델 사용
+"""
+
+import time
+
+import numpy as np
+
+from gesture_classifier import load_default_classifier
+
+# 랜드마크 인덱스
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+UPPER_LIP = 13
+LOWER_LIP = 14
+
+
+def landmarks_to_array(landmarks, indices=None):
+    """MediaPipe 랜드마크 목록을 (N, 3) float32 배열로 변환"""
+    if indices is not None:
+        landmarks = [landmarks[i] for i in indices]
+    return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+
+
+def hands_to_array(multi_hand_landmarks):
+    """results.multi_hand_landmarks를 (손 개수, 21, 3) 배열로 변환"""
+    if not multi_hand_landmarks:
+        return np.zeros((0, 21, 3), dtype=np.float32)
+    return np.stack([landmarks_to_array(hand.landmark) for hand in multi_hand_landmarks])
+
+
+def _food_heart_conditions(left, right):
+    """음식 게임 하트 조건 5개 (3개 이상 만족하면 하트)"""
+    lt, li = left[:, THUMB_TIP], left[:, INDEX_TIP]
+    rt, ri = right[:, THUMB_TIP], right[:, INDEX_TIP]
+    thumb_distance = np.hypot(lt[:, 0] - rt[:, 0], lt[:, 1] - rt[:, 1])
+    index_distance = np.hypot(li[:, 0] - ri[:, 0], li[:, 1] - ri[:, 1])
+    return np.stack([
+        (thumb_distance > 0.05) & (thumb_distance < 0.30),  # 엄지들 사이 거리
+        index_distance < 0.10,                               # 검지들 만남
+        lt[:, 1] < li[:, 1] + 0.08,                          # 왼손 구조
+        rt[:, 1] < ri[:, 1] + 0.08,                          # 오른손 구조
+        np.abs(lt[:, 1] - rt[:, 1]) < 0.10,                  # 엄지 높이 맞춤
+    ], axis=1)
+
+
+def _student_heart_conditions(left, right):
+    """캐릭터 옮기기 게임 하트 조건 8개 (5개 이상 만족하면 하트)"""
+    lt, li = left[:, THUMB_TIP], left[:, INDEX_TIP]
+    rt, ri = right[:, THUMB_TIP], right[:, INDEX_TIP]
+    return np.stack([
+        # 엄지들이 가까이 (하트의 상단 만남점)
+        np.abs(lt[:, 0] - rt[:, 0]) < 0.15,
+        np.abs(lt[:, 1] - rt[:, 1]) < 0.08,
+        # 검지들이 가까이 (하트의 하단 만남점)
+        np.abs(li[:, 0] - ri[:, 0]) < 0.15,
+        np.abs(li[:, 1] - ri[:, 1]) < 0.08,
+        # 검지가 엄지보다 아래쪽 (하트의 아래쪽 모양)
+        li[:, 1] > lt[:, 1] - 0.02,
+        ri[:, 1] > rt[:, 1] - 0.02,
+        # 좌우 대칭성
+        lt[:, 0] <= rt[:, 0] + 0.05,
+        li[:, 0] <= ri[:, 0] + 0.05,
+    ], axis=1)
+
+
+# 하트 프로필: (조건 함수, 필요한 최소 만족 조건 수)
+HEART_PROFILES = {
+    'food': (_food_heart_conditions, 3),
+    'student': (_student_heart_conditions, 5),
+}
+
+
+class GestureEvent:
+    def __init__(self, name, kind, timestamp, slot=None, data=None):
+        """제스처 상태 변화 이벤트 (kind: 'start' 또는 'end')"""
+        self.name = name
+        self.kind = kind
+        self.timestamp = timestamp
+        self.slot = slot
+        self.data = data
+
+    def __repr__(self):
+        return f"GestureEvent({self.name!r}, {self.kind!r}, slot={self.slot})"
+
+
+class GestureTracker:
+    def __init__(self, name, enter_frames=1, exit_frames=1, cooldown=0.0, slot=None):
+        """enter_frames 연속 감지 시 시작, exit_frames 연속 미감지 시 종료, 시작 후 cooldown초 동안 재시작 금지"""
+        self.name = name
+        self.slot = slot
+        self.enter_frames = enter_frames
+        self.exit_frames = exit_frames
+        self.cooldown = cooldown
+        self.active = False
+        self.on_count = 0
+        self.off_count = 0
+        self.last_start = None
+
+    def reset(self):
+        """상태 초기화 (쿨다운 기록은 유지)"""
+        self.active = False
+        self.on_count = 0
+        self.off_count = 0
+
+    def update(self, detected, now):
+        """이번 프레임 감지 결과 반영 후 상태가 바뀌면 'start'/'end' 반환"""
+        if detected:
+            self.on_count += 1
+            self.off_count = 0
+            if not self.active and self.on_count >= self.enter_frames:
+                if self.last_start is not None and now - self.last_start < self.cooldown:
+                    return None
+                self.active = True
+                self.last_start = now
+                return 'start'
+        else:
+            self.off_count += 1
+            self.on_count = 0
+            if self.active and self.off_count >= self.exit_frames:
+                self.active = False
+                return 'end'
+        return None
+
+
+class HandIdentityTracker:
+    def __init__(self, max_distance=0.2, max_missing=5):
+        """이전 프레임 손 위치와 가장 가까운 손에 같은 ID 부여
+
+        max_distance: 같은 손으로 볼 최대 이동 거리 (정규화 좌표)
+        max_missing: 손이 안 보여도 ID를 유지할 프레임 수 (순간적인 인식 실패 대비)
+        """
+        self.max_distance = max_distance
+        self.max_missing = max_missing
+        self.next_id = 0
+        self.tracks = {}  # ID -> [중심점, 안 보인 프레임 수]
+
+    def assign(self, centers):
+        """(N, 2) 손 중심점 → (손별 ID 목록, 이번 프레임에 사라진 ID 목록)"""
+        ids = [None] * len(centers)
+        track_ids = list(self.tracks)
+        if track_ids and len(centers):
+            previous = np.array([self.tracks[t][0] for t in track_ids], dtype=np.float32)
+            distance = np.linalg.norm(previous[:, None, :] - centers[None, :, :], axis=2)
+            # 가까운 쌍부터 하나씩 짝짓기
+            for flat in np.argsort(distance, axis=None):
+                t, h = divmod(int(flat), len(centers))
+                if distance[t, h] > self.max_distance:
+                    break
+                if ids[h] is None and self.tracks[track_ids[t]][1] >= 0:
+                    ids[h] = track_ids[t]
+                    self.tracks[track_ids[t]] = [centers[h], -1]  # -1: 이번 프레임에 짝지어짐
+
+        for h, hand_id in enumerate(ids):
+            if hand_id is None:
+                ids[h] = self.next_id
+                self.tracks[self.next_id] = [centers[h], -1]
+                self.next_id += 1
+
+        lost = []
+        for track_id, track in list(self.tracks.items()):
+            track[1] += 1
+            if track[1] > self.max_missing:
+                del self.tracks[track_id]
+                lost.append(track_id)
+        return ids, lost
+
+    def reset(self):
+        """모든 손 ID 초기화"""
+        self.tracks.clear()
+
+
+class GestureFrame:
+    def __init__(self, timestamp):
+        """한 프레임의 제스처 계산 결과"""
+        self.timestamp = timestamp
+        self.hands = np.zeros((0, 21, 3), dtype=np.float32)  # 화면 왼쪽 손부터 정렬
+        self.hand_order = []             # 정렬된 손의 원래 MediaPipe 인덱스
+        self.hand_ids = []               # 정렬된 손의 추적 ID (프레임이 바뀌어도 같은 손이면 같은 ID)
+        self.lost_hand_ids = []          # 이번 프레임에 추적이 끊긴 손 ID
+        self.hand_labels = []            # 손별 분류 라벨 (학습 모델 사용 시)
+        self.pinch_distance = np.zeros(0, dtype=np.float32)
+        self.pinching = []               # 손별 핀치 상태 (히스테리시스 적용)
+        self.heart_score = 0             # 만족한 하트 조건 수 (가장 좋은 손 쌍 기준)
+        self.heart_total = 0             # 하트 조건 총 개수
+        self.heart_raw = False           # 이번 프레임 하트 조건 충족 여부
+        self.heart = False               # 히스테리시스 적용된 하트 상태
+        self.mouth_distance = None       # 입술 사이 거리 (픽셀)
+        self.mouth_open = False          # 히스테리시스 적용된 입 벌림 상태
+        self.events = []
+
+    @property
+    def hand_count(self):
+        return len(self.hands)
+
+
+class GestureEngine:
+    def __init__(self, heart_profile='food', heart_cooldown=2.0,
+                 heart_enter_frames=2, heart_exit_frames=3,
+                 pinch_enter=0.05, pinch_exit=0.065,
+                 mouth_enter=15.0, mouth_exit=12.0, classifier='auto'):
+        """제스처별 임계값/히스테리시스/쿨다운 설정 (classifier='auto'면 모델 파일이 있을 때 자동 사용)"""
+        self.heart_conditions, self.heart_min = HEART_PROFILES[heart_profile]
+        if classifier == 'auto':
+            classifier = load_default_classifier()
+        self.classifier = classifier
+        self.model_heart = classifier is not None and 'heart' in classifier.pair_labels
+        self.model_pinch = classifier is not None and 'pinch' in classifier.hand_labels
+        self.pinch_enter = pinch_enter
+        self.pinch_exit = pinch_exit
+        self.mouth_enter = mouth_enter
+        self.mouth_exit = mouth_exit
+
+        self.heart_tracker = GestureTracker('heart', heart_enter_frames, heart_exit_frames, heart_cooldown)
+        self.hand_tracker = HandIdentityTracker()
+        self.pinch_trackers = {}  # 손 ID -> GestureTracker
+        self.mouth_tracker = GestureTracker('mouth')
+        self.subscribers = {}
+        self.last_frame = None
+
+    def subscribe(self, name, callback):
+        """제스처 이벤트 구독 (name: 'heart', 'pinch', 'mouth' 또는 '*' 전체)"""
+        self.subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name, callback):
+        """구독 해제"""
+        if callback in self.subscribers.get(name, []):
+            self.subscribers[name].remove(callback)
+
+    def publish(self, event):
+        for callback in self.subscribers.get(event.name, []) + self.subscribers.get('*', []):
+            callback(event)
+
+    def evaluate_heart(self, hands):
+        """모든 손 쌍에 대해 하트 판정을 한 번에 계산 → (최고 만족 조건 수, 조건 총 개수, 하트 여부)"""
+        if len(hands) < 2:
+            return 0, 0, False
+        i, j = np.triu_indices(len(hands), k=1)
+        conditions = self.heart_conditions(hands[i], hands[j])
+        score, total = int(conditions.sum(axis=1).max()), conditions.shape[1]
+
+        # 학습 모델에 하트가 있으면 모델 판정 사용 (조건 수는 디버그 표시용으로 유지)
+        if self.model_heart:
+            labels, _ = self.classifier.classify_pairs(hands[i], hands[j])
+            return score, total, bool((labels == 'heart').any())
+        return score, total, score >= self.heart_min
+
+    def process(self, hands=None, face=None, frame_height=None, now=None):
+        """프레임 처리: hands는 multi_hand_landmarks 또는 (N,21,3) 배열, face는 얼굴 랜드마크 목록"""
+        now = time.time() if now is None else now
+        frame = GestureFrame(now)
+
+        # 손 배열 준비 (화면 왼쪽 손부터 정렬)
+        if hands is not None and not isinstance(hands, np.ndarray):
+            hands = hands_to_array(hands)
+        if hands is not None and len(hands):
+            order = np.argsort(hands[:, :, 0].mean(axis=1), kind='stable')
+            frame.hands = hands[order]
+            frame.hand_order = order.tolist()
+        frame.hand_ids, frame.lost_hand_ids = self.hand_tracker.assign(frame.hands[:, :, :2].mean(axis=1))
+
+        # 하트 (손 쌍 전체를 한 번에)
+        frame.heart_score, frame.heart_total, frame.heart_raw = self.evaluate_heart(frame.hands)
+        kind = self.heart_tracker.update(frame.heart_raw, now)
+        if kind:
+            frame.events.append(GestureEvent('heart', kind, now, data=frame))
+        frame.heart = self.heart_tracker.active
+
+        # 핀치 (모든 손을 한 번에, 진입/해제 임계값 구간으로 떨림 방지)
+        hands_sorted = frame.hands
+        if len(hands_sorted):
+            diff = hands_sorted[:, THUMB_TIP, :2] - hands_sorted[:, INDEX_TIP, :2]
+            frame.pinch_distance = np.hypot(diff[:, 0], diff[:, 1])
+            if self.classifier is not None and self.classifier.hand_set is not None:
+                frame.hand_labels = self.classifier.classify_hands(hands_sorted)[0].tolist()
+        for i, hand_id in enumerate(frame.hand_ids):
+            tracker = self.pinch_trackers.get(hand_id)
+            if tracker is None:
+                tracker = self.pinch_trackers[hand_id] = GestureTracker('pinch', slot=hand_id)
+            if self.model_pinch:
+                detected = frame.hand_labels[i] == 'pinch'
+            else:
+                threshold = self.pinch_exit if tracker.active else self.pinch_enter
+                detected = bool(frame.pinch_distance[i] < threshold)
+            kind = tracker.update(detected, now)
+            if kind:
+                frame.events.append(GestureEvent('pinch', kind, now, slot=hand_id, data=frame))
+            frame.pinching.append(tracker.active)
+
+        # 추적이 끊긴 손은 핀치 종료
+        for hand_id in frame.lost_hand_ids:
+            tracker = self.pinch_trackers.pop(hand_id, None)
+            if tracker is not None and tracker.active:
+                frame.events.append(GestureEvent('pinch', 'end', now, slot=hand_id, data=frame))
+
+        # 입 벌리기 (윗입술/아랫입술 거리, 픽셀 기준)
+        if face is not None and frame_height is not None:
+            lips = landmarks_to_array(face, (UPPER_LIP, LOWER_LIP))
+            frame.mouth_distance = float(abs(lips[0, 1] - lips[1, 1]) * frame_height)
+            threshold = self.mouth_exit if self.mouth_tracker.active else self.mouth_enter
+            kind = self.mouth_tracker.update(frame.mouth_distance > threshold, now)
+            if kind:
+                frame.events.append(GestureEvent('mouth', kind, now, data=frame))
+        frame.mouth_open = self.mouth_tracker.active
+
+        self.last_frame = frame
+        for event in frame.events:
+            self.publish(event)
+        return frame
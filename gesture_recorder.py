@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+제스처 샘플 녹화 / 모델 보정 도구
+
+녹화 (카메라 또는 녹화 영상에서 라벨 샘플 수집):
+    python gesture_recorder.py record --venue gym --labels heart,pinch,none
+    python gesture_recorder.py record --venue gym --video heart.mp4 --label heart
+
+    숫자키 1~9: 라벨 선택, SPACE: 녹화 시작/정지, ESC: 저장 후 종료
+
+학습 (gesture_samples/*.npz → gesture_model.npz):
+    python gesture_recorder.py train --venue gym
+
+게임은 gesture_model.npz(또는 GESTURE_MODEL 환경변수 경로)가 있으면 자동으로 모델을 사용합니다.
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+from gesture_classifier import (DEFAULT_MODEL_PATH, NONE_LABEL, load_samples, save_samples,
+                                train_classifier)
+from gesture_engine import hands_to_array
+
+SAMPLES_DIR = "gesture_samples"
+
+
+def open_source(args):
+    """카메라 또는 영상 파일 열기"""
+    if args.video:
+        return cv2.VideoCapture(args.video)
+    camera_index = args.camera if args.camera is not None else int(os.environ.get('CAMERA_INDEX', 0))
+    cap = cv2.VideoCapture(camera_index)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    return cap
+
+
+def record(args):
+    """라벨을 바꿔가며 손 랜드마크 샘플 수집"""
+    import mediapipe as mp
+
+    labels = args.labels.split(',')
+    if args.label and args.label not in labels:
+        labels.append(args.label)
+    current = labels.index(args.label) if args.label else 0
+    recording = bool(args.label)  # --label을 주면 바로 녹화 시작 (영상 파일용)
+
+    cap = open_source(args)
+    if not cap.isOpened():
+        print("❌ 카메라/영상을 열 수 없습니다!")
+        return
+
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=2,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    mp_draw = mp.solutions.drawing_utils
+
+    samples = []
+    counts = {label: 0 for label in labels}
+    print(f"🎥 라벨: {labels} (숫자키로 선택, SPACE로 녹화)")
+
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if not args.video:
+                frame = cv2.flip(frame, 1)  # 게임과 같은 좌우 반전
+
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if results.multi_hand_landmarks:
+                for hand_landmarks in results.multi_hand_landmarks:
+                    mp_draw.draw_landmarks(frame, hand_landmarks, mp.solutions.hands.HAND_CONNECTIONS)
+
+                if recording:
+                    # 게임 엔진과 같은 순서 (화면 왼쪽 손부터)
+                    hand_array = hands_to_array(results.multi_hand_landmarks)
+                    hand_array = hand_array[np.argsort(hand_array[:, :, 0].mean(axis=1), kind='stable')]
+                    samples.append((hand_array, labels[current]))
+                    counts[labels[current]] += 1
+
+            status = "REC" if recording else "PAUSE"
+            color = (0, 0, 255) if recording else (200, 200, 200)
+            cv2.putText(frame, f"[{status}] {current + 1}:{labels[current]}", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+            summary = "  ".join(f"{i + 1}:{label}={counts[label]}" for i, label in enumerate(labels))
+            cv2.putText(frame, summary, (10, frame.shape[0] - 15),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            cv2.imshow('GESTURE RECORDER', frame)
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == 27:
+                break
+            elif key == ord(' '):
+                recording = not recording
+            elif ord('1') <= key <= ord('9') and key - ord('1') < len(labels):
+                current = key - ord('1')
+    finally:
+        cap.release()
+        cv2.destroyAllWindows()
+        hands.close()
+
+    if not samples:
+        print("⚠️ 녹화된 샘플이 없습니다.")
+        return
+
+    os.makedirs(SAMPLES_DIR, exist_ok=True)
+    path = os.path.join(SAMPLES_DIR, f"{args.venue}_{time.strftime('%Y%m%d_%H%M%S')}.npz")
+    save_samples(path, samples)
+    print(f"💾 샘플 {len(samples)}개 저장: {path} {counts}")
+
+
+def train(args):
+    """저장된 샘플로 모델 학습 후 저장"""
+    paths = args.samples or sorted(glob.glob(os.path.join(SAMPLES_DIR, f"{args.venue or ''}*.npz")))
+    if not paths:
+        print(f"❌ 샘플 파일이 없습니다 ({SAMPLES_DIR}/)")
+        return
+
+    samples = load_samples(paths)
+    classifier = train_classifier(samples, mode=args.mode, reject_scale=args.reject_scale,
+                                  metadata={'venue': args.venue or 'default'})
+    classifier.save(args.out)
+
+    counts = {}
+    for _, label in samples:
+        counts[label] = counts.get(label, 0) + 1
+    print(f"📂 샘플 파일 {len(paths)}개, 샘플 {len(samples)}개: {counts}")
+
+    # 학습 샘플 재분류 정확도 (보정이 잘 됐는지 대략 확인)
+    for name, prototype_set in (('한 손', classifier.hand_set), ('두 손', classifier.pair_set)):
+        if prototype_set is None:
+            continue
+        correct = total = 0
+        for hands, label in samples:
+            if name == '두 손':
+                if len(hands) < 2 or label not in classifier.pair_labels:
+                    continue
+                predicted = classifier.classify_pairs(hands[0:1], hands[1:2])[0]
+            else:
+                if label not in classifier.hand_labels:
+                    continue
+                predicted = classifier.classify_hands(hands)[0]
+            correct += int((predicted == label).sum())
+            total += len(predicted)
+        labels = sorted(set(prototype_set.labels.tolist()) - {NONE_LABEL})
+        accuracy = correct / total * 100 if total else 0.0
+        print(f"  {name} 제스처 {labels}: 대표 벡터 {len(prototype_set)}개, "
+              f"거부 거리 {prototype_set.reject_distance:.2f}, 정확도 {accuracy:.1f}%")
+
+    print(f"✅ 모델 저장: {args.out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제스처 샘플 녹화 / 모델 보정 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="카메라/영상에서 라벨 샘플 녹화")
+    rec.add_argument("--venue", default="default", help="장소 이름 (샘플 파일 이름 앞부분)")
+    rec.add_argument("--labels", default="heart,pinch,none", help="쉼표로 구분한 라벨 목록")
+    rec.add_argument("--label", help="시작 라벨 (지정하면 바로 녹화 시작)")
+    rec.add_argument("--video", help="카메라 대신 사용할 녹화 영상 파일")
+    rec.add_argument("--camera", type=int, help="카메라 인덱스 (기본: CAMERA_INDEX 또는 0)")
+    rec.set_defaults(func=record)
+
+    tr = sub.add_parser("train", help="샘플로 모델 학습")
+    tr.add_argument("--venue", help="이 장소의 샘플만 사용 (기본: 전체)")
+    tr.add_argument("--samples", nargs="*", help="샘플 파일 직접 지정")
+    tr.add_argument("--out", default=DEFAULT_MODEL_PATH, help="모델 파일 경로")
+    tr.add_argument("--mode", choices=("centroid", "knn"), default="centroid",
+                    help="centroid: 라벨별 평균 벡터, knn: 샘플 전체 (최근접 이웃)")
+    tr.add_argument("--reject-scale", type=float, default=1.5,
+                    help="거부 거리 배율 (작을수록 애매한 동작을 'none'으로 처리)")
+    tr.set_defaults(func=train)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
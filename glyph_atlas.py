@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+neodgm 비트맵 글리프 아틀라스 (OpenCV 프레임용 텍스트 그리기)
+- 글자마다 PIL로 한 번만 래스터화해서 알파 마스크로 보관 (크기별 아틀라스)
+- 문자열은 글리프 마스크를 NumPy로 이어 붙여 만들고 LRU 캐시
+- BGR 프레임에는 정수 알파 블렌딩, BGRA 레이어에는 알파 합성(over)으로 직접 그림
+- 색상은 PIL/pygame과 같은 RGB(A) 순서 (4번째 값은 불투명도)
+"""
+
+import collections
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+class Glyph:
+    __slots__ = ('alpha', 'left', 'top', 'advance')
+
+    def __init__(self, alpha, left, top, advance):
+        """alpha: (h, w) uint8 마스크, left/top: 펜 위치 기준 오프셋, advance: 다음 글자까지 거리"""
+        self.alpha = alpha
+        self.left = left
+        self.top = top
+        self.advance = advance
+
+
+class GlyphAtlas:
+    def __init__(self, font_path="neodgm.ttf", size=16, max_strings=256):
+        """font_path의 size 크기 글리프 아틀라스 (폰트가 없으면 PIL 기본 폰트)"""
+        self.size = size
+        try:
+            if font_path and os.path.exists(font_path):
+                self.font = ImageFont.truetype(font_path, size)
+            else:
+                print(f"[!] {font_path}를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
+                self.font = ImageFont.load_default()
+        except Exception as e:
+            print(f"[!] 폰트 로드 실패: {e}. 기본 폰트를 사용합니다.")
+            self.font = ImageFont.load_default()
+
+        try:
+            ascent, descent = self.font.getmetrics()
+            self.line_height = ascent + descent
+        except AttributeError:
+            self.line_height = self.font.getbbox("가")[3]
+
+        self.glyphs = {}
+        self.strings = collections.OrderedDict()
+        self.max_strings = max_strings
+
+    def glyph(self, char):
+        """글자 하나의 글리프 (처음 한 번만 래스터화)"""
+        glyph = self.glyphs.get(char)
+        if glyph is not None:
+            return glyph
+
+        left, top, right, bottom = self.font.getbbox(char)
+        width, height = max(1, right - left), max(1, bottom - top)
+        image = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(image).text((-left, -top), char, fill=255, font=self.font)
+        advance = self.font.getlength(char) if hasattr(self.font, 'getlength') else right
+
+        glyph = Glyph(np.array(image, dtype=np.uint8), left, top, advance)
+        self.glyphs[char] = glyph
+        return glyph
+
+    def preload(self, text):
+        """자주 쓰는 글자를 미리 래스터화 (게임 루프 첫 프레임 지연 방지)"""
+        for char in text:
+            self.glyph(char)
+
+    def text_mask(self, text):
+        """문자열 전체의 알파 마스크 (h, w) uint8 (LRU 캐시)"""
+        mask = self.strings.get(text)
+        if mask is not None:
+            self.strings.move_to_end(text)
+            return mask
+
+        glyphs = [self.glyph(char) for char in text]
+        pen = 0.0
+        placements = []
+        for glyph in glyphs:
+            placements.append((int(round(pen)) + glyph.left, glyph.top, glyph))
+            pen += glyph.advance
+        width = max([int(round(pen))] + [x + g.alpha.shape[1] for x, _, g in placements] + [1])
+        height = max([self.line_height] + [y + g.alpha.shape[0] for _, y, g in placements])
+
+        mask = np.zeros((height, width), dtype=np.uint8)
+        for x, y, glyph in placements:
+            gh, gw = glyph.alpha.shape
+            x0, y0 = max(0, x), max(0, y)
+            region = mask[y0:y + gh, x0:x + gw]
+            np.maximum(region, glyph.alpha[y0 - y:y0 - y + region.shape[0], x0 - x:x0 - x + region.shape[1]],
+                       out=region)
+
+        self.strings[text] = mask
+        if len(self.strings) > self.max_strings:
+            self.strings.popitem(last=False)
+        return mask
+
+    def measure(self, text):
+        """문자열 (너비, 높이)"""
+        mask = self.text_mask(text)
+        return mask.shape[1], mask.shape[0]
+
+    def draw(self, image, position, text, color):
+        """BGR 프레임 또는 BGRA 레이어에 문자열을 그림 (color: RGB 또는 RGBA), 그린 너비 반환"""
+        mask = self.text_mask(text)
+        x, y = int(position[0]), int(position[1])
+        image_h, image_w = image.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(image_w, x + mask.shape[1]), min(image_h, y + mask.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            return mask.shape[1]
+
+        opacity = color[3] if len(color) > 3 else 255
+        bgr = np.array((color[2], color[1], color[0]), dtype=np.uint16)
+        roi = image[y0:y1, x0:x1]
+        a = mask[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.uint16)[:, :, None]
+        if opacity < 255:
+            a = a * opacity // 255
+
+        if image.shape[2] == 3:
+            # out = (frame * (255 - a) + color * a) / 255 (정확한 반올림)
+            acc = roi.astype(np.uint16)
+            acc *= 255 - a
+            acc += bgr * a
+            acc += 128
+            acc += acc >> 8
+            acc >>= 8
+            np.copyto(roi, acc, casting='unsafe')
+        else:
+            # 투명 레이어 위 알파 합성 (straight alpha)
+            src_a = a.astype(np.float32) / 255.0
+            dst_a = roi[:, :, 3:4].astype(np.float32) / 255.0
+            out_a = src_a + dst_a * (1.0 - src_a)
+            out_bgr = (bgr * src_a + roi[:, :, :3] * (dst_a * (1.0 - src_a))) / np.maximum(out_a, 1e-6)
+            roi[:, :, :3] = np.round(out_bgr)
+            roi[:, :, 3:4] = np.round(out_a * 255.0)
+        return mask.shape[1]
@@ -0,0 +1,663 @@
+#!/usr/bin/env python3
+"""
+MediaPipe 랜드마크 녹화 / 재생
+- 게임 중 MediaPipe 결과(손/얼굴 랜드마크, 왼손/오른손 구분, 시각)를 프레임마다 기록해서
+  CHUNK_FRAMES 프레임씩 float16 .npz 청크로 저장 (저장은 백그라운드 스레드)
+- 재생: MediaPipe 없이 녹화된 결과를 같은 모양의 결과 객체(multi_hand_landmarks 등)로 돌려줌
+  → 게임 로직은 그대로, 카메라/MediaPipe가 없는 컴퓨터에서도 실행 가능
+- 녹화 디렉터리 구조:
+    meta.json             버전, 게임, 청크 크기, 프레임 크기, 스트림별 프레임 수
+    hands_00000.npz       t(float64), count(int8), landmarks(float16 [N, 손, 21, 3], 빈 자리 NaN),
+                          handedness(int8 [N, 손], 0=Left 1=Right -1=없음), score(float16 [N, 손])
+    face_00000.npz        t, count, landmarks(float16 [N, 얼굴, 점, 3])
+
+게임에서 (두 게임 공통):
+    LANDMARK_RECORD=recordings/gym.lmk python food_eating_game.py     # 녹화
+    LANDMARK_REPLAY=recordings/gym.lmk CAMERA_CLIP=gym.mp4 python food_eating_game.py   # 재생
+
+도구:
+    python landmark_log.py info recordings/gym.lmk
+    python landmark_log.py bench recordings/gym.lmk --repeat 5 --out bench.json --compare old.json
+    python landmark_log.py synth recordings/synthetic.lmk --frames 3000   # 카메라 없이 합성 녹화
+"""
+
+import atexit
+import collections
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import types
+
+import cv2
+import numpy as np
+
+from gesture_engine import hands_to_array, landmarks_to_array
+
+VERSION = 1
+CHUNK_FRAMES = 300      # 청크 하나의 프레임 수 (30fps 기준 10초)
+STREAMS = ('hands', 'face')
+HANDEDNESS = ('Left', 'Right')
+
+RECORD_ENV = "LANDMARK_RECORD"
+REPLAY_ENV = "LANDMARK_REPLAY"
+
+
+# ----------------------------------------------------------------------------
+# MediaPipe 결과와 같은 모양의 객체
+# ----------------------------------------------------------------------------
+
+class Landmark:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class LandmarkList:
+    """NormalizedLandmarkList 대신 (.landmark)"""
+    __slots__ = ('landmark',)
+
+    def __init__(self, points):
+        self.landmark = [Landmark(x, y, z) for x, y, z in points]
+
+
+class Classification:
+    __slots__ = ('index', 'label', 'score')
+
+    def __init__(self, index, label, score):
+        self.index = index
+        self.label = label
+        self.score = score
+
+
+class ClassificationList:
+    __slots__ = ('classification',)
+
+    def __init__(self, items):
+        self.classification = items
+
+
+class ReplayResults:
+    """hands.process() / face_mesh.process() 결과 대신 (없는 항목은 MediaPipe처럼 None)"""
+
+    def __init__(self, timestamp=None, hands=None, handedness=None, faces=None):
+        self.timestamp = timestamp
+        self.multi_hand_landmarks = hands or None
+        self.multi_handedness = handedness or None
+        self.multi_hand_world_landmarks = None
+        self.multi_face_landmarks = faces or None
+
+
+EMPTY_RESULTS = ReplayResults()
+
+
+# ----------------------------------------------------------------------------
+# 녹화
+# ----------------------------------------------------------------------------
+
+def _pad(arrays, shape):
+    """길이가 다른 배열들을 NaN으로 채운 float16 배열 하나로"""
+    out = np.full((len(arrays),) + shape, np.nan, dtype=np.float16)
+    for i, array in enumerate(arrays):
+        if len(array):
+            out[i, :len(array)] = array[:shape[0]]
+    return out
+
+
+class LandmarkRecorder:
+    def __init__(self, path, chunk_frames=CHUNK_FRAMES, source=None):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.meta = {'version': VERSION, 'source': source, 'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+                     'chunk_frames': chunk_frames, 'frame_size': None, 'streams': {}}
+        self.buffers = {name: [] for name in STREAMS}
+        self.chunk_index = {name: 0 for name in STREAMS}
+        self.lock = threading.Lock()
+        self.closed = False
+        os.makedirs(path, exist_ok=True)
+
+        # 청크 압축/저장은 백그라운드에서 (게임 루프는 배열을 모으기만 함)
+        self.jobs = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="landmark-writer", daemon=True)
+        self.thread.start()
+
+    def record(self, stream, results, image=None, timestamp=None):
+        """MediaPipe 결과 한 프레임 기록 (stream: 'hands' 또는 'face')"""
+        timestamp = time.time() if timestamp is None else timestamp
+        if image is not None and self.meta['frame_size'] is None:
+            self.meta['frame_size'] = [int(image.shape[1]), int(image.shape[0])]
+        if stream == 'hands':
+            handedness = []
+            for item in results.multi_handedness or []:
+                best = item.classification[0]
+                handedness.append((HANDEDNESS.index(best.label) if best.label in HANDEDNESS else -1, best.score))
+            self.add_hands(timestamp, hands_to_array(results.multi_hand_landmarks), handedness)
+        else:
+            faces = [landmarks_to_array(face.landmark) for face in results.multi_face_landmarks or []]
+            self.add_faces(timestamp, faces)
+
+    def add_hands(self, timestamp, hands, handedness=()):
+        """손 배열 (손 개수, 21, 3)과 [(0=Left/1=Right, 점수), ...] 기록"""
+        self._add('hands', (timestamp, np.asarray(hands, dtype=np.float32), list(handedness)))
+
+    def add_faces(self, timestamp, faces):
+        """얼굴별 (점 개수, 3) 배열 목록 기록"""
+        self._add('face', (timestamp, [np.asarray(face, dtype=np.float32) for face in faces]))
+
+    def _add(self, stream, entry):
+        with self.lock:
+            if self.closed:
+                return
+            buffer = self.buffers[stream]
+            buffer.append(entry)
+            if len(buffer) >= self.chunk_frames:
+                self._flush(stream)
+
+    def _flush(self, stream):
+        """모은 프레임을 청크 저장 대기열로 (lock 안에서 호출)"""
+        frames, self.buffers[stream] = self.buffers[stream], []
+        if not frames:
+            return
+        index = self.chunk_index[stream]
+        self.chunk_index[stream] += 1
+        info = self.meta['streams'].setdefault(stream, {'frames': 0, 'chunks': 0})
+        info['frames'] += len(frames)
+        info['chunks'] += 1
+        self.jobs.put((stream, index, frames))
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            stream, index, frames = job
+            try:
+                path = os.path.join(self.path, f"{stream}_{index:05d}.npz")
+                np.savez_compressed(path, **pack_chunk(stream, frames))
+            except OSError as e:
+                print(f"[!] 랜드마크 청크 저장 실패 ({stream} {index}): {e}")
+
+    def close(self):
+        """남은 프레임 저장 후 meta.json 기록"""
+        with self.lock:
+            if self.closed:
+                return
+            for stream in STREAMS:
+                self._flush(stream)
+            self.closed = True
+        self.jobs.put(None)
+        self.thread.join()
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=2)
+        total = ", ".join(f"{name} {info['frames']}프레임" for name, info in self.meta['streams'].items())
+        print(f"💾 랜드마크 녹화 저장: {self.path} ({total or '기록 없음'})")
+
+
+def pack_chunk(stream, frames):
+    """프레임 목록 → 청크 배열 dict"""
+    t = np.array([frame[0] for frame in frames], dtype=np.float64)
+    if stream == 'hands':
+        counts = [len(hands) for _, hands, _ in frames]
+        width = max(1, max(counts))
+        handedness = np.full((len(frames), width), -1, dtype=np.int8)
+        scores = np.zeros((len(frames), width), dtype=np.float16)
+        for i, (_, _, items) in enumerate(frames):
+            for j, (label, score) in enumerate(items[:width]):
+                handedness[i, j] = label
+                scores[i, j] = score
+        return {'t': t, 'count': np.array(counts, dtype=np.int8),
+                'landmarks': _pad([hands for _, hands, _ in frames], (width, 21, 3)),
+                'handedness': handedness, 'score': scores}
+
+    counts = [len(faces) for _, faces in frames]
+    width = max(1, max(counts))
+    points = max([len(face) for _, faces in frames for face in faces] or [468])
+    landmarks = np.full((len(frames), width, points, 3), np.nan, dtype=np.float16)
+    for i, (_, faces) in enumerate(frames):
+        for j, face in enumerate(faces[:width]):
+            landmarks[i, j, :len(face)] = face
+    return {'t': t, 'count': np.array(counts, dtype=np.int8), 'landmarks': landmarks}
+
+
+class RecordingTracker:
+    """MediaPipe 모델을 감싸서 process() 결과를 녹화 (나머지 속성은 원래 모델 그대로)"""
+
+    def __init__(self, tracker, recorder, stream):
+        self.tracker = tracker
+        self.recorder = recorder
+        self.stream = stream
+
+    def process(self, image):
+        results = self.tracker.process(image)
+        self.recorder.record(self.stream, results, image)
+        return results
+
+    def __getattr__(self, name):
+        return getattr(self.tracker, name)
+
+
+# ----------------------------------------------------------------------------
+# 재생
+# ----------------------------------------------------------------------------
+
+class LandmarkReplay:
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                self.meta = json.load(f)
+        except (OSError, ValueError):
+            self.meta = {}  # 녹화 중 종료됨 → 저장된 청크만 사용
+        self.chunks = {name: sorted(glob.glob(os.path.join(path, f"{name}_*.npz"))) for name in STREAMS}
+
+    @property
+    def frame_size(self):
+        return tuple(self.meta.get('frame_size') or (640, 480))
+
+    def load_chunks(self, stream):
+        """청크별 배열 dict (한 번에 청크 하나만 메모리에)"""
+        for path in self.chunks[stream]:
+            with np.load(path) as data:
+                yield {key: data[key] for key in data.files}
+
+    def arrays(self, stream):
+        """스트림 전체를 이어 붙인 배열 (t, count, landmarks: float32)"""
+        chunks = list(self.load_chunks(stream))
+        if not chunks:
+            return None
+        width = max(chunk['landmarks'].shape[1] for chunk in chunks)
+        points = chunks[0]['landmarks'].shape[2]
+        landmarks = []
+        for chunk in chunks:
+            array = np.full((len(chunk['t']), width, points, 3), np.nan, dtype=np.float32)
+            array[:, :chunk['landmarks'].shape[1]] = chunk['landmarks']
+            landmarks.append(array)
+        return {'t': np.concatenate([c['t'] for c in chunks]),
+                'count': np.concatenate([c['count'] for c in chunks]),
+                'landmarks': np.concatenate(landmarks)}
+
+    def frames(self, stream):
+        """(시각, ReplayResults)를 프레임 순서대로"""
+        for chunk in self.load_chunks(stream):
+            landmarks = chunk['landmarks'].astype(np.float32).tolist()
+            for i, (t, count) in enumerate(zip(chunk['t'].tolist(), chunk['count'].tolist())):
+                items = [LandmarkList(points) for points in landmarks[i][:count]]
+                if stream == 'hands':
+                    handedness = [ClassificationList([Classification(int(label), HANDEDNESS[label], float(score))])
+                                  for label, score in zip(chunk['handedness'][i][:count].tolist(),
+                                                          chunk['score'][i][:count].tolist())
+                                  if label >= 0]
+                    yield t, ReplayResults(t, hands=items, handedness=handedness)
+                else:
+                    yield t, ReplayResults(t, faces=items)
+
+    def frame_count(self, stream):
+        info = self.meta.get('streams', {}).get(stream)
+        if info:
+            return info['frames']
+        return sum(len(chunk['t']) for chunk in self.load_chunks(stream))
+
+
+class ReplayTracker:
+    """MediaPipe 모델 대신: process()마다 녹화된 다음 프레임 결과 (끝나면 빈 결과)"""
+
+    def __init__(self, replay, stream):
+        self.replay = replay
+        self.stream = stream
+        self.frames = replay.frames(stream)
+        self.finished = False
+
+    def process(self, image):
+        item = next(self.frames, None)
+        if item is None:
+            self.finished = True
+            return EMPTY_RESULTS
+        return item[1]
+
+    def close(self):
+        pass
+
+
+# MediaPipe 없이 재생할 때 mp.solutions.hands / mp.solutions.drawing_utils 대신 쓰는 손 골격 그리기
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),             # 엄지
+    (0, 5), (5, 6), (6, 7), (7, 8),             # 검지
+    (5, 9), (9, 10), (10, 11), (11, 12),        # 중지
+    (9, 13), (13, 14), (14, 15), (15, 16),      # 약지
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # 새끼손가락 + 손바닥
+)
+
+
+class DrawingSpec:
+    def __init__(self, color=(224, 224, 224), thickness=2, circle_radius=2):
+        self.color = color
+        self.thickness = thickness
+        self.circle_radius = circle_radius
+
+
+def draw_landmarks(image, landmark_list, connections=None, landmark_drawing_spec=None,
+                   connection_drawing_spec=None):
+    """mp.solutions.drawing_utils.draw_landmarks와 같은 인자 (BGR 프레임에 점/연결선)"""
+    height, width = image.shape[:2]
+    points = [(int(lm.x * width), int(lm.y * height)) for lm in landmark_list.landmark]
+    line = connection_drawing_spec or DrawingSpec()
+    dot = landmark_drawing_spec or DrawingSpec(color=(0, 0, 255))
+    for start, end in connections or ():
+        cv2.line(image, points[start], points[end], line.color, line.thickness)
+    for point in points:
+        cv2.circle(image, point, dot.circle_radius, dot.color, dot.thickness)
+
+
+hands_solution = types.SimpleNamespace(HAND_CONNECTIONS=HAND_CONNECTIONS)
+drawing_utils = types.SimpleNamespace(DrawingSpec=DrawingSpec, draw_landmarks=draw_landmarks)
+
+
+# ----------------------------------------------------------------------------
+# 게임 연결 (환경변수)
+# ----------------------------------------------------------------------------
+
+_recorder = None
+_replay = None
+_lock = threading.Lock()
+
+
+def replay_enabled():
+    return bool(os.environ.get(REPLAY_ENV))
+
+
+def get_recorder(source=None):
+    """LANDMARK_RECORD 경로의 공용 녹화기 (종료 시 자동 저장)"""
+    global _recorder
+    with _lock:
+        if _recorder is None:
+            _recorder = LandmarkRecorder(os.environ[RECORD_ENV], source=source)
+            atexit.register(_recorder.close)
+        return _recorder
+
+
+def record_tracker(tracker, stream, source=None):
+    """LANDMARK_RECORD가 설정되어 있으면 모델을 녹화용으로 감쌈"""
+    if not os.environ.get(RECORD_ENV):
+        return tracker
+    return RecordingTracker(tracker, get_recorder(source), stream)
+
+
+def replay_tracker(stream):
+    """LANDMARK_REPLAY 녹화에서 stream을 재생하는 모델 대체 객체"""
+    global _replay
+    with _lock:
+        if _replay is None:
+            _replay = LandmarkReplay(os.environ[REPLAY_ENV])
+            print(f"🎞️ 랜드마크 재생: {_replay.path} (MediaPipe 사용 안 함)")
+    return ReplayTracker(_replay, stream)
+
+
+# ----------------------------------------------------------------------------
+# 도구: 정보 / 합성 녹화 / 벤치마크
+# ----------------------------------------------------------------------------
+
+def _synthetic_hand(wrist_x, wrist_y, scale, thumb_tip, index_tip):
+    """손목 위치 기준 부채꼴 손 모양 (엄지/검지 끝은 지정 위치)"""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[0, :2] = wrist_x, wrist_y
+    for finger in range(5):
+        angle = np.radians(-150 + finger * 30)
+        for joint in range(4):
+            reach = scale * (0.35 + 0.22 * joint)
+            hand[1 + finger * 4 + joint, :2] = (wrist_x + np.cos(angle) * reach, wrist_y + np.sin(angle) * reach)
+    hand[4, :2] = thumb_tip
+    hand[8, :2] = index_tip
+    return hand
+
+
+def synthesize(path, frames=3000, fps=30.0, seed=0):
+    """카메라 없이 쓸 합성 녹화 (두 손 핀치 반복, 주기적으로 하트, 입 벌렸다 닫기)"""
+    rng = np.random.default_rng(seed)
+    face_template = rng.uniform(-0.08, 0.08, size=(478, 3)).astype(np.float32)
+    recorder = LandmarkRecorder(path, source='synthetic')
+    recorder.meta['frame_size'] = [640, 480]
+    start = time.time()
+    for i in range(frames):
+        t = start + i / fps
+        phase = i / fps
+        hands = []
+        if (i // int(fps * 8)) % 4 == 3:
+            # 하트: 두 엄지가 위에서, 두 검지가 아래에서 만남
+            hands.append(_synthetic_hand(0.38, 0.65, 0.15, (0.46, 0.45), (0.49, 0.58)))
+            hands.append(_synthetic_hand(0.62, 0.65, 0.15, (0.54, 0.45), (0.51, 0.58)))
+        else:
+            for side, offset in ((0, 0.0), (1, np.pi)):
+                x = 0.3 + side * 0.4 + 0.15 * np.sin(phase * 0.7 + offset)
+                y = 0.55 + 0.2 * np.cos(phase * 0.5 + offset)
+                gap = 0.02 + 0.06 * (0.5 + 0.5 * np.sin(phase * 2.0 + offset))  # 핀치 거리
+                hands.append(_synthetic_hand(x, y, 0.15, (x - 0.05, y - 0.15), (x - 0.05 + gap, y - 0.15)))
+        noise = rng.normal(0, 0.002, size=(len(hands), 21, 3)).astype(np.float32)
+        recorder.add_hands(t, np.stack(hands) + noise, [(0, 0.95), (1, 0.95)][:len(hands)])
+
+        face = face_template + (0.5 + 0.1 * np.sin(phase * 0.3), 0.45, 0.0)
+        mouth = 0.01 + 0.04 * (0.5 + 0.5 * np.sin(phase * 1.5))  # 입 벌림 (정규화 좌표)
+        face[13, :2] = face[0, 0], 0.55
+        face[14, :2] = face[0, 0], 0.55 + mouth
+        face[10, :2] = face[0, 0], 0.3
+        recorder.add_faces(t, [face])
+    recorder.close()
+
+
+def info(path):
+    replay = LandmarkReplay(path)
+    print(f"📁 {path}")
+    print(f"  게임: {replay.meta.get('source')}, 녹화: {replay.meta.get('created')}, "
+          f"프레임 크기: {replay.frame_size[0]}x{replay.frame_size[1]}")
+    for stream in STREAMS:
+        arrays = replay.arrays(stream)
+        if arrays is None:
+            continue
+        size = sum(os.path.getsize(p) for p in replay.chunks[stream])
+        duration = arrays['t'][-1] - arrays['t'][0] if len(arrays['t']) > 1 else 0.0
+        detected = int((arrays['count'] > 0).sum())
+        print(f"  {stream:<6} {len(arrays['t'])}프레임 ({duration:.1f}초), 인식된 프레임 {detected}, "
+              f"최대 {int(arrays['count'].max())}개, 청크 {len(replay.chunks[stream])}개 {size / 1024:.0f}KB")
+
+
+class _Timer:
+    """대상 함수 호출 시간만 누적"""
+
+    def __init__(self):
+        self.total = 0.0
+        self.calls = 0
+
+    def __call__(self, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.total += time.perf_counter() - start
+        self.calls += 1
+        return result
+
+    def summary(self, outcome):
+        return {'frames': self.calls, 'total_ms': self.total * 1000.0,
+                'per_frame_us': self.total / self.calls * 1e6 if self.calls else 0.0,
+                'fps': self.calls / self.total if self.total > 0 else 0.0,
+                'outcome': outcome}
+
+
+def _repeated(replay, stream, repeat):
+    """녹화를 repeat번 이어서 재생 (반복마다 시각을 이어 붙임)"""
+    offset = 0.0
+    for _ in range(repeat):
+        first = last = None
+        for t, results in replay.frames(stream):
+            if first is None:
+                first = t
+            last = t
+            yield t + offset, results
+        if last is None:
+            return
+        offset += last - first + 1.0 / 30.0
+
+
+def bench_gestures(replay, profile, repeat=1):
+    """제스처 엔진(하트/핀치/입 벌림) 단독"""
+    from gesture_engine import GestureEngine
+
+    engine = GestureEngine(heart_profile=profile, classifier=None)
+    events = collections.Counter()
+    engine.subscribe('*', lambda event: events.update([f"{event.name}:{event.kind}"]))
+    height = replay.frame_size[1]
+    faces = _repeated(replay, 'face', repeat) if profile == 'food' else None
+    timer = _Timer()
+    for t, results in _repeated(replay, 'hands', repeat):
+        face = None
+        if faces is not None:
+            _, face_results = next(faces, (None, EMPTY_RESULTS))
+            if face_results.multi_face_landmarks:
+                face = face_results.multi_face_landmarks[0].landmark
+        timer(engine.process, results.multi_hand_landmarks, face, height, t)
+    return timer.summary(dict(sorted(events.items())))
+
+
+def bench_student(replay, repeat=1):
+    """캐릭터 옮기기 게임 process_hand_tracking (핀치로 캐릭터 잡기/옮기기, 손 그리기)"""
+    import random
+    import student_moving_game
+
+    random.seed(0)
+    photobooth = student_moving_game.HandTrackingPixelPhotobooth()
+    # 컴퓨터마다 있을 수 있는 gesture_model.npz와 상관없이 규칙 판정으로 고정
+    photobooth.gesture_engine.classifier = None
+    photobooth.gesture_engine.model_heart = photobooth.gesture_engine.model_pinch = False
+    photobooth.start_game()
+    canvas = np.zeros((800, 600, 3), dtype=np.uint8)
+    height, width = canvas.shape[:2]
+    while len(photobooth.characters) < photobooth.max_characters:
+        photobooth.spawn_character(width, height)
+
+    timer = _Timer()
+    for _, results in _repeated(replay, 'hands', repeat):
+        timer(photobooth.process_hand_tracking, canvas, results)
+    _stop_bgm()
+    return timer.summary({'score': photobooth.score, 'moved': len(photobooth.moved_characters),
+                          'characters': len(photobooth.characters)})
+
+
+def bench_food(replay, repeat=1):
+    """음식 게임 check_food_collision (입 위치로 음식 끌어당기기/먹기)"""
+    import random
+    import pygame
+    import food_eating_game as food
+    from gesture_engine import GestureEngine
+
+    random.seed(0)
+    np.random.seed(0)
+    food.init_game()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((food.SCREEN_WIDTH, food.SCREEN_HEIGHT))
+    game_state = food.GameState()
+    game_state.game_started = True
+    engine = GestureEngine(heart_profile='food', mouth_enter=15.0, mouth_exit=12.0, classifier=None)
+    height = replay.frame_size[1]
+
+    timer = _Timer()
+    for t, results in _repeated(replay, 'face', repeat):
+        face = results.multi_face_landmarks[0].landmark if results.multi_face_landmarks else None
+        game_state.mouth_open = engine.process(None, face=face, frame_height=height, now=t).mouth_open
+        game_state.step_foods(None)  # 생성/이동 (측정 제외)
+        if face is not None:
+            timer(game_state.check_food_collision,
+                  food.get_mouth_center(face, food.SCREEN_WIDTH, food.SCREEN_HEIGHT))
+    _stop_bgm()
+    return timer.summary({'score': game_state.score, 'foods': len(game_state.foods)})
+
+
+def _stop_bgm():
+    """게임 객체가 시작한 배경음악 정지"""
+    from bgm_player import get_player
+    get_player().stop()
+
+
+def bench(path, repeat=1, targets=None):
+    """녹화 재생으로 게임 로직 벤치마크 (MediaPipe/카메라/화면 없이)"""
+    import tempfile
+
+    os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+    os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+    os.environ[REPLAY_ENV] = path                                    # 게임 객체도 MediaPipe 대신 재생
+    os.environ.setdefault('SCORE_DIR', tempfile.mkdtemp(prefix="landmark_bench_"))  # 실제 점수 보호
+    replay = LandmarkReplay(path)
+    # 이름 → (필요한 스트림, 실행 함수)
+    jobs = {
+        'gestures_student': ('hands', lambda: bench_gestures(replay, 'student', repeat)),
+        'gestures_food': ('hands', lambda: bench_gestures(replay, 'food', repeat)),
+        'process_hand_tracking': ('hands', lambda: bench_student(replay, repeat)),
+        'check_food_collision': ('face', lambda: bench_food(replay, repeat)),
+    }
+    results = {}
+    for name, (stream, job) in jobs.items():
+        if targets and name not in targets:
+            continue
+        if not replay.chunks[stream]:
+            print(f"[!] {name}: 녹화에 {stream} 스트림이 없어서 건너뜀")
+            continue
+        print(f"⏱️ {name} 측정 중...")
+        results[name] = job()
+    return results
+
+
+def print_bench(results, baseline=None):
+    """결과 표 (baseline이 있으면 FPS 변화율, 결과(outcome)가 다르면 표시) → 결과가 모두 같으면 True"""
+    same = True
+    print(f"\n{'대상':<24} {'프레임':>8} {'µs/프레임':>10} {'FPS':>10}")
+    for name, result in results.items():
+        line = f"{name:<24} {result['frames']:>8} {result['per_frame_us']:>10.1f} {result['fps']:>10.0f}"
+        base = (baseline or {}).get(name)
+        if base:
+            line += f" ({(result['fps'] - base['fps']) / base['fps'] * 100:+.1f}%)" if base['fps'] else ""
+            if base['outcome'] != result['outcome']:
+                same = False
+                line += f"\n    ⚠️ 결과가 다릅니다: {base['outcome']} → {result['outcome']}"
+        print(line)
+        print(f"    {result['outcome']}")
+    return same
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MediaPipe 랜드마크 녹화 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("info", help="녹화 정보")
+    p.add_argument("path")
+    p = sub.add_parser("synth", help="합성 녹화 만들기")
+    p.add_argument("path")
+    p.add_argument("--frames", type=int, default=3000)
+    p = sub.add_parser("bench", help="녹화 재생으로 게임 로직 벤치마크")
+    p.add_argument("path")
+    p.add_argument("--repeat", type=int, default=1, help="녹화 반복 횟수")
+    p.add_argument("--only", nargs="*", help="측정할 대상 이름")
+    p.add_argument("--out", help="결과 JSON 경로")
+    p.add_argument("--compare", help="비교할 이전 결과 JSON (결과가 다르면 종료 코드 1)")
+    args = parser.parse_args()
+
+    if args.command == "info":
+        info(args.path)
+    elif args.command == "synth":
+        synthesize(args.path, args.frames)
+    else:
+        results = bench(args.path, max(1, args.repeat), args.only)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        baseline = None
+        if args.compare:
+            with open(args.compare, encoding="utf-8") as f:
+                baseline = json.load(f)
+        if not print_bench(results, baseline):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
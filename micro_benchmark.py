@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+핫 패스 마이크로벤치마크 + 성능 회귀 검사
+- 게임에서 매 프레임 실행되는 함수를 고정된 합성 입력(시드 고정)으로 하나씩 측정
+- 함수마다 한 번 측정이 MIN_TIME/REPEATS 이상 되도록 호출 횟수를 맞추고 REPEATS번 반복해서 최솟값으로 비교
+- 결과는 컴퓨터별 파일(benchmark_reports/micro/<호스트>-<CPU>-py<버전>.json)에 저장
+- 저장된 기준보다 허용 범위(TOLERANCES, 기본 DEFAULT_TOLERANCE) 이상 느려지면 종료 코드 1
+
+    python micro_benchmark.py                 # 측정 → 기준과 비교 (기준이 없으면 저장)
+    python micro_benchmark.py --update        # 측정 결과를 이 컴퓨터의 새 기준으로 저장
+    python micro_benchmark.py --only food.apply_beautify_filter --tolerance 0.1
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from startup_profile import git_revision
+
+REPORT_DIR = os.path.join("benchmark_reports", "micro")
+MIN_TIME = 0.5          # 함수당 측정 시간(초)
+REPEATS = 7
+DEFAULT_TOLERANCE = 0.20
+
+# 함수별 허용 범위 (pygame 그리기/텍스트처럼 편차가 큰 것은 넓게)
+TOLERANCES = {
+    'student.draw_ui_changed': 0.35,
+    'food.draw_particles': 0.30,
+    'food.draw_hand_skeleton': 0.30,
+}
+
+CASES = {}   # 이름 → 측정할 함수를 만드는 준비 함수 (준비 시간은 측정에서 제외)
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ----------------------------------------------------------------------------
+# 게임 객체 준비 (한 번만, 창/소리 없이)
+# ----------------------------------------------------------------------------
+
+_fixtures = {}
+
+
+def _headless():
+    os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+    os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+    os.environ.setdefault('SCORE_DIR', tempfile.mkdtemp(prefix="micro_benchmark_"))  # 실제 점수 보호
+
+
+def _food():
+    """음식 게임 모듈 (pygame/폰트 초기화 + 화면 Surface)"""
+    if 'food' not in _fixtures:
+        _headless()
+        import pygame
+        import food_eating_game as food
+
+        food.init_game()
+        screen = pygame.display.get_surface() or pygame.display.set_mode((food.SCREEN_WIDTH, food.SCREEN_HEIGHT))
+        _fixtures['food'] = (food, screen)
+    return _fixtures['food']
+
+
+def _student():
+    """캐릭터 옮기기 게임 객체 (캐릭터/폰트/UI 캐시 포함)"""
+    if 'student' not in _fixtures:
+        _headless()
+        import student_moving_game as student
+        from bgm_player import get_player
+
+        photobooth = student.HandTrackingPixelPhotobooth()
+        get_player().stop()
+        photobooth.update_font_sizes(1.0)
+        _fixtures['student'] = photobooth
+    return _fixtures['student']
+
+
+def _camera_frame(width=640, height=480):
+    """카메라 프레임 대신 쓰는 고정 입력 (부드러운 그라데이션 + 잡음)"""
+    rng = np.random.default_rng(0)
+    ys, xs = np.mgrid[0:height, 0:width]
+    base = np.stack([xs * 255 // width, ys * 255 // height, (xs + ys) * 255 // (width + height)], axis=2)
+    return np.clip(base + rng.integers(-20, 20, base.shape), 0, 255).astype(np.uint8)
+
+
+def _hand_landmarks():
+    """손 랜드마크 21개 (MediaPipe 결과와 같은 .x/.y/.z 객체)"""
+    from landmark_log import LandmarkList
+
+    rng = np.random.default_rng(1)
+    return LandmarkList(np.column_stack([rng.uniform(0.3, 0.7, 21), rng.uniform(0.3, 0.7, 21),
+                                         np.zeros(21)]).tolist()).landmark
+
+
+# ----------------------------------------------------------------------------
+# 측정 대상
+# ----------------------------------------------------------------------------
+
+@case('food.apply_beautify_filter')
+def _beautify():
+    food, _ = _food()
+    frame = _camera_frame()
+    return lambda: food.apply_beautify_filter(frame)
+
+
+@case('food.frame_to_surface')
+def _frame_to_surface():
+    food, _ = _food()
+    frame = _camera_frame()
+    return lambda: food.frame_to_surface(frame)
+
+
+@case('food.draw_hand_skeleton')
+def _hand_skeleton():
+    food, screen = _food()
+    landmarks = _hand_landmarks()
+    return lambda: food.draw_hand_skeleton(screen, landmarks)
+
+
+@case('food.draw_particles')
+def _food_particles():
+    import random
+
+    food, screen = _food()
+    random.seed(0)
+    np.random.seed(0)
+    game_state = food.GameState()
+    for i in range(6):
+        game_state.create_heart_particles(100 + i * 80, 300 + (i % 2) * 100)  # 하트 60 + 반짝이 90개
+    return lambda: game_state.draw_particles(screen, 0.5)
+
+
+@case('food.check_food_collision')
+def _food_collision():
+    import random
+
+    food, _ = _food()
+    random.seed(0)
+    game_state = food.GameState()
+    game_state.mouth_open = True
+    mouth = (300, 400)
+    # 입 주변 끌어당김 반경 안(먹히지는 않는 거리)과 밖에 음식 배치
+    rng = np.random.default_rng(2)
+    for i in range(24):
+        angle = rng.uniform(0, 2 * np.pi)
+        distance = 120 + i * 15
+        game_state.foods.spawn(mouth[0] + np.cos(angle) * distance, mouth[1] + np.sin(angle) * distance,
+                               i % 7 + 1, 5.0)
+    store = game_state.foods
+    n = store.count
+    x0, y0 = store.x[:n].copy(), store.y[:n].copy()
+
+    def run():
+        store.x[:n] = x0   # 끌려간 위치 되돌리기 (매번 같은 입력)
+        store.y[:n] = y0
+        game_state.check_food_collision(mouth)
+    return run
+
+
+@case('student.blend_sprite')
+def _blend_sprite():
+    from sprite_bank import blend_sprite
+
+    photobooth = _student()
+    frame = _camera_frame(600, 800)
+    char_id = photobooth.character_images[0]['id']
+    sprite = photobooth.sprite_bank.get(char_id, 3.0)
+    return lambda: blend_sprite(frame, sprite, 200, 300)
+
+
+@case('student.draw_character')
+def _draw_character():
+    photobooth = _student()
+    frame = _camera_frame(600, 800)
+    character = {'char_id': photobooth.character_images[0]['id'], 'scale': 3.0,
+                 'x': 200, 'y': 300, 'rotation': 10}
+    return lambda: photobooth.draw_character(frame, character)
+
+
+@case('student.draw_ui')
+def _draw_ui():
+    photobooth = _student()
+    photobooth.game_state = "waiting"   # 시간 표시가 고정 → 캐시된 레이어 합성만
+    frame = _camera_frame(600, 800)
+    photobooth.draw_ui(frame)
+    return lambda: photobooth.draw_ui(frame)
+
+
+@case('student.draw_ui_changed')
+def _draw_ui_changed():
+    photobooth = _student()
+    photobooth.game_state = "waiting"
+    frame = _camera_frame(600, 800)
+
+    def run():
+        photobooth.score += 1   # 점수가 바뀐 프레임 → 레이어 다시 그림
+        photobooth.draw_ui(frame)
+    return run
+
+
+# ----------------------------------------------------------------------------
+# 측정 / 비교
+# ----------------------------------------------------------------------------
+
+def measure(fn, min_time=MIN_TIME, repeats=REPEATS):
+    """호출당 시간(µs): 반복 측정의 최솟값 / 중앙값 (측정 중에는 timeit처럼 GC 끔)"""
+    fn()  # 지연 초기화/캐시 채우기
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(fn, min_time, repeats)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure(fn, min_time, repeats):
+    per_repeat = min_time / repeats
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= per_repeat:
+            break
+        number = max(number * 2, int(number * per_repeat / max(elapsed, 1e-9)))
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {'number': number, 'min_us': min(samples), 'median_us': statistics.median(samples)}
+
+
+def machine_id():
+    """결과 파일 이름용 컴퓨터 식별자 (호스트-CPU-파이썬 버전)"""
+    raw = f"{platform.node()}-{platform.machine()}-py{sys.version_info[0]}.{sys.version_info[1]}"
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", raw)
+
+
+def run(names):
+    results = {}
+    for name in names:
+        with contextlib.redirect_stdout(io.StringIO()):  # 게임 초기화 메시지 숨김
+            fn = CASES[name]()
+        results[name] = measure(fn)
+        print(f"  {name:<30} {results[name]['min_us']:>10.1f}µs", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance=None):
+    """기준 대비 느려진 함수 목록 [(이름, 기준 µs, 현재 µs, 허용 범위)]"""
+    regressions = []
+    print(f"\n{'함수':<30} {'기준(µs)':>10} {'현재(µs)':>10} {'변화':>8}")
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            print(f"{name:<30} {'-':>10} {result['min_us']:>10.1f}   (새 항목)")
+            continue
+        limit = tolerance if tolerance is not None else TOLERANCES.get(name, DEFAULT_TOLERANCE)
+        change = result['min_us'] / base['min_us'] - 1.0
+        mark = ""
+        if change > limit:
+            regressions.append((name, base['min_us'], result['min_us'], limit))
+            mark = f"  ❌ 허용 +{limit * 100:.0f}% 초과"
+        print(f"{name:<30} {base['min_us']:>10.1f} {result['min_us']:>10.1f} {change * 100:>+7.1f}%{mark}")
+    return regressions
+
+
+def save(path, results, previous=None):
+    report = {
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'revision': git_revision(),
+        'machine': machine_id(),
+        'platform': platform.platform(),
+        'python': sys.version.split()[0],
+        'results': dict((previous or {}).get('results', {}), **results),
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="핫 패스 마이크로벤치마크 (기준보다 느려지면 종료 코드 1)")
+    parser.add_argument("--only", nargs="*", help="측정할 함수 (기본: 전체)")
+    parser.add_argument("--list", action="store_true", help="측정 대상 목록")
+    parser.add_argument("--update", action="store_true", help="결과를 이 컴퓨터의 새 기준으로 저장")
+    parser.add_argument("--tolerance", type=float, help="허용 범위 (예: 0.15 = 15%%, 기본: 함수별 설정)")
+    parser.add_argument("--baseline", help="기준 파일 (기본: benchmark_reports/micro/<컴퓨터>.json)")
+    args = parser.parse_args()
+
+    if args.list:
+        for name in CASES:
+            print(f"{name:<30} 허용 +{TOLERANCES.get(name, DEFAULT_TOLERANCE) * 100:.0f}%")
+        return
+    names = args.only or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"알 수 없는 측정 대상: {', '.join(unknown)}")
+
+    path = args.baseline or os.path.join(REPORT_DIR, f"{machine_id()}.json")
+    baseline = None
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(f"⏱️ 마이크로벤치마크 ({machine_id()})")
+    results = run(names)
+
+    if baseline is None or args.update:
+        save(path, results, baseline)
+        print(f"\n💾 기준 저장: {path}")
+        return
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)}개 함수가 기준({baseline.get('revision')})보다 느려졌습니다")
+        sys.exit(1)
+    print(f"\n✅ 모든 함수가 허용 범위 안입니다 (기준 {baseline.get('revision')}, {baseline.get('created')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+벡터화 파티클 시스템 (두 게임 공용)
+- 위치/속도/수명/크기/색상을 미리 할당한 NumPy 배열(SoA)에 보관
+- 이동과 제거를 한 번의 배열 연산으로 처리 (list.remove 없음)
+- 여러 개를 한 번에 생성하는 배치 이미터
+- pygame / OpenCV 그리기 어댑터
+"""
+
+import cv2
+import numpy as np
+import pygame
+
+HEART = 'heart'
+SPARKLE = 'sparkle'
+
+
+def _sample(rng, value, n, integer=False):
+    """스칼라면 그대로, (최소, 최대) 범위면 n개 난수 생성 (정수는 최대값 포함)"""
+    if isinstance(value, (tuple, list)):
+        low, high = value
+        if integer:
+            return rng.integers(low, high + 1, size=n)
+        return rng.uniform(low, high, size=n)
+    return np.full(n, value)
+
+
+class ParticleSystem:
+    def __init__(self, capacity=1024, shape=SPARKLE, min_y=None, seed=None):
+        """capacity개 파티클 배열을 미리 할당 (min_y보다 위로 나간 파티클은 제거)"""
+        self.capacity = capacity
+        self.shape = shape
+        self.min_y = min_y
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)  # 이전 스텝 위치 (렌더링 보간용)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.count = 0
+        self.dropped = 0  # 용량 초과로 생성하지 못한 파티클 수
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, n, x, y, offset_x=0, offset_y=0, vx=0, vy=0,
+             size=(3, 8), color=(255, 255, 255), life=None):
+        """파티클 n개를 한 번에 생성
+
+        x, y, offset, 속도, 크기는 스칼라 또는 (최소, 최대) 범위,
+        color는 채널별 스칼라 또는 범위, life=None이면 화면 밖으로 나갈 때까지 유지
+        """
+        requested = n
+        n = min(n, self.capacity - self.count)
+        self.dropped += requested - max(n, 0)
+        if n <= 0:
+            return 0
+
+        start, end = self.count, self.count + n
+        rng = self.rng
+        self.x[start:end] = _sample(rng, x, n, integer=True) + _sample(rng, offset_x, n, integer=True)
+        self.y[start:end] = _sample(rng, y, n, integer=True) + _sample(rng, offset_y, n, integer=True)
+        self.vx[start:end] = _sample(rng, vx, n)
+        self.vy[start:end] = _sample(rng, vy, n)
+        self.size[start:end] = _sample(rng, size, n, integer=True)
+        for channel in range(3):
+            self.color[start:end, channel] = _sample(rng, color[channel], n, integer=True)
+        self.life[start:end] = np.inf if life is None else life
+        self.prev_x[start:end] = self.x[start:end]
+        self.prev_y[start:end] = self.y[start:end]
+
+        self.count = end
+        return n
+
+    def update(self):
+        """전체 파티클 이동 + 수명 감소 + 제거를 벡터 연산으로 처리 (고정 스텝 1회)"""
+        n = self.count
+        if n == 0:
+            return
+
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        if self.min_y is not None:
+            alive &= self.y[:n] >= self.min_y
+        if alive.all():
+            return
+
+        # 살아있는 파티클을 배열 앞쪽으로 모음 (순서 유지)
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        for arr in (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.life, self.size, self.color):
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def clear(self):
+        """모든 파티클 제거"""
+        self.count = 0
+
+    def snapshot(self, alpha=1.0):
+        """그리기용 정수 좌표/크기/색상 리스트 반환 (alpha로 이전/현재 위치 보간)"""
+        n = self.count
+        if alpha >= 1.0:
+            x, y = self.x[:n], self.y[:n]
+        else:
+            x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+            y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        return (x.astype(np.int32).tolist(),
+                y.astype(np.int32).tolist(),
+                self.size[:n].tolist(),
+                self.color[:n].tolist())
+
+
+class PygameParticleRenderer:
+    """pygame용 어댑터: 모양별 스탬프 Surface를 캐시하고 Surface.blits() 한 번으로 그림"""
+
+    def __init__(self, max_stamps=512):
+        self.stamps = {}
+        self.max_stamps = max_stamps
+
+    def get_stamp(self, shape, size, color):
+        """(모양, 크기, 색상) 스탬프 Surface 반환 (색상은 8단계로 양자화해 캐시)"""
+        color = (color[0] & 0xF8, color[1] & 0xF8, color[2] & 0xF8)
+        key = (shape, size, color)
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            return stamp
+
+        if len(self.stamps) >= self.max_stamps:
+            self.stamps.clear()
+
+        c = size + 1  # 스탬프 중심 (파티클 좌표가 놓이는 지점)
+        stamp = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        if shape == HEART:
+            # 왼쪽 원, 오른쪽 원, 하단 삼각형
+            pygame.draw.circle(stamp, color, (c - size//3, c - size//3), size//2)
+            pygame.draw.circle(stamp, color, (c + size//3, c - size//3), size//2)
+            pygame.draw.polygon(stamp, color, [(c, c + size//2), (c - size//2, c), (c + size//2, c)])
+        else:
+            # 별 모양
+            pygame.draw.line(stamp, color, (c - size, c), (c + size, c), 2)
+            pygame.draw.line(stamp, color, (c, c - size), (c, c + size), 2)
+            pygame.draw.line(stamp, color, (c - size//2, c - size//2), (c + size//2, c + size//2), 1)
+            pygame.draw.line(stamp, color, (c + size//2, c - size//2), (c - size//2, c + size//2), 1)
+
+        self.stamps[key] = (stamp, c)
+        return self.stamps[key]
+
+    def draw(self, system, screen, alpha=1.0):
+        """파티클 시스템 전체를 한 번의 blits 호출로 그림"""
+        if system.count == 0:
+            return
+        xs, ys, sizes, colors = system.snapshot(alpha)
+        shape = system.shape
+        blit_list = []
+        for x, y, size, color in zip(xs, ys, sizes, colors):
+            stamp, c = self.get_stamp(shape, size, color)
+            blit_list.append((stamp, (x - c, y - c)))
+        screen.blits(blit_list, doreturn=False)
+
+
+class OpenCVParticleRenderer:
+    """OpenCV용 어댑터: 배열을 한 번에 리스트로 꺼내 cv2 도형으로 그림"""
+
+    def draw(self, system, frame, alpha=1.0):
+        """파티클 시스템 전체를 BGR 프레임에 그림"""
+        if system.count == 0:
+            return
+
+        xs, ys, sizes, colors = system.snapshot(alpha)
+        if system.shape == HEART:
+            for x, y, size, color in zip(xs, ys, sizes, colors):
+                color = tuple(color)
+                # 하트의 두 원과 삼각형 부분
+                cv2.circle(frame, (x - size//3, y - size//3), size//2, color, -1)
+                cv2.circle(frame, (x + size//3, y - size//3), size//2, color, -1)
+                triangle = np.array([[x, y + size//2],
+                                     [x - size//2, y],
+                                     [x + size//2, y]], np.int32)
+                cv2.fillPoly(frame, [triangle], color)
+        else:
+            for x, y, size, color in zip(xs, ys, sizes, colors):
+                color = tuple(color)
+                # 십자 모양의 별
+                cv2.line(frame, (x - size, y), (x + size, y), color, 2)
+                cv2.line(frame, (x, y - size), (x, y + size), color, 2)
+                cv2.line(frame, (x - size//2, y - size//2), (x + size//2, y + size//2), color, 1)
+                cv2.line(frame, (x + size//2, y - size//2), (x - size//2, y + size//2), color, 1)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+녹화 영상 기반 게임 파이프라인 벤치마크 (화면 없이 최대 속도)
+- 게임(음식/캐릭터)을 새 프로세스로 실행해서 카메라 대신 녹화 영상(CAMERA_CLIP)을 넣고
+  카메라 → 필터 → MediaPipe → 게임 로직 → 그리기 → 화면 출력 전체 과정을 FPS 제한 없이 반복
+- 창 없음: SDL_VIDEODRIVER/SDL_AUDIODRIVER=dummy, OpenCV 프레젠터는 PRESENTER_HEADLESS=1
+- 시작 화면(하트 제스처)은 건너뛰고 바로 게임 진행 (GAME_AUTOSTART=1), 점수는 임시 디렉터리에 저장
+- 측정: 처리량(FPS), 프레임/단계별 p50/p95/p99, 최대 RSS, 프레임당 최대 할당량
+  (할당량은 tracemalloc 때문에 느려지므로 같은 영상을 한 번 더 실행해서 따로 측정)
+- 결과는 JSON 보고서로 저장하고 --compare로 이전 보고서와 비교
+
+    python pipeline_benchmark.py --clip clips/hands.mp4
+    python pipeline_benchmark.py --games food --clip clips/a.mp4 clips/b.mp4 --loops 3
+    python pipeline_benchmark.py --clip clips/hands.mp4 --compare benchmark_reports/pipeline_old.json
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from startup_profile import git_revision
+
+GAMES = {
+    'food': "food_eating_game.py",
+    'student': "student_moving_game.py",
+}
+
+
+def run_game(game, clip, loops=1, frames=None, warmup=30, alloc=False, preload=False, timeout=600.0):
+    """게임 하나를 녹화 영상으로 끝까지 실행하고 프레임 프로파일러 보고서 반환 (실패하면 None)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    fd, out_path = tempfile.mkstemp(suffix=".json", prefix="pipeline_")
+    os.close(fd)
+    score_dir = tempfile.mkdtemp(prefix="pipeline_scores_")
+    env = os.environ.copy()
+    env.update({
+        'SDL_VIDEODRIVER': "dummy",
+        'SDL_AUDIODRIVER': "dummy",
+        'PRESENTER_HEADLESS': "1",
+        'CAMERA_CLIP': os.path.abspath(clip),
+        'CAMERA_CLIP_LOOPS': str(loops),
+        'CAMERA_CLIP_PRELOAD': "1" if preload else "0",
+        'CAMERA_INDEX': "0",          # USB 카메라 자동 감지 생략
+        'FRAME_RATE_LIMIT': "0",
+        'FRAME_PROFILE': "1",
+        'FRAME_PROFILE_WINDOW': "1000000",
+        'FRAME_PROFILE_WARMUP': str(warmup),
+        'FRAME_PROFILE_ALLOC': "1" if alloc else "0",
+        'FRAME_PROFILE_OUT': out_path,
+        'GAME_AUTOSTART': "1",
+        'SCORE_DIR': score_dir,
+        'VENV_CHECK': "0",
+    })
+    env.pop('FRAME_HUD', None)
+    env.pop('STARTUP_PROFILE_OUT', None)
+    if frames:
+        env['CAMERA_CLIP_FRAMES'] = str(frames)
+    else:
+        env.pop('CAMERA_CLIP_FRAMES', None)
+
+    try:
+        proc = subprocess.run([sys.executable, GAMES[game]], env=env, cwd=root,
+                              stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True, timeout=timeout)
+        if proc.returncode != 0:
+            print(f"[!] {game} 종료 코드 {proc.returncode}\n{proc.stderr[-2000:]}")
+        with open(out_path, encoding="utf-8") as f:
+            result = json.load(f)
+    except subprocess.TimeoutExpired:
+        print(f"[!] {game}: {timeout:.0f}초 안에 끝나지 않았습니다")
+        result = None
+    except (OSError, ValueError):
+        result = None
+    finally:
+        os.remove(out_path)
+        shutil.rmtree(score_dir, ignore_errors=True)
+    if result is not None and result['frames'] == 0:
+        print(f"[!] {game}: 측정된 프레임이 없습니다 (영상이 워밍업 {warmup}프레임보다 짧음?)")
+        return None
+    return result
+
+
+def benchmark(games, clips, loops=1, frames=None, warmup=30, alloc=True, preload=False, timeout=600.0):
+    """게임 × 영상 조합별 보고서 생성"""
+    report = {
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.node(),
+        'settings': {'loops': loops, 'frames': frames, 'warmup': warmup, 'preload': preload},
+        'results': {},
+    }
+    for game in games:
+        for clip in clips:
+            key = f"{game}:{os.path.basename(clip)}"
+            print(f"⏱️ {key} 측정 중...")
+            result = run_game(game, clip, loops, frames, warmup, alloc=False, preload=preload, timeout=timeout)
+            if result is None:
+                continue
+            if alloc:
+                print(f"   {key} 메모리 할당 측정 중...")
+                traced = run_game(game, clip, loops, frames, warmup, alloc=True, preload=preload, timeout=timeout)
+                result['alloc_kb'] = traced['alloc_kb'] if traced else None
+            report['results'][key] = {
+                'game': game,
+                'clip': clip,
+                'frames': result['frames'],
+                'throughput_fps': result['throughput_fps'],
+                'frame': result['frame'],
+                'stages': result['stages'],
+                'rates': result['rates'],
+                'peak_rss_mb': result['peak_rss_mb'],
+                'alloc_kb': result['alloc_kb'],
+            }
+    return report
+
+
+def _diff(value, base):
+    """이전 값 대비 변화율 (%)"""
+    if value is None or not base:
+        return ""
+    return f" ({(value - base) / base * 100:+.1f}%)"
+
+
+def print_report(report, baseline=None):
+    """보고서 표 출력 (baseline이 있으면 같은 게임:영상 결과와의 변화율 표시)"""
+    for key, result in report['results'].items():
+        base = (baseline or {}).get('results', {}).get(key)
+        frame = result['frame'] or {}
+        base_frame = (base or {}).get('frame') or {}
+        print(f"\n[{key}] {result['frames']}프레임, 처리량 {result['throughput_fps']:.1f} FPS"
+              f"{_diff(result['throughput_fps'], (base or {}).get('throughput_fps'))}")
+        print(f"  프레임 p50 {frame.get('p50_ms', 0):.2f}ms / p95 {frame.get('p95_ms', 0):.2f}ms"
+              f"{_diff(frame.get('p95_ms'), base_frame.get('p95_ms'))} / p99 {frame.get('p99_ms', 0):.2f}ms")
+        rss = result['peak_rss_mb']
+        alloc = result['alloc_kb']
+        rss_text = "-" if rss is None else f"{rss:.0f}MB{_diff(rss, (base or {}).get('peak_rss_mb'))}"
+        alloc_text = "-" if alloc is None else f"평균 {alloc['avg']:.0f}KB / p95 {alloc['p95']:.0f}KB"
+        print(f"  최대 RSS {rss_text}, 프레임당 할당 {alloc_text}")
+        print(f"  {'단계':<12} {'p50':>8} {'p95':>8} {'p99':>8}")
+        base_stages = (base or {}).get('stages', {})
+        for name, s in result['stages'].items():
+            line = f"  {name:<12} {s['p50_ms']:8.2f} {s['p95_ms']:8.2f} {s['p99_ms']:8.2f}"
+            if name in base_stages:
+                line += _diff(s['p95_ms'], base_stages[name]['p95_ms'])
+            print(line)
+        if result['rates']:
+            print("  " + ", ".join(f"{name} {rate:.1f}/s" for name, rate in result['rates'].items()))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="녹화 영상으로 게임 전체 파이프라인 성능 측정 (화면 없음)")
+    parser.add_argument("--clip", nargs="+", required=True, help="카메라 대신 넣을 녹화 영상")
+    parser.add_argument("--games", nargs="*", choices=sorted(GAMES), default=list(GAMES),
+                        help="측정할 게임 (기본: 전체)")
+    parser.add_argument("--loops", type=int, default=1, help="영상 반복 횟수")
+    parser.add_argument("--frames", type=int, help="최대 프레임 수 (워밍업 포함)")
+    parser.add_argument("--warmup", type=int, default=30, help="측정에서 뺄 처음 프레임 수")
+    parser.add_argument("--preload", action="store_true",
+                        help="영상을 미리 메모리에 디코딩 (capture 단계에서 디코딩 시간 제외, RSS 증가)")
+    parser.add_argument("--no-alloc", action="store_true", help="메모리 할당 측정(추가 실행) 생략")
+    parser.add_argument("--timeout", type=float, default=600.0, help="실행 한 번의 최대 시간(초)")
+    parser.add_argument("--out", help="보고서 경로 (기본: benchmark_reports/pipeline_<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 보고서")
+    args = parser.parse_args()
+
+    for clip in args.clip:
+        if not os.path.exists(clip):
+            parser.error(f"영상 파일이 없습니다: {clip}")
+
+    report = benchmark(args.games, args.clip, max(1, args.loops), args.frames, max(0, args.warmup),
+                       alloc=not args.no_alloc, preload=args.preload, timeout=args.timeout)
+    out = args.out or os.path.join("benchmark_reports", f"pipeline_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    if os.path.dirname(out):
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    print(f"\n💾 보고서 저장: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+필요할 때 켜는 샘플링 프로파일러 (키오스크에서 버벅일 때 외부 도구 없이 원인 확인)
+- 백그라운드 스레드가 일정 주기(기본 100Hz)로 sys._current_frames()를 읽어서
+  메인 스레드와 작업 스레드(추론/프레젠터/오디오 등)의 호출 스택을 모음
+- 게임 코드에 측정 코드를 넣지 않아서 꺼져 있을 때 비용 0, 켜져 있을 때도 샘플링 스레드 하나만 동작
+- 켜기/끄기: SIGUSR1 신호 (kill -USR1 <pid>) 또는 단축키 (음식 게임/런처 F9, 캐릭터 게임 F)
+- 끄면 스레드별 스택을 파일로 저장
+  .folded      접힌 스택 (flamegraph.pl, speedscope, inferno 등에서 바로 열림)
+  .speedscope.json  speedscope (https://www.speedscope.app) 파일, 스레드별 프로파일
+
+    SAMPLE_PROFILE=1            시작부터 샘플링 (종료 시 저장)
+    SAMPLE_PROFILE_HZ=100       초당 샘플 수
+    SAMPLE_PROFILE_DIR=profiles 저장 위치
+    SAMPLE_PROFILE_FORMAT=both  collapsed / speedscope / both
+"""
+
+import atexit
+import collections
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+DEFAULT_HZ = 100
+MAX_DEPTH = 128            # 재귀가 깊어도 스택 하나가 너무 길어지지 않게 제한
+FORMATS = ('collapsed', 'speedscope', 'both')
+
+
+class SamplingProfiler:
+    def __init__(self, hz=DEFAULT_HZ, out_dir="profiles", fmt='both', name="game"):
+        self.interval = 1.0 / max(1.0, hz)
+        self.out_dir = out_dir
+        self.fmt = fmt if fmt in FORMATS else 'both'
+        self.name = name
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.samples = collections.Counter()  # (스레드 이름, 스택 튜플) → 샘플 수
+        self.labels = {}                      # (코드 객체, 줄) → "함수 (파일:줄)" (매 샘플마다 문자열을 만들지 않게)
+        self.thread_names = {}
+        self.started = 0.0
+        self.sample_count = 0
+        self.last_paths = []
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        with self.lock:
+            if self.running:
+                return False
+            self.samples.clear()
+            self.sample_count = 0
+            self.stop_event.clear()
+            self.started = time.perf_counter()
+            self.thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self.thread.start()
+        print(f"🔥 샘플링 프로파일러 시작 ({1.0 / self.interval:.0f}Hz)")
+        return True
+
+    def stop(self, wait=True):
+        """샘플링을 멈추고 저장 (신호 처리기에서는 wait=False: 저장은 샘플링 스레드가 마무리)"""
+        with self.lock:
+            if not self.running:
+                return False
+            self.stop_event.set()
+            thread = self.thread
+        if wait:
+            thread.join()
+        return True
+
+    def toggle(self):
+        if self.running:
+            self.stop(wait=False)
+            return False
+        return self.start()
+
+    def _run(self):
+        own = threading.get_ident()
+        next_time = time.perf_counter()
+        while not self.stop_event.is_set():
+            self._sample(own)
+            # 샘플링이 늦어져도 밀린 샘플을 한꺼번에 찍지 않고 다음 주기부터 다시 맞춤
+            next_time = max(next_time + self.interval, time.perf_counter())
+            self.stop_event.wait(next_time - time.perf_counter())
+        duration = time.perf_counter() - self.started
+        try:
+            self.last_paths = self.save()
+        except OSError as e:
+            print(f"⚠️ 프로파일 저장 실패: {e}")
+            return
+        rate = self.sample_count / duration if duration > 0 else 0.0
+        print(f"🔥 샘플링 프로파일러 종료: {duration:.1f}초, 샘플 {self.sample_count}개 ({rate:.0f}Hz)")
+        for path in self.last_paths:
+            print(f"   💾 {path}")
+
+    def _sample(self, own):
+        frames = sys._current_frames()
+        if any(ident not in self.thread_names for ident in frames if ident != own):
+            self.thread_names = {t.ident: t.name for t in threading.enumerate() if t.ident != own}
+        labels = self.labels
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                # 실행 중인 줄까지 구분 (main()/run() 안의 cv2/MediaPipe 호출처럼 파이썬 프레임이
+                # 없는 단계도 어느 줄에서 시간을 쓰는지 보임)
+                key = (frame.f_code, frame.f_lineno)
+                label = labels.get(key)
+                if label is None:
+                    code = frame.f_code
+                    label = labels[key] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                stack.append(label)
+                frame = frame.f_back
+            stack.reverse()
+            self.samples[(self.thread_names.get(ident, str(ident)), tuple(stack))] += 1
+        self.sample_count += 1
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def collapsed(self):
+        """접힌 스택 줄 목록: "스레드;바깥 함수;...;안쪽 함수 샘플수" """
+        lines = []
+        for (thread, stack), count in sorted(self.samples.items()):
+            frames = ";".join(label.replace(";", ":") for label in stack)
+            lines.append(f"{thread};{frames} {count}")
+        return lines
+
+    def speedscope(self):
+        """speedscope 파일 형식 (스레드마다 sampled 프로파일 하나, 단위 ms)"""
+        frames = []
+        index = {}
+        profiles = {}
+        interval_ms = self.interval * 1000.0
+        for (thread, stack), count in self.samples.items():
+            ids = []
+            for label in stack:
+                if label not in index:
+                    index[label] = len(frames)
+                    frames.append({'name': label})
+                ids.append(index[label])
+            profile = profiles.get(thread)
+            if profile is None:
+                profile = profiles[thread] = {
+                    'type': "sampled", 'name': thread, 'unit': "milliseconds",
+                    'startValue': 0, 'endValue': 0, 'samples': [], 'weights': [],
+                }
+            profile['samples'].append(ids)
+            profile['weights'].append(count * interval_ms)
+            profile['endValue'] += count * interval_ms
+        # 메인 스레드를 먼저 보여줌
+        ordered = sorted(profiles.values(), key=lambda p: (p['name'] != "MainThread", p['name']))
+        return {
+            '$schema': "https://www.speedscope.app/file-format-schema.json",
+            'name': self.name,
+            'exporter': "sampling_profiler.py",
+            'shared': {'frames': frames},
+            'profiles': ordered,
+        }
+
+    def save(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"{self.name}_{time.strftime('%Y%m%d_%H%M%S')}")
+        paths = []
+        if self.fmt in ('collapsed', 'both'):
+            path = base + ".folded"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(self.collapsed()) + "\n")
+            paths.append(path)
+        if self.fmt in ('speedscope', 'both'):
+            path = base + ".speedscope.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.speedscope(), f, ensure_ascii=False)
+            paths.append(path)
+        return paths
+
+    def top(self, count=10, thread="MainThread"):
+        """스레드 안에서 샘플 비중이 큰 함수 (자기 자신 + 호출한 함수 포함)"""
+        totals = collections.Counter()
+        samples = 0
+        for (name, stack), n in self.samples.items():
+            if name != thread:
+                continue
+            samples += n
+            for label in set(stack):
+                totals[label] += n
+        return [(label, n / samples) for label, n in totals.most_common(count)] if samples else []
+
+
+_sampler = None
+
+
+def _on_signal(signum, frame):
+    _sampler.toggle()
+
+
+def get_sampler(name=None):
+    """프로세스 공용 샘플링 프로파일러 (처음 부를 때 SIGUSR1 처리기 등록)"""
+    global _sampler
+    if _sampler is None:
+        _sampler = SamplingProfiler(hz=float(os.environ.get('SAMPLE_PROFILE_HZ', DEFAULT_HZ)),
+                                    out_dir=os.environ.get('SAMPLE_PROFILE_DIR', "profiles"),
+                                    fmt=os.environ.get('SAMPLE_PROFILE_FORMAT', 'both'),
+                                    name=name or os.path.splitext(os.path.basename(sys.argv[0]))[0] or "game")
+        # 신호 처리기는 메인 스레드에서만 등록 가능, Windows에는 SIGUSR1이 없음
+        if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, _on_signal)
+        atexit.register(_sampler.stop)
+        if os.environ.get('SAMPLE_PROFILE') == '1':
+            _sampler.start()
+    return _sampler
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="접힌 스택(.folded) 파일 요약")
+    parser.add_argument("path", help=".folded 파일")
+    parser.add_argument("--thread", default="MainThread", help="요약할 스레드 이름")
+    parser.add_argument("--top", type=int, default=15, help="표시할 함수 수")
+    args = parser.parse_args()
+
+    profiler = SamplingProfiler()
+    with open(args.path, encoding="utf-8") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if not stack:
+                continue
+            thread, *frames = stack.split(";")
+            profiler.samples[(thread, tuple(frames))] += int(count)
+    threads = collections.Counter()
+    for (thread, _), n in profiler.samples.items():
+        threads[thread] += n
+    print("스레드별 샘플: " + ", ".join(f"{name} {n}" for name, n in threads.most_common()))
+    print(f"\n[{args.thread}] 샘플 비중 (호출한 함수 포함)")
+    for label, share in profiler.top(args.top, args.thread):
+        print(f"  {share * 100:5.1f}%  {label}")
+
+
+if __name__ == "__main__":
+    main()
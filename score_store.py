@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+점수 저장소 (게임별 최고 점수 + 세션 기록)
+- 최고 점수는 메모리에 캐시해 두고 게임 루프에서는 읽기/갱신만 함 (파일 I/O 없음)
+- 파일 쓰기는 백그라운드 스레드에서: 임시 파일에 쓰고 fsync 후 rename (쓰다가 꺼져도 파일이 깨지지 않음)
+- 쓸 때 파일을 다시 읽어서 게임별 값 중 큰 쪽을 남김 → 다른 게임(프로세스)의 최고 점수를 덮어쓰지 않음
+- 게임이 끝날 때마다 score_history.jsonl에 한 줄씩 추가 → 날짜별 순위표
+
+high_score.json 키 (기존 파일과 호환):
+    student  → "high_score"
+    food     → "food_eating_high_score"
+
+SCORE_DIR=경로 로 설정하면 두 파일을 그 디렉터리에 저장 (벤치마크가 실제 점수를 건드리지 않도록)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from tracing import get_tracer
+
+HIGH_SCORE_FILE = "high_score.json"
+HISTORY_FILE = "score_history.jsonl"
+
+# 게임 이름 → high_score.json 키
+GAME_KEYS = {
+    'student': "high_score",
+    'food': "food_eating_high_score",
+}
+
+
+def game_key(game):
+    return GAME_KEYS.get(game, f"{game}_high_score")
+
+
+def read_json(path):
+    """JSON 파일 읽기 (없거나 깨졌으면 빈 dict)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_atomic(path, data):
+    """임시 파일 → fsync → rename 순서로 JSON 저장"""
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if hasattr(os, "O_DIRECTORY"):
+        # rename 자체도 디스크에 남도록 디렉터리 fsync (POSIX)
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class ScoreStore:
+    def __init__(self, path=HIGH_SCORE_FILE, history_path=HISTORY_FILE):
+        self.path = path
+        self.history_path = history_path
+        self.tracer = get_tracer()
+        self.data = read_json(path)   # high_score.json 전체 (모르는 키도 보존)
+        self.history = None           # 처음 순위표를 볼 때 파일에서 읽음
+        self.lock = threading.Lock()
+        self.io_lock = threading.Lock()  # 기록 파일 추가 ↔ 순위표용 읽기
+
+        # 백그라운드 쓰기 대기열
+        self.dirty = False
+        self.pending_history = []
+        self.writing_history = []         # 파일에 추가하는 중인 기록
+        self.wake = threading.Event()
+        self.idle = threading.Event()
+        self.idle.set()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+        self.thread.start()
+        self.write_errors = 0
+
+    def get_high_score(self, game):
+        with self.lock:
+            return int(self.data.get(game_key(game), 0))
+
+    def submit(self, game, score, **extra):
+        """게임 결과 기록 (새 최고 점수면 True) - 파일 쓰기는 백그라운드에서"""
+        now = time.time()
+        record = {'game': game, 'score': int(score), 'time': round(now, 3),
+                  'date': time.strftime("%Y-%m-%d", time.localtime(now))}
+        record.update(extra)
+        key = game_key(game)
+        with self.lock:
+            new_record = score > self.data.get(key, 0)
+            if new_record:
+                self.data[key] = int(score)
+                self.dirty = True
+            self.pending_history.append(record)
+            if self.history is not None:
+                self.history.append(record)
+            self.idle.clear()
+        self.wake.set()
+        return new_record
+
+    def leaderboard(self, game, day=None, limit=10):
+        """하루(기본: 오늘) 동안의 기록을 점수 높은 순으로 limit개 (같은 점수면 먼저 낸 기록이 위)"""
+        day = day or time.strftime("%Y-%m-%d")
+        with self.io_lock:
+            with self.lock:
+                if self.history is None:
+                    # 파일 + 아직 파일에 안 쓴 기록 (이후 기록은 submit에서 바로 추가)
+                    self.history = self._read_history() + self.writing_history + self.pending_history
+                records = [r for r in self.history if r.get('game') == game and r.get('date') == day]
+        records.sort(key=lambda r: (-r['score'], r['time']))
+        return records[:limit]
+
+    def _read_history(self):
+        records = []
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # 쓰다가 끊긴 마지막 줄
+        except OSError:
+            pass
+        return records
+
+    def flush(self, timeout=2.0):
+        """대기 중인 쓰기가 끝날 때까지 기다림 (다 썼으면 True)"""
+        self.wake.set()
+        return self.idle.wait(timeout)
+
+    def close(self, timeout=2.0):
+        self.flush(timeout)
+        self.stop_event.set()
+        self.wake.set()
+        self.thread.join(timeout)
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            self.wake.wait()
+            self.wake.clear()
+            with self.lock:
+                dirty, self.dirty = self.dirty, False
+                records, self.pending_history = self.pending_history, []
+                self.writing_history = records
+                scores = dict(self.data)
+            try:
+                with self.tracer.span("score.write"):
+                    if records:
+                        self._append_history(records)
+                    if dirty:
+                        self._write_scores(scores)
+            except OSError as e:
+                self.write_errors += 1
+                print(f"[!] 점수 저장 실패: {e}")
+            with self.lock:
+                if not self.dirty and not self.pending_history:
+                    self.idle.set()
+
+    def _append_history(self, records):
+        with self.io_lock:
+            try:
+                with open(self.history_path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+                    f.flush()
+                    os.fsync(f.fileno())
+            finally:
+                self.writing_history = []
+
+    def _write_scores(self, scores):
+        """파일의 최신 값과 합쳐서 저장 (다른 프로세스가 올린 점수는 유지)"""
+        merged = read_json(self.path)
+        for key, value in scores.items():
+            if key not in merged:
+                merged[key] = value
+            elif isinstance(value, (int, float)) and isinstance(merged[key], (int, float)):
+                merged[key] = max(merged[key], value)
+        write_json_atomic(self.path, merged)
+        with self.lock:
+            for key, value in merged.items():
+                if isinstance(value, (int, float)) and value > self.data.get(key, 0):
+                    self.data[key] = value
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """프로세스 공용 점수 저장소 (종료 시 남은 쓰기 마무리)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            directory = os.environ.get('SCORE_DIR', "")
+            _store = ScoreStore(os.path.join(directory, HIGH_SCORE_FILE), os.path.join(directory, HISTORY_FILE))
+            atexit.register(_store.close)
+        return _store
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+고정 타임스텝 시뮬레이션 시계
+- 실제 경과 시간을 누적(accumulator)해서 고정 간격(기본 1/60초) 단위로 시뮬레이션 진행
+- 렌더링 FPS나 카메라 FPS가 떨어져도 게임 속도는 그대로 유지
+- 남은 누적 시간 비율(alpha)로 이전/현재 상태 사이를 보간해서 그림
+"""
+
+import time
+
+
+class FixedTimestep:
+    def __init__(self, step=1.0 / 60.0, max_steps=8, time_fn=time.perf_counter):
+        """step: 시뮬레이션 한 스텝 길이(초), max_steps: 한 프레임에서 최대 스텝 수"""
+        self.step = step
+        self.max_steps = max_steps
+        self.time_fn = time_fn
+        self.accumulator = 0.0
+        self.last_time = None
+        self.total_steps = 0
+        self.dropped_time = 0.0  # 너무 밀려서 버린 시간 (초)
+
+    def reset(self):
+        """누적 시간 초기화 (일시정지/재시작 후 한꺼번에 따라잡지 않도록)"""
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def tick(self):
+        """이번 프레임에 실행할 시뮬레이션 스텝 수 반환"""
+        now = self.time_fn()
+        if self.last_time is None:
+            # 첫 프레임은 한 스텝만 진행
+            self.last_time = now
+            self.total_steps += 1
+            return 1
+
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # 심하게 밀린 경우 따라잡기를 포기하고 남은 시간은 버림 (죽음의 나선 방지)
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.step * steps + (self.accumulator % self.step)
+
+        self.accumulator -= steps * self.step
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """렌더링 보간 비율 (0.0 = 이전 스텝 상태, 1.0 = 현재 스텝 상태)"""
+        return min(1.0, self.accumulator / self.step)
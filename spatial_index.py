@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+균일 격자(uniform grid) 공간 인덱스
+- 캐릭터 중심점을 cell_size 크기 칸에 나눠 담음
+- 반경 검색은 주변 칸만 확인하므로 캐릭터 수가 늘어도 검색 비용이 거의 일정
+- 매 프레임 rebuild()로 다시 만들어도 O(N) (정렬 한 번)
+"""
+
+import numpy as np
+
+
+class UniformGrid:
+    def __init__(self, cell_size=100):
+        """cell_size: 칸 크기 (픽셀, 보통 최대 검색 반경과 같게)"""
+        self.cell_size = cell_size
+        self.centers = np.zeros((0, 2), dtype=np.float32)
+        self.items = []
+        self.cells = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def rebuild(self, items, centers):
+        """items와 (N, 2) 중심점 배열로 격자 다시 만들기"""
+        self.items = list(items)
+        self.centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        self.cells = {}
+        if len(self.items) == 0:
+            return
+
+        # 칸 좌표로 정렬한 뒤 같은 칸끼리 묶음
+        cell_xy = np.floor(self.centers / self.cell_size).astype(np.int64)
+        order = np.lexsort((cell_xy[:, 1], cell_xy[:, 0]))
+        sorted_cells = cell_xy[order]
+        boundaries = np.flatnonzero(np.any(np.diff(sorted_cells, axis=0) != 0, axis=1)) + 1
+        for group in np.split(order, boundaries):
+            cx, cy = cell_xy[group[0]]
+            self.cells[(int(cx), int(cy))] = group
+
+    def query_radius(self, x, y, radius):
+        """(x, y)에서 radius 안에 있는 항목 인덱스 배열 (주변 칸만 검사)"""
+        if not self.cells:
+            return np.zeros(0, dtype=np.int64)
+
+        size = self.cell_size
+        x0, x1 = int(np.floor((x - radius) / size)), int(np.floor((x + radius) / size))
+        y0, y1 = int(np.floor((y - radius) / size)), int(np.floor((y + radius) / size))
+        groups = [self.cells[(cx, cy)]
+                  for cx in range(x0, x1 + 1)
+                  for cy in range(y0, y1 + 1)
+                  if (cx, cy) in self.cells]
+        if not groups:
+            return np.zeros(0, dtype=np.int64)
+
+        candidates = np.concatenate(groups)
+        d = self.centers[candidates] - (x, y)
+        inside = (d * d).sum(axis=1) < radius * radius
+        return candidates[inside]
+
+    def nearest(self, x, y, radius, exclude=None):
+        """radius 안에서 가장 가까운 항목 반환 (exclude 함수가 True인 항목은 제외, 없으면 None)"""
+        candidates = self.query_radius(x, y, radius)
+        if len(candidates) == 0:
+            return None
+
+        d = self.centers[candidates] - (x, y)
+        for index in candidates[np.argsort((d * d).sum(axis=1))]:
+            item = self.items[index]
+            if exclude is None or not exclude(item):
+                return item
+        return None
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+캐릭터 스프라이트 뱅크
+- (캐릭터 ID, 배율, 회전 구간)별로 리사이즈/회전한 결과를 한 번만 만들어 캐시
+- 미리 곱한 알파(premultiplied) BGRA를 uint16으로 보관
+- 합성은 프레임 ROI에 직접 정수 연산 (float 변환 없음)
+- 알파가 0/255뿐인 픽셀 아트는 마스크 복사로 더 빠르게 처리
+"""
+
+import collections
+
+import cv2
+import numpy as np
+
+BASE_SIZE = (18, 24)  # 캐릭터 기준 크기 (너비, 높이)
+
+
+class Sprite:
+    __slots__ = ('width', 'height', 'bgr', 'mask', 'premul', 'inv_alpha')
+
+    def __init__(self, bgra):
+        """BGRA 이미지 → 합성용 미리 계산된 배열"""
+        self.height, self.width = bgra.shape[:2]
+        alpha = bgra[:, :, 3]
+        self.bgr = np.ascontiguousarray(bgra[:, :, :3])
+
+        if np.isin(alpha, (0, 255)).all():
+            # 픽셀 아트: 완전 투명/불투명만 있으면 마스크 복사
+            self.mask = np.repeat((alpha == 255)[:, :, None], 3, axis=2)
+            self.premul = None
+            self.inv_alpha = None
+        else:
+            # 반투명 포함: bgr * a (0~65025)와 255 - a를 uint16으로 보관
+            a = alpha.astype(np.uint16)[:, :, None]
+            self.mask = None
+            self.premul = self.bgr.astype(np.uint16) * a
+            self.inv_alpha = np.repeat(255 - a, 3, axis=2)
+
+
+def blend_sprite(frame, sprite, x, y):
+    """스프라이트를 BGR 프레임의 (x, y)에 직접 합성 (화면 밖 부분은 잘라냄)"""
+    frame_h, frame_w = frame.shape[:2]
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(frame_w, x + sprite.width), min(frame_h, y + sprite.height)
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    sx, sy = x0 - x, y0 - y
+    roi = frame[y0:y1, x0:x1]
+    rows = slice(sy, sy + (y1 - y0))
+    cols = slice(sx, sx + (x1 - x0))
+
+    if sprite.mask is not None:
+        np.copyto(roi, sprite.bgr[rows, cols], where=sprite.mask[rows, cols])
+        return
+
+    # out = (bgr * a + frame * (255 - a)) / 255, 최대 65025라 uint16에 들어감
+    acc = roi.astype(np.uint16)
+    acc *= sprite.inv_alpha[rows, cols]
+    acc += sprite.premul[rows, cols]
+    # 정확한 /255 반올림: (v + 128 + ((v + 128) >> 8)) >> 8
+    acc += 128
+    acc += acc >> 8
+    acc >>= 8
+    np.copyto(roi, acc, casting='unsafe')
+
+
+class SpriteBank:
+    def __init__(self, base_size=BASE_SIZE, rotation_step=15, max_entries=256):
+        """rotation_step: 회전 각도 구간(도), max_entries: 캐시할 스프라이트 최대 개수"""
+        self.base_size = base_size
+        self.rotation_step = rotation_step
+        self.max_entries = max_entries
+        self.sources = {}
+        self.cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, char_id, image):
+        """원본 BGRA 이미지 등록 (같은 ID로 다시 등록하면 캐시 무효화)"""
+        if image.shape[2] == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+        self.sources[char_id] = image
+        for key in [k for k in self.cache if k[0] == char_id]:
+            del self.cache[key]
+
+    def rotation_bucket(self, rotation):
+        """회전 각도를 rotation_step 단위로 양자화"""
+        if not rotation:
+            return 0
+        return int(round(rotation / self.rotation_step)) * self.rotation_step % 360
+
+    def get(self, char_id, scale, rotation=0):
+        """(캐릭터, 배율, 회전 구간)에 맞는 스프라이트 반환 (없으면 만들어 캐시)"""
+        width = int(self.base_size[0] * scale)
+        height = int(self.base_size[1] * scale)
+        if width <= 0 or height <= 0:
+            return None
+
+        key = (char_id, width, height, self.rotation_bucket(rotation))
+        sprite = self.cache.get(key)
+        if sprite is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        image = cv2.resize(self.sources[char_id], (width, height), interpolation=cv2.INTER_NEAREST)
+        if key[3]:
+            center = (width // 2, height // 2)
+            rotation_matrix = cv2.getRotationMatrix2D(center, key[3], 1.0)
+            image = cv2.warpAffine(image, rotation_matrix, (width, height))
+
+        sprite = Sprite(image)
+        self.cache[key] = sprite
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return sprite
+
+    def draw(self, frame, char_id, scale, x, y, rotation=0):
+        """캐릭터를 프레임에 합성"""
+        sprite = self.get(char_id, scale, rotation)
+        if sprite is not None:
+            blend_sprite(frame, sprite, int(x), int(y))
+
+    def get_stats(self):
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+def _blend_float(frame, bgra, x, y):
+    """기존 방식 (매번 float64 알파 블렌딩) - 벤치마크 비교용"""
+    h, w = bgra.shape[:2]
+    region = frame[y:y + h, x:x + w]
+    alpha = bgra[:, :, 3:4] / 255.0
+    frame[y:y + h, x:x + w] = (alpha * bgra[:, :, :3] + (1 - alpha) * region).astype(np.uint8)
+
+
+def benchmark(repeat=2000):
+    """스프라이트 크기별 합성 시간 비교 (기존 resize+float 블렌딩 vs 스프라이트 뱅크)"""
+    import time
+
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (800, 600, 3), dtype=np.uint8)
+    source = rng.integers(0, 256, (BASE_SIZE[1], BASE_SIZE[0], 4), dtype=np.uint8)
+    pixel_art = source.copy()
+    pixel_art[:, :, 3] = np.where(pixel_art[:, :, 3] > 127, 255, 0)
+
+    print(f"{'배율':>5} {'크기':>9} {'기존(µs)':>10} {'반투명(µs)':>11} {'픽셀아트(µs)':>13}")
+    for scale in (1.0, 2.0, 3.0, 5.0, 8.0):
+        size = (int(BASE_SIZE[0] * scale), int(BASE_SIZE[1] * scale))
+        bank = SpriteBank()
+        bank.register(1, source)
+        bank.register(2, pixel_art)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            resized = cv2.resize(source, size, interpolation=cv2.INTER_NEAREST)
+            _blend_float(frame, resized, 100, 100)
+        old = (time.perf_counter() - start) / repeat * 1e6
+
+        results = []
+        for char_id in (1, 2):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                bank.draw(frame, char_id, scale, 100, 100)
+            results.append((time.perf_counter() - start) / repeat * 1e6)
+
+        print(f"{scale:>5.1f} {size[0]:>4}x{size[1]:<4} {old:>10.1f} {results[0]:>11.1f} {results[1]:>13.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+시작 시간 프로파일러 + 지연 import
+- 게임 코드에서: step()으로 초기화 단계 시간 기록, lazy_import()로 무거운 모듈을 처음 쓸 때 import,
+  in_background()로 초기화를 병렬 실행, mark_first_frame()으로 첫 프레임까지 걸린 시간 기록
+- 벤치마크: 각 진입점(런처/음식/캐릭터 게임)을 새 프로세스로 여러 번 실행해서
+  import별(-X importtime) / 초기화 단계별 시간과 첫 프레임까지 시간(time-to-first-frame)을 측정
+  첫 실행 = cold (디스크 캐시/__pycache__ 미준비), 나머지 실행의 중앙값 = warm
+- 결과는 JSON 보고서로 저장하고 --compare로 이전 릴리스 보고서와 비교
+
+    python startup_profile.py                      # 전체 진입점 측정 → startup_reports/startup_<시각>.json
+    python startup_profile.py --entries food --runs 5
+    python startup_profile.py --compare startup_reports/startup_old.json
+"""
+
+import atexit
+import concurrent.futures
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+from tracing import get_tracer
+
+PROFILE_OUT_ENV = "STARTUP_PROFILE_OUT"  # 설정되면 첫 프레임 후 보고서를 쓰고 종료
+START_TIME_ENV = "STARTUP_T0"            # 부모 프로세스가 실행 직전에 기록한 시각 (time.time())
+
+ENTRY_POINTS = {
+    'launcher': "game_launcher.py",
+    'food': "food_eating_game.py",
+    'student': "student_moving_game.py",
+}
+
+_t0 = float(os.environ.get(START_TIME_ENV, time.time()))
+_lock = threading.Lock()
+_steps = []          # (이름, 시작 오프셋 ms, 소요 ms, 스레드 이름)
+_lazy_imports = {}   # 모듈 이름 → import 소요 ms
+_first_frame_ms = None
+_executor = None
+
+
+def _elapsed_ms():
+    return (time.time() - _t0) * 1000.0
+
+
+class step:
+    """초기화 단계 시간 기록 (with step("camera"): ...)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.offset = _elapsed_ms()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        get_tracer().complete(self.name, self.start, end - self.start)
+        duration = (end - self.start) * 1000.0
+        with _lock:
+            _steps.append((self.name, self.offset, duration, threading.current_thread().name))
+        return False
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 import하는 모듈 대리 객체"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self._name)
+            with _lock:
+                _lazy_imports.setdefault(self._name, (time.perf_counter() - start) * 1000.0)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name):
+    """import name을 실제 사용 시점까지 미룸 (mp = lazy_import("mediapipe"))"""
+    return LazyModule(name)
+
+
+def in_background(name, fn, *args, **kwargs):
+    """초기화 작업을 백그라운드 스레드에서 실행하고 Future 반환 (.result()로 대기)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
+
+    def run():
+        with step(name):
+            return fn(*args, **kwargs)
+    return _executor.submit(run)
+
+
+def get_report():
+    """지금까지 기록된 시작 시간 정보"""
+    with _lock:
+        return {
+            'first_frame_ms': _first_frame_ms,
+            'steps': [{'name': n, 'start_ms': round(s, 2), 'duration_ms': round(d, 2), 'thread': t}
+                      for n, s, d, t in _steps],
+            'lazy_imports': {k: round(v, 2) for k, v in _lazy_imports.items()},
+        }
+
+
+def _write_report():
+    path = os.environ.get(PROFILE_OUT_ENV)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(get_report(), f)
+
+
+def mark_first_frame():
+    """첫 프레임 표시 시점 기록 (측정 모드면 보고서를 쓰고 바로 종료)"""
+    global _first_frame_ms
+    if _first_frame_ms is not None:
+        return
+    _first_frame_ms = _elapsed_ms()
+    if os.environ.get(PROFILE_OUT_ENV):
+        _write_report()
+        sys.stdout.flush()
+        os._exit(0)  # 게임 루프/스레드 정리 없이 즉시 종료 (측정 전용)
+
+
+if os.environ.get(PROFILE_OUT_ENV):
+    # 첫 프레임 전에 끝나도 (카메라 없음 등) 기록된 단계까지는 보고서로 남김
+    atexit.register(_write_report)
+
+
+# ----------------------------------------------------------------------------
+# 벤치마크 (부모 프로세스)
+# ----------------------------------------------------------------------------
+
+def parse_importtime(stderr, top=15):
+    """-X importtime 출력에서 최상위 import별 누적 시간(ms) 상위 top개"""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or parts[2].startswith("  "):
+            continue  # 다른 모듈 안에서 import된 하위 모듈
+        name = parts[2].strip()
+        imports[name] = imports.get(name, 0.0) + int(parts[1]) / 1000.0
+    ranked = sorted(imports.items(), key=lambda item: -item[1])[:top]
+    return {name: round(ms, 2) for name, ms in ranked}, round(sum(imports.values()), 2)
+
+
+def run_entry(script, timeout=60.0):
+    """진입점 하나를 새 프로세스로 실행해서 첫 프레임까지 측정"""
+    import subprocess
+    import tempfile
+
+    fd, out_path = tempfile.mkstemp(suffix=".json", prefix="startup_")
+    os.close(fd)
+    env = os.environ.copy()
+    env[PROFILE_OUT_ENV] = out_path
+    env[START_TIME_ENV] = repr(time.time())
+    try:
+        proc = subprocess.run([sys.executable, "-X", "importtime", script], env=env,
+                              stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True,
+                              timeout=timeout, cwd=os.path.dirname(os.path.abspath(__file__)))
+        stderr = proc.stderr
+    except subprocess.TimeoutExpired as e:
+        stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else (e.stderr or "")
+
+    try:
+        with open(out_path, encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = {'first_frame_ms': None, 'steps': [], 'lazy_imports': {}}
+    finally:
+        os.remove(out_path)
+
+    result['imports'], result['import_total_ms'] = parse_importtime(stderr)
+    return result
+
+
+def _median(values):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+def summarize_warm(runs):
+    """warm 실행들의 중앙값 (단계/import별)"""
+    steps = {}
+    for run in runs:
+        for item in run['steps']:
+            steps.setdefault(item['name'], []).append(item['duration_ms'])
+    imports = {}
+    for run in runs:
+        for name, ms in run['imports'].items():
+            imports.setdefault(name, []).append(ms)
+    return {
+        'first_frame_ms': _median([r['first_frame_ms'] for r in runs]),
+        'import_total_ms': _median([r['import_total_ms'] for r in runs]),
+        'steps': {name: round(_median(values), 2) for name, values in steps.items()},
+        'imports': dict(sorted(((n, round(_median(v), 2)) for n, v in imports.items()),
+                               key=lambda item: -item[1])),
+    }
+
+
+def git_revision():
+    import subprocess
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              timeout=5, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        return None
+
+
+def benchmark(entries, runs=3, timeout=60.0):
+    """진입점별 cold/warm 시작 시간 보고서 생성"""
+    import platform
+
+    report = {
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'runs': runs,
+        'entries': {},
+    }
+    for name in entries:
+        script = ENTRY_POINTS[name]
+        print(f"⏱️ {name} ({script}) 측정 중...")
+        results = [run_entry(script, timeout) for _ in range(runs)]
+        cold = results[0]
+        report['entries'][name] = {
+            'cold': {
+                'first_frame_ms': cold['first_frame_ms'],
+                'import_total_ms': cold['import_total_ms'],
+                'steps': {item['name']: item['duration_ms'] for item in cold['steps']},
+                'imports': cold['imports'],
+                'lazy_imports': cold['lazy_imports'],
+                'timeline': cold['steps'],
+            },
+            'warm': summarize_warm(results[1:]) if len(results) > 1 else None,
+        }
+    return report
+
+
+def _fmt(ms):
+    return "   -   " if ms is None else f"{ms:7.0f}"
+
+
+def print_report(report, baseline=None):
+    """보고서 표 출력 (baseline이 있으면 warm 기준 차이 표시)"""
+    for name, entry in report['entries'].items():
+        warm = entry['warm'] or entry['cold']
+        print(f"\n[{name}] 첫 프레임: cold {_fmt(entry['cold']['first_frame_ms'])}ms / "
+              f"warm {_fmt(warm['first_frame_ms'])}ms, import 합계 warm {_fmt(warm['import_total_ms'])}ms")
+
+        base = None
+        if baseline and name in baseline.get('entries', {}):
+            base = baseline['entries'][name]['warm'] or baseline['entries'][name]['cold']
+            print(f"  이전 보고서({baseline.get('revision')}) 첫 프레임 {_fmt(base['first_frame_ms'])}ms")
+
+        for title, key in (("초기화 단계", 'steps'), ("import", 'imports')):
+            print(f"  {title}:")
+            for item, ms in list(warm[key].items())[:10]:
+                line = f"    {item:<32} {_fmt(ms)}ms"
+                if base is not None and item in base.get(key, {}):
+                    line += f"  ({ms - base[key][item]:+.0f}ms)"
+                print(line)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="진입점별 시작 시간(첫 프레임까지) 측정")
+    parser.add_argument("--entries", nargs="*", choices=sorted(ENTRY_POINTS), default=list(ENTRY_POINTS),
+                        help="측정할 진입점 (기본: 전체)")
+    parser.add_argument("--runs", type=int, default=3, help="진입점별 실행 횟수 (첫 실행 = cold)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="실행 한 번의 최대 시간(초)")
+    parser.add_argument("--out", help="보고서 경로 (기본: startup_reports/startup_<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 보고서")
+    args = parser.parse_args()
+
+    report = benchmark(args.entries, max(1, args.runs), args.timeout)
+    out = args.out or os.path.join("startup_reports", f"startup_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    if os.path.dirname(out):
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    print(f"\n💾 보고서 저장: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,45 @@
 import cv2
 import numpy as np
-import mediapipe as mp
 import time
 import os
 import random
-import math
-import json
 import sys
 import subprocess
 import pygame
-from PIL import Image, ImageFont, ImageDraw
+from PIL import Image
+from sim_clock import FixedTimestep
+from game_log import get_logger, setup_logging, shutdown_logging
+from particle_system import ParticleSystem, OpenCVParticleRenderer, HEART, SPARKLE
+from sprite_bank import SpriteBank
+from ui_layers import FrameOverlay
+from glyph_atlas import GlyphAtlas
+from spatial_index import UniformGrid
+from frame_presenter import FramePresenter
+from game_host import active_host
+from startup_profile import in_background, lazy_import, mark_first_frame, step
+from audio_engine import get_engine as get_audio_engine
+from score_store import get_store as get_score_store
+from frame_profiler import get_profiler
+from sampling_profiler import get_sampler
+from tracing import get_tracer
+from clip_capture import clip_path, open_clip
+from landmark_log import (drawing_utils as replay_drawing_utils, hands_solution as replay_hands_solution,
+                          record_tracker, replay_enabled, replay_tracker)
+from bgm_player import find_bgm, get_player as get_bgm_player
+
+# MediaPipe는 import만 1초 이상 걸려서 모델을 만들 때(백그라운드 스레드) import
+mp = lazy_import("mediapipe")
+from gesture_engine import GestureEngine, THUMB_TIP, INDEX_MCP, INDEX_TIP
+
+log = get_logger("student")
 
 def check_and_activate_venv():
     """가상환경 체크 및 자동 활성화"""
     print("🔍 가상환경 상태 확인 중...")
     
+    if os.environ.get('VENV_CHECK') == '0':
+        return True  # 벤치마크 등 이미 실행 환경이 준비된 경우
+    
     # 현재 가상환경 체크
     venv_path = os.path.join(os.getcwd(), ".venv")
     is_venv_active = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
@@ -86,56 +111,115 @@ def detect_usb_camera():
     
     return camera_index
 
+def hands_options(crowd_mode=False):
+    """MediaPipe Hands 옵션 (군중 모드는 손 최대 8개)"""
+    return dict(
+        static_image_mode=False,
+        max_num_hands=8 if crowd_mode else 2,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+
+
+def create_hands(host=None, crowd_mode=False):
+    """MediaPipe Hands 생성 (host가 있으면 공유 모델 사용)
+
+    LANDMARK_REPLAY: MediaPipe 없이 녹화된 랜드마크 재생, LANDMARK_RECORD: 결과를 녹화
+    """
+    if replay_enabled():
+        return replay_tracker('hands')
+    if host is not None:
+        hands = host.get_hands(**hands_options(crowd_mode))
+    else:
+        hands = mp.solutions.hands.Hands(**hands_options(crowd_mode))
+    return record_tracker(hands, 'hands', 'student')
+
+
+def warm_up(host):
+    """게임 호스트용: 모델 생성 후 더미 프레임으로 한 번 실행 (첫 프레임 지연 제거)"""
+    hands = create_hands(host, os.environ.get('CROWD_MODE') == '1')
+    hands.process(np.zeros((480, 640, 3), dtype=np.uint8))
+
+
+class HandInteraction:
+    def __init__(self, hand_id):
+        """손 하나의 핀치/드래그 상태 (손마다 따로 관리해서 두 손이 서로 방해하지 않음)"""
+        self.hand_id = hand_id
+        self.is_pinching = False
+        self.selected_character = None
+        self.initial_pinch_scale = 1.0
+        self.pinch_distance = 0.0
+    
+    def grab(self, character):
+        """핀치 시작 - 캐릭터가 있으면 드래그 시작"""
+        self.is_pinching = True
+        self.selected_character = character
+        if character:
+            # 초기 스케일 저장 (배율 변화 방지)
+            self.initial_pinch_scale = character['scale']
+            character['is_dragging'] = True
+            # 드래그 중 속도 초기화
+            character['vel_x'] = 0
+            character['vel_y'] = 0
+            log.info("캐릭터 선택됨! 드래그 모드 (손 %d, 크기: %.1f)", self.hand_id, character['scale'])
+    
+    def release(self, message):
+        """핀치 종료 - 캐릭터 놓기"""
+        character = self.selected_character
+        if character:
+            # 놓을 때 현재 위치에 고정하고 약간의 랜덤 속도 부여
+            character['vel_x'] = random.uniform(-0.5, 0.5)
+            character['vel_y'] = random.uniform(-0.5, 0.5)
+            character['is_dragging'] = False
+            log.info("%s 손 %d, 위치: (%s, %s)", message, self.hand_id, character['x'], character['y'])
+        self.is_pinching = False
+        self.selected_character = None
+
+
 class HandTrackingPixelPhotobooth:
     def __init__(self):
         """핸드 트래킹 픽셀 캐릭터 포토부스"""
         print("< 3 Hand Tracking Pixel Photobooth 초기화!")
         
-        # Pygame 초기화 (효과음 및 배경음악용)
-        try:
-            pygame.mixer.init()
-            # confirmbeep-sfx.wav 로드
-            if os.path.exists("confirmbeep-sfx.wav"):
-                self.confirm_sound = pygame.mixer.Sound("confirmbeep-sfx.wav")
-            else:
-                self.confirm_sound = None
-            
-            # 배경음악 로드 및 재생
-            if os.path.exists("student-bgm.mp3"):
-                pygame.mixer.music.load("student-bgm.mp3")
-                pygame.mixer.music.set_volume(0.3)  # 효과음보다 작은 볼륨 (30%)
-                pygame.mixer.music.play(-1)  # 무한 반복
-                print("✓ 배경음악 로드 완료: student-bgm.mp3")
-            else:
-                print("⚠️ 배경음악 파일을 찾을 수 없습니다: student-bgm.mp3")
-            
-            print("✓ Pygame mixer 초기화 완료!")
-        except Exception as e:
-            print(f"[!] Pygame 초기화 실패: {e}")
-            self.confirm_sound = None
+        # 군중 모드 (CROWD_MODE=1): 캐릭터 수백 개 + 여러 사람이 동시에 드래그
+        self.crowd_mode = os.environ.get('CROWD_MODE') == '1'
+        if self.crowd_mode:
+            print("👥 군중 모드: 캐릭터 최대 300개, 손 최대 8개")
         
-        # MediaPipe Hands 초기화
-        try:
-            self.mp_hands = mp.solutions.hands
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.7,
-                min_tracking_confidence=0.5
-            )
-            self.mp_draw = mp.solutions.drawing_utils
-            print("✓ MediaPipe Hands 초기화 완료!")
-        except Exception as e:
-            print(f"[!] MediaPipe 초기화 실패: {e}")
-            self.hands = None
+        # MediaPipe Hands는 import + 그래프 생성이 오래 걸리므로 백그라운드에서 만들고
+        # 사운드/캐릭터/폰트 로드와 병렬 진행 (게임 호스트에서 실행 중이면 공유 모델 사용)
+        hands_future = in_background("mediapipe", create_hands, active_host(), self.crowd_mode)
+        
+        # Pygame 초기화 (효과음 및 배경음악용)
+        self.bgm_path = None
+        self.audio = None
+        with step("mixer"):
+            try:
+                # 프로필(버퍼 크기/샘플레이트)대로 믹서 초기화 후 confirmbeep-sfx.wav 로드
+                self.audio = get_audio_engine()
+                self.audio.preload(['confirm'])
+                
+                # 배경음악 로드 및 재생 (MP3가 없으면 generate_bgm.py로 만든 PCM 데이터 사용)
+                self.bgm_path = find_bgm("student-bgm.mp3", "student_bgm_data.npy")
+                if self.bgm_path is None:
+                    print("⚠️ 배경음악 파일을 찾을 수 없습니다: student-bgm.mp3")
+                elif get_bgm_player().play(self.bgm_path):
+                    print(f"✓ 배경음악 로드 완료: {self.bgm_path}")
+                
+                print("✓ Pygame mixer 초기화 완료!")
+            except Exception as e:
+                print(f"[!] Pygame 초기화 실패: {e}")
         
         # 픽셀 캐릭터 로드
-        self.load_pixel_characters()
+        with step("characters"):
+            self.load_pixel_characters()
         
         # 캐릭터 객체들
         self.characters = []
         self.spawn_timer = 0
-        self.spawn_interval = 1.5  # 1.5초마다 캐릭터 스폰
+        self.spawn_interval = 0.05 if self.crowd_mode else 1.5  # 1.5초마다 캐릭터 스폰 (군중 모드는 빠르게)
+        self.max_characters = 300 if self.crowd_mode else 8
+        self.next_character_id = 0  # 캐릭터 고유 ID (점수 중복 계산 방지)
         
         # 게임 상태
         self.game_state = "waiting"  # waiting, playing, finished
@@ -145,35 +229,57 @@ class HandTrackingPixelPhotobooth:
         self.target_zone_x = 0.7  # 화면 우측 70% 지점이 목표 구역
         self.moved_characters = set()  # 이미 점수가 계산된 캐릭터들
         
-        # 최고 점수 시스템
-        self.high_score_file = "high_score.json"
+        # 최고 점수 시스템 (파일 쓰기는 점수 저장소의 백그라운드 스레드에서)
+        self.score_store = get_score_store()
         self.high_score = self.load_high_score()
         
         # 폰트 설정
         self.font_path = "neodgm.ttf"
-        self.load_font()
+        with step("fonts"):
+            self.load_font()
         
         # 캐릭터 중복 방지를 위한 리스트
         self.available_characters = []
         self.used_characters = []
         
-        # 핸드 트래킹 상태
-        self.pinch_distance = 0
-        self.is_pinching = False
-        self.selected_character = None
+        # 핸드 트래킹 상태 (손 ID별 핀치/드래그 상태, 캐릭터 검색용 공간 격자)
         self.pinch_threshold = 0.05
-        self.drag_mode = False
-        self.initial_pinch_scale = 1.0
-        
-        # 하트 제스처 상태 (게임 제어용)
-        self.is_heart_gesture = False
-        self.last_heart_time = 0
-        self.heart_cooldown = 2.0  # 2초 쿨다운
+        self.hand_interactions = {}
+        self.character_grid = UniformGrid(cell_size=100)
+        
+        # 제스처 엔진 (하트=게임제어, 핀치=캐릭터조작, 하트는 2초 쿨다운)
+        self.gesture_engine = GestureEngine(
+            heart_profile='student',
+            heart_cooldown=2.0,
+            pinch_enter=self.pinch_threshold,
+            pinch_exit=self.pinch_threshold * 1.3
+        )
+        self.gesture_engine.subscribe('heart', self.on_heart_gesture)
         self.heart_debug_info = ""  # 화면 표시용 디버그 정보
         
-        # 파티클 효과
-        self.heart_particles = []
-        self.sparkle_particles = []
+        # 파티클 효과 (NumPy 배열 기반, 하트는 화면 위로 나가면 제거)
+        self.heart_particles = ParticleSystem(shape=HEART, min_y=-10)
+        self.sparkle_particles = ParticleSystem(shape=SPARKLE)
+        self.particle_renderer = OpenCVParticleRenderer()
+        
+        # 상단 UI 캐시 레이어 (점수/0.1초/상태가 바뀔 때만 다시 그림)
+        self.ui_overlay = FrameOverlay()
+        
+        # MediaPipe Hands (백그라운드 생성 완료 대기)
+        try:
+            with step("mediapipe.wait"):
+                self.hands = hands_future.result()
+            if replay_enabled():
+                # 재생 중에는 MediaPipe를 import하지 않고 같은 방식으로 손 골격 그리기
+                self.mp_hands = replay_hands_solution
+                self.mp_draw = replay_drawing_utils
+            else:
+                self.mp_hands = mp.solutions.hands
+                self.mp_draw = mp.solutions.drawing_utils
+            print("✓ MediaPipe Hands 초기화 완료!")
+        except Exception as e:
+            print(f"[!] MediaPipe 초기화 실패: {e}")
+            self.hands = None
         
         print("✓ 초기화 완료!")
     
@@ -220,81 +326,49 @@ class HandTrackingPixelPhotobooth:
         
         print(f"✓ 총 {len(self.character_images)}개의 캐릭터 로드 완료!")
         
+        # 스프라이트 뱅크 (18x24 기준 배율/회전별 스프라이트 캐시)
+        self.sprite_bank = SpriteBank()
+        for char_data in self.character_images:
+            self.sprite_bank.register(char_data['id'], char_data['image'])
+        
         # 캐릭터 풀 초기화 (중복 방지)
         self.reset_character_pool()
     
     def load_font(self):
-        """전체화면 반응형 UI용 폰트 로드"""
-        try:
-            if os.path.exists(self.font_path):
-                # 화면 크기가 설정되기 전이므로 기본 크기로 초기화 후 나중에 업데이트
-                self.font_small = ImageFont.truetype(self.font_path, 28)
-                self.font_medium = ImageFont.truetype(self.font_path, 42)
-                self.font_large = ImageFont.truetype(self.font_path, 56)
-                self.font_xlarge = ImageFont.truetype(self.font_path, 72)
-                print(f"✓ {self.font_path} 폰트 로드 완료! (전체화면 반응형)")
-            else:
-                print(f"[!] {self.font_path}를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
-                self.font_small = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
-                self.font_large = ImageFont.load_default()
-                self.font_xlarge = ImageFont.load_default()
-        except Exception as e:
-            print(f"[!] 폰트 로드 실패: {e}. 기본 폰트를 사용합니다.")
-            self.font_small = ImageFont.load_default()
-            self.font_medium = ImageFont.load_default()
-            self.font_large = ImageFont.load_default()
-            self.font_xlarge = ImageFont.load_default()
+        """전체화면 반응형 UI용 글리프 아틀라스 로드 (글자는 처음 쓸 때 한 번만 래스터화)"""
+        # 화면 크기가 설정되기 전이므로 기본 크기로 초기화 후 나중에 업데이트
+        self.font_small = GlyphAtlas(self.font_path, 28)
+        self.font_medium = GlyphAtlas(self.font_path, 42)
+        self.font_large = GlyphAtlas(self.font_path, 56)
+        self.font_xlarge = GlyphAtlas(self.font_path, 72)
+        print(f"✓ {self.font_path} 글리프 아틀라스 준비 완료! (전체화면 반응형)")
     
     def update_font_sizes(self, ui_scale):
         """UI 스케일에 따라 폰트 크기 업데이트 (food_eating_game.py와 동일)"""
-        try:
-            if os.path.exists(self.font_path):
-                # food_eating_game.py의 폰트 크기와 동일하게 설정
-                base_size = 16  # 기본 폰트 크기
-                self.font_small = ImageFont.truetype(self.font_path, int(base_size * 0.8))  # 13
-                self.font_medium = ImageFont.truetype(self.font_path, base_size)  # 16
-                self.font_large = ImageFont.truetype(self.font_path, int(base_size * 1.5))  # 24
-                self.font_xlarge = ImageFont.truetype(self.font_path, int(base_size * 2))  # 32
-                print(f"✓ 폰트 크기 업데이트: 기본 {base_size}px (food_eating_game.py와 동일)")
-            else:
-                # 기본 폰트 사용
-                self.font_small = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
-                self.font_large = ImageFont.load_default()
-                self.font_xlarge = ImageFont.load_default()
-        except Exception as e:
-            print(f"[!] 폰트 크기 업데이트 실패: {e}")
+        # food_eating_game.py의 폰트 크기와 동일하게 설정
+        base_size = 16  # 기본 폰트 크기
+        self.font_small = GlyphAtlas(self.font_path, int(base_size * 0.8))  # 13
+        self.font_medium = GlyphAtlas(self.font_path, base_size)  # 16
+        self.font_large = GlyphAtlas(self.font_path, int(base_size * 1.5))  # 24
+        self.font_xlarge = GlyphAtlas(self.font_path, int(base_size * 2))  # 32
+        
+        # 자주 쓰는 글자는 미리 래스터화 (게임 중 첫 표시 때 멈칫하지 않도록)
+        for font in (self.font_small, self.font_medium, self.font_large):
+            font.preload("0123456789.:/!?() 시간초점수최고준비하트감지근사양손이필요합니다")
+        print(f"✓ 폰트 크기 업데이트: 기본 {base_size}px (food_eating_game.py와 동일)")
+        self.ui_overlay.key = None  # 폰트가 바뀌었으니 UI 레이어 다시 그림
     
     def load_high_score(self):
         """최고 점수 로드"""
-        try:
-            if os.path.exists(self.high_score_file):
-                with open(self.high_score_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    score = data.get('high_score', 0)
-                    print(f"✓ 최고 점수 로드: {score}점")
-                    return score
-        except Exception as e:
-            print(f"[!] 최고 점수 로드 실패: {e}")
-        return 0
-    
-    def save_high_score(self):
-        """최고 점수 저장"""
-        try:
-            data = {'high_score': self.high_score}
-            with open(self.high_score_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"✓ 최고 점수 저장: {self.high_score}점")
-        except Exception as e:
-            print(f"[!] 최고 점수 저장 실패: {e}")
+        score = self.score_store.get_high_score('student')
+        print(f"✓ 최고 점수 로드: {score}점")
+        return score
     
     def update_high_score(self):
-        """최고 점수 업데이트"""
-        if self.score > self.high_score:
-            old_score = self.high_score
+        """게임 결과 기록 + 최고 점수 업데이트 (새 기록이면 True)"""
+        old_score = self.high_score
+        if self.score_store.submit('student', self.score):
             self.high_score = self.score
-            self.save_high_score()
             print(f"🎉 새로운 최고 점수! {old_score} → {self.high_score}")
             return True
         return False
@@ -333,11 +407,11 @@ class HandTrackingPixelPhotobooth:
     
     def spawn_character(self, frame_width, frame_height):
         """왼쪽에서 새로운 캐릭터 스폰 (게임용, 중복 없이)"""
-        if len(self.characters) < 8 and self.game_state == "playing":  # 최대 8개 캐릭터
+        if len(self.characters) < self.max_characters and self.game_state == "playing":  # 최대 8개 캐릭터
             # 사용 가능한 캐릭터가 없으면 풀 리셋
             if not self.available_characters:
                 self.reset_character_pool()
-                print("🔄 모든 캐릭터 사용됨! 캐릭터 풀 리셋")
+                log.info("🔄 모든 캐릭터 사용됨! 캐릭터 풀 리셋")
             
             # 다음 캐릭터 선택 (중복 없이)
             char_index = self.available_characters.pop(0)
@@ -371,11 +445,12 @@ class HandTrackingPixelPhotobooth:
                 'birth_time': time.time(),
                 'life': 255.0,
                 'is_dragging': False,
-                'id': len(self.characters),  # 고유 ID 추가
+                'id': self.next_character_id,  # 고유 ID
                 'scored': False  # 점수 획득 여부
             }
+            self.next_character_id += 1
             self.characters.append(character)
-            print(f"🎨 {char_data['name']} 캐릭터 스폰! (남은: {len(self.available_characters)}개)")
+            log.info("🎨 %s 캐릭터 스폰! (남은: %d개)", char_data['name'], len(self.available_characters))
     
     def update_characters(self, frame_width, frame_height):
         """캐릭터 업데이트 (게임 로직)"""
@@ -417,17 +492,14 @@ class HandTrackingPixelPhotobooth:
                 self.create_score_particles(char_center_x, char_center_y)
                 
                 # 효과음 재생
-                if self.confirm_sound:
-                    try:
-                        self.confirm_sound.play()
-                    except:
-                        pass
+                if self.audio:
+                    self.audio.play('confirm')
                 
-                print(f"🎉 점수! {char.get('name', '캐릭터')} - 현재 점수: {self.score}")
+                log.info("🎉 점수! %s - 현재 점수: %d", char.get('name', '캐릭터'), self.score)
                 
                 # 10명 모두 옮겼을 때 특별 메시지
                 if self.score >= 10:
-                    print("🎊 축하해!! 모두를 다 옮겼구나!! 🎊")
+                    log.info("🎊 축하해!! 모두를 다 옮겼구나!! 🎊")
                     # 특별 파티클 효과 추가
                     self.create_completion_celebration(frame_width, frame_height)
             
@@ -446,472 +518,272 @@ class HandTrackingPixelPhotobooth:
             i += 1
     
     def draw_character(self, frame, character):
-        """캐릭터를 프레임에 그리기"""
-        char_img = character['image']
-        scale = character['scale']
-        x, y = int(character['x']), int(character['y'])
-        
-        # 스케일링 (18x24 크기 기준)
-        new_width = int(18 * scale)
-        new_height = int(24 * scale)
-        if new_width > 0 and new_height > 0:
-            try:
-                # 이미지 리사이즈 (18x24 비율 유지)
-                resized = cv2.resize(char_img, (new_width, new_height), interpolation=cv2.INTER_NEAREST)
-                
-                # 회전 (선택적) - 18x24 크기 기준
-                if character.get('rotation', 0) != 0:
-                    center = (new_width // 2, new_height // 2)
-                    rotation_matrix = cv2.getRotationMatrix2D(center, character['rotation'], 1.0)
-                    resized = cv2.warpAffine(resized, rotation_matrix, (new_width, new_height))
-                
-                # 프레임에 합성 (알파 블렌딩)
-                self.blend_character(frame, resized, x, y)
-                
-            except Exception as e:
-                print(f"캐릭터 그리기 오류: {e}")
+        """캐릭터를 프레임에 그리기 (배율/회전별로 캐시된 스프라이트를 정수 알파 블렌딩)"""
+        try:
+            self.sprite_bank.draw(
+                frame, character['char_id'], character['scale'],
+                character['x'], character['y'], character.get('rotation', 0)
+            )
+        except Exception as e:
+            log.warning("캐릭터 그리기 오류: %s", e)
     
-    def blend_character(self, frame, char_img, x, y):
-        """알파 블렌딩으로 캐릭터 합성 (경계 처리 개선)"""
-        h, w = char_img.shape[:2]
-        frame_h, frame_w = frame.shape[:2]
-        
-        # 캐릭터와 프레임의 겹치는 영역 계산
-        # 캐릭터 영역
-        char_start_x = max(0, -x)
-        char_start_y = max(0, -y)
-        char_end_x = min(w, frame_w - x)
-        char_end_y = min(h, frame_h - y)
-        
-        # 프레임 영역
-        frame_start_x = max(0, x)
-        frame_start_y = max(0, y)
-        frame_end_x = min(frame_w, x + w)
-        frame_end_y = min(frame_h, y + h)
-        
-        # 유효한 영역이 있는지 확인
-        if (char_end_x <= char_start_x or char_end_y <= char_start_y or
-            frame_end_x <= frame_start_x or frame_end_y <= frame_start_y):
+    def on_heart_gesture(self, event):
+        """하트 제스처 이벤트 처리 (게임 시작/재시작, 쿨다운은 제스처 엔진에서 처리)"""
+        if event.kind != 'start':
             return
         
-        # 겹치는 부분만 추출
-        char_region = char_img[char_start_y:char_end_y, char_start_x:char_end_x]
-        frame_region = frame[frame_start_y:frame_end_y, frame_start_x:frame_end_x]
-        
-        # 알파 채널이 있는 경우
-        if char_img.shape[2] == 4:
-            # BGR과 알파 분리
-            char_bgr = char_region[:, :, :3]
-            alpha = char_region[:, :, 3:4] / 255.0
-            
-            # 알파 블렌딩 (벡터화된 연산)
-            blended = alpha * char_bgr + (1 - alpha) * frame_region
-            frame[frame_start_y:frame_end_y, frame_start_x:frame_end_x] = blended.astype(np.uint8)
-        else:
-            # 알파 채널이 없는 경우 그냥 복사
-            frame[frame_start_y:frame_end_y, frame_start_x:frame_end_x] = char_region
+        # 게임 상태에 따른 처리
+        if self.game_state == "waiting":
+            self.start_game()
+            log.info("💖 하트 제스처로 게임 시작!")
+        elif self.game_state == "finished":
+            self.restart_game()
+            log.info("💖 하트 제스처로 게임 재시작!")
     
-    def calculate_pinch_distance(self, landmarks):
-        """엄지와 검지 사이의 거리 계산"""
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
-        
-        distance = math.sqrt(
-            (thumb_tip.x - index_tip.x) ** 2 + 
-            (thumb_tip.y - index_tip.y) ** 2
-        )
-        return distance
+    def update_heart_debug_info(self, gesture):
+        """하트 조건 만족 개수를 화면 표시용 디버그 정보로 저장"""
+        satisfied, total = gesture.heart_score, gesture.heart_total
+        if satisfied >= 3:  # 어느 정도 조건을 만족할 때만 기록 (DEBUG 레벨, 속도 제한)
+            log.debug("하트 조건 만족: %d/%d", satisfied, total)
+        
+        if satisfied >= 5:
+            self.heart_debug_info = f"💖 하트 감지됨! ({satisfied}/{total})"
+        elif satisfied >= 3:
+            self.heart_debug_info = f"❤️‍🩹 하트 근사 ({satisfied}/{total})"
+        else:
+            self.heart_debug_info = f"하트: {satisfied}/{total}"
     
-    def detect_heart_gesture(self, left_hand, right_hand):
-        """두 손으로 하트 모양 만들기 감지 (더 관대한 조건)"""
-        try:
-            # 양손의 주요 지점들
-            left_thumb = left_hand[4]
-            left_index = left_hand[8]
-            right_thumb = right_hand[4]
-            right_index = right_hand[8]
-            
-            # 더 관대한 하트 제스처 조건들
-            heart_conditions = [
-                # 엄지들이 가까이 있어야 함 (하트의 상단 만남점) - 더 관대하게
-                abs(left_thumb.x - right_thumb.x) < 0.15,  # 0.1에서 0.15로 증가
-                abs(left_thumb.y - right_thumb.y) < 0.08,  # 0.05에서 0.08로 증가
-                
-                # 검지들이 가까이 있어야 함 (하트의 하단 만남점) - 더 관대하게
-                abs(left_index.x - right_index.x) < 0.15,  # 0.1에서 0.15로 증가
-                abs(left_index.y - right_index.y) < 0.08,  # 0.05에서 0.08로 증가
-                
-                # 검지가 엄지보다 아래쪽에 있어야 함 (하트의 아래쪽 모양)
-                left_index.y > left_thumb.y - 0.02,   # 약간의 여유 추가
-                right_index.y > right_thumb.y - 0.02, # 약간의 여유 추가
-                
-                # 좌우 대칭성 확인 - 더 관대하게
-                left_thumb.x <= right_thumb.x + 0.05,  # 약간의 여유 추가
-                left_index.x <= right_index.x + 0.05   # 약간의 여유 추가
-            ]
-            
-            satisfied_conditions = sum(heart_conditions)
-            
-            # 디버그 정보 출력
-            if satisfied_conditions >= 3:  # 어느 정도 조건을 만족할 때만 출력
-                print(f"하트 조건 만족: {satisfied_conditions}/8")
-                print(f"엄지 거리: x={abs(left_thumb.x - right_thumb.x):.3f}, y={abs(left_thumb.y - right_thumb.y):.3f}")
-                print(f"검지 거리: x={abs(left_index.x - right_index.x):.3f}, y={abs(left_index.y - right_index.y):.3f}")
-            
-            # 디버그 정보 저장 (화면 표시용)
-            if satisfied_conditions >= 5:
-                self.heart_debug_info = f"💖 하트 감지됨! ({satisfied_conditions}/8)"
-            elif satisfied_conditions >= 3:
-                self.heart_debug_info = f"❤️‍🩹 하트 근사 ({satisfied_conditions}/8)"
-            else:
-                self.heart_debug_info = f"하트: {satisfied_conditions}/8"
-            
-            return satisfied_conditions >= 5  # 8개 중 5개 이상 만족하면 하트로 인식 (65% 인식률)
-            
-        except Exception as e:
-            print(f"하트 제스처 감지 오류: {e}")
-            return False
+    def rebuild_character_grid(self):
+        """캐릭터 중심점으로 공간 격자 다시 만들기 (프레임마다 한 번)"""
+        centers = [(char['x'] + (18 * char['scale']) // 2, char['y'] + (24 * char['scale']) // 2)
+                   for char in self.characters]
+        self.character_grid.rebuild(self.characters, centers)
     
     def find_nearest_character(self, hand_x, hand_y, frame_width, frame_height):
-        """손에 가장 가까운 캐릭터 찾기"""
+        """손에 가장 가까운 캐릭터 찾기 (100픽셀 이내, 다른 손이 잡고 있는 캐릭터 제외)"""
         # 정규화된 좌표를 픽셀 좌표로 변환
         pixel_x = int(hand_x * frame_width)
         pixel_y = int(hand_y * frame_height)
         
-        nearest_char = None
-        min_distance = float('inf')
-        
-        for char in self.characters:
-            char_center_x = char['x'] + (18 * char['scale']) // 2
-            char_center_y = char['y'] + (24 * char['scale']) // 2
-            
-            distance = math.sqrt(
-                (pixel_x - char_center_x) ** 2 + 
-                (pixel_y - char_center_y) ** 2
-            )
-            
-            if distance < min_distance and distance < 100:  # 100픽셀 이내
-                min_distance = distance
-                nearest_char = char
-        
-        return nearest_char
+        # 주변 격자 칸만 검사하므로 캐릭터 수와 무관하게 일정한 비용
+        return self.character_grid.nearest(
+            pixel_x, pixel_y, 100, exclude=lambda char: char.get('is_dragging', False)
+        )
     
     def process_hand_tracking(self, frame, results):
         """핸드 트래킹 처리 (하트=게임제어, 핀치=캐릭터조작)"""
         frame_height, frame_width = frame.shape[:2]
-        current_time = time.time()
+        
+        # 하트/핀치를 한 번에 계산 (하트 시작 이벤트는 on_heart_gesture로 전달됨)
+        gesture = self.gesture_engine.process(results.multi_hand_landmarks)
         
         if results.multi_hand_landmarks:
-            # 양손 감지 확인
-            left_hand = None
-            right_hand = None
-            
-            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+            for hand_landmarks in results.multi_hand_landmarks:
                 # 손 랜드마크 그리기
                 self.mp_draw.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
                     self.mp_draw.DrawingSpec(color=(255, 192, 203), thickness=2),
                     self.mp_draw.DrawingSpec(color=(255, 255, 255), thickness=1)
                 )
-                
-                # 손의 위치로 좌우 구분 (간단한 방법)
-                hand_center_x = sum([lm.x for lm in hand_landmarks.landmark]) / len(hand_landmarks.landmark)
-                if hand_center_x < 0.5:  # 화면 기준 왼쪽에 있는 손
-                    left_hand = hand_landmarks.landmark
-                else:  # 화면 기준 오른쪽에 있는 손
-                    right_hand = hand_landmarks.landmark
             
-            # 하트 제스처 감지 (게임 제어용)
-            if left_hand and right_hand:
-                heart_detected = self.detect_heart_gesture(left_hand, right_hand)
-                
-                if heart_detected and not self.is_heart_gesture:
-                    if current_time - self.last_heart_time > self.heart_cooldown:
-                        self.is_heart_gesture = True
-                        self.last_heart_time = current_time
-                        
-                        # 게임 상태에 따른 처리
-                        if self.game_state == "waiting":
-                            self.start_game()
-                            print("💖 하트 제스처로 게임 시작!")
-                        elif self.game_state == "finished":
-                            self.restart_game()
-                            print("💖 하트 제스처로 게임 재시작!")
-                elif not heart_detected:
-                    self.is_heart_gesture = False
-                
-                elif not heart_detected:
-                    self.is_heart_gesture = False
+            # 하트 제스처 상태 (게임 제어용)
+            if gesture.heart_total:
+                self.update_heart_debug_info(gesture)
             else:
                 # 양손이 감지되지 않았을 때
                 self.heart_debug_info = "양손이 필요합니다"
                 
             # 하트 제스처 시각화
-            if left_hand and right_hand and heart_detected:
+            if gesture.heart:
                 cv2.putText(frame, "💖 HEART DETECTED! 💖", (frame_width//2 - 100, 50), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 100, 150), 2)
             
-            # 핀치 제스처 감지 (캐릭터 조작용 - 게임 중일 때만)
+            # 핀치 제스처 감지 (캐릭터 조작용 - 게임 중일 때만, 손마다 따로)
             if self.game_state == "playing":
-                for hand_landmarks in results.multi_hand_landmarks:
-                    landmarks = hand_landmarks.landmark
-                    pinch_dist = self.calculate_pinch_distance(landmarks)
+                self.rebuild_character_grid()
+                for i, hand in enumerate(gesture.hands):
+                    hand_id = gesture.hand_ids[i]
+                    interaction = self.hand_interactions.get(hand_id)
+                    if interaction is None:
+                        interaction = self.hand_interactions[hand_id] = HandInteraction(hand_id)
+                    interaction.pinch_distance = float(gesture.pinch_distance[i])
                     
                     # 손바닥 중심 계산 (검지 MCP 사용)
-                    palm_x = landmarks[5].x  # 검지 MCP
-                    palm_y = landmarks[5].y
+                    palm_x = float(hand[INDEX_MCP, 0])
+                    palm_y = float(hand[INDEX_MCP, 1])
                     
-                    # 핀치 제스처 감지
-                    if pinch_dist < self.pinch_threshold:
-                        if not self.is_pinching:
-                            # 핀치 시작 - 가장 가까운 캐릭터 선택
-                            self.selected_character = self.find_nearest_character(
+                    # 핀치 제스처 감지 (진입/해제 임계값이 달라 경계에서 떨리지 않음)
+                    if gesture.pinching[i]:
+                        if not interaction.is_pinching:
+                            # 핀치 시작 - 다른 손이 잡고 있지 않은 가장 가까운 캐릭터 선택
+                            interaction.grab(self.find_nearest_character(
                                 palm_x, palm_y, frame_width, frame_height
-                            )
-                            self.is_pinching = True
-                            self.drag_mode = True
-                            if self.selected_character:
-                                # 초기 스케일 저장 (배율 변화 방지)
-                                self.initial_pinch_scale = self.selected_character['scale']
-                                self.selected_character['is_dragging'] = True
-                                # 드래그 중 속도 초기화
-                                self.selected_character['vel_x'] = 0
-                                self.selected_character['vel_y'] = 0
-                                print(f"캐릭터 선택됨! 드래그 모드 (크기: {self.selected_character['scale']:.1f})")
+                            ))
                         
                         # 핀치 중 - 캐릭터를 손 위치로 이동 (크기는 고정)
-                        if self.selected_character and self.drag_mode:
-                            # 캐릭터를 손 위치로 이동 (18x24 크기 기준)
-                            char_width = int(18 * self.selected_character['scale'])
-                            char_height = int(24 * self.selected_character['scale'])
-                            
-                            # 손 위치 계산 (캐릭터 중심을 손 위치에 맞춤)
-                            hand_x = int(palm_x * frame_width)
-                            hand_y = int(palm_y * frame_height)
-                            
-                            # 캐릭터가 화면을 벗어나지 않도록 제한 (여유 공간 고려)
-                            margin = 10  # 경계에서 10픽셀 여유
-                            target_x = max(-margin, min(
-                                hand_x - char_width // 2,
-                                frame_width - char_width + margin
-                            ))
-                            target_y = max(-margin, min(
-                                hand_y - char_height // 2,
-                                frame_height - char_height + margin
-                            ))
-                            
-                            # 부드러운 이동을 위한 직접 할당
-                            self.selected_character['x'] = target_x
-                            self.selected_character['y'] = target_y
-                            
-                            # 드래그 중에는 속도 초기화
-                            self.selected_character['vel_x'] = 0
-                            self.selected_character['vel_y'] = 0
-                    else:
-                        if self.is_pinching and self.drag_mode:
-                            # 핀치 종료 - 캐릭터 놓기
-                            if self.selected_character:
-                                # 놓을 때 현재 위치에 고정하고 약간의 랜덤 속도 부여
-                                self.selected_character['vel_x'] = random.uniform(-0.5, 0.5)
-                                self.selected_character['vel_y'] = random.uniform(-0.5, 0.5)
-                                self.selected_character['is_dragging'] = False
-                                print(f"캐릭터 해제됨! 위치: ({self.selected_character['x']}, {self.selected_character['y']})")
-                            self.is_pinching = False
-                            self.drag_mode = False
-                            self.selected_character = None
+                        if interaction.selected_character:
+                            self.move_character_to_hand(
+                                interaction.selected_character, palm_x, palm_y, frame_width, frame_height
+                            )
+                    elif interaction.is_pinching:
+                        # 핀치 종료 - 캐릭터 놓기
+                        interaction.release("캐릭터 해제됨!")
                     
                     # 핀치 거리 시각화 (게임 중일 때만)
-                    thumb_pos = (int(landmarks[4].x * frame_width), int(landmarks[4].y * frame_height))
-                    index_pos = (int(landmarks[8].x * frame_width), int(landmarks[8].y * frame_height))
+                    thumb_pos = (int(hand[THUMB_TIP, 0] * frame_width), int(hand[THUMB_TIP, 1] * frame_height))
+                    index_pos = (int(hand[INDEX_TIP, 0] * frame_width), int(hand[INDEX_TIP, 1] * frame_height))
                     
                     # 핀치 라인 그리기
-                    if self.is_pinching and self.drag_mode:
+                    if interaction.is_pinching:
                         color = (0, 255, 0)  # 초록색 - 드래그 중
                     else:
                         color = (255, 255, 255)  # 흰색 - 일반 상태
                     
                     cv2.line(frame, thumb_pos, index_pos, color, 2)
                     
-                    # 핀치 거리 텍스트
-                    cv2.putText(frame, f"Pinch: {pinch_dist:.3f}", 
-                               (10, frame_height - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-        else:
-            # 손이 감지되지 않으면 모든 제스처 해제
-            if self.is_pinching and self.selected_character:
-                self.selected_character['vel_x'] = random.uniform(-0.5, 0.5)
-                self.selected_character['vel_y'] = random.uniform(-0.5, 0.5)
-                self.selected_character['is_dragging'] = False
-                print("손 감지 안됨 - 캐릭터 해제!")
-            self.is_pinching = False
-            self.drag_mode = False
-            self.selected_character = None
-            self.is_heart_gesture = False
+                    # 핀치 거리 텍스트 (손마다 한 줄씩)
+                    cv2.putText(frame, f"Pinch: {interaction.pinch_distance:.3f}", 
+                               (10, frame_height - 60 - 25 * i), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        
+        # 추적이 끊긴 손은 잡고 있던 캐릭터 해제 (잠깐 인식이 끊기는 정도는 유지)
+        for hand_id in gesture.lost_hand_ids:
+            interaction = self.hand_interactions.pop(hand_id, None)
+            if interaction is not None and interaction.is_pinching:
+                interaction.release("손 감지 안됨 - 캐릭터 해제!")
+    
+    def move_character_to_hand(self, character, palm_x, palm_y, frame_width, frame_height):
+        """드래그 중인 캐릭터를 손 위치로 이동 (18x24 크기 기준)"""
+        char_width = int(18 * character['scale'])
+        char_height = int(24 * character['scale'])
+        
+        # 손 위치 계산 (캐릭터 중심을 손 위치에 맞춤)
+        hand_x = int(palm_x * frame_width)
+        hand_y = int(palm_y * frame_height)
+        
+        # 캐릭터가 화면을 벗어나지 않도록 제한 (여유 공간 고려)
+        margin = 10  # 경계에서 10픽셀 여유
+        target_x = max(-margin, min(
+            hand_x - char_width // 2,
+            frame_width - char_width + margin
+        ))
+        target_y = max(-margin, min(
+            hand_y - char_height // 2,
+            frame_height - char_height + margin
+        ))
+        
+        # 부드러운 이동을 위한 직접 할당
+        character['x'] = target_x
+        character['y'] = target_y
+        
+        # 드래그 중에는 속도 초기화
+        character['vel_x'] = 0
+        character['vel_y'] = 0
 
     def create_completion_celebration(self, frame_width, frame_height):
         """10명 완주 시 특별 축하 파티클 효과"""
-        # 화면 전체에 더 많은 하트 파티클
-        for _ in range(20):
-            self.heart_particles.append({
-                'x': random.randint(0, frame_width),
-                'y': random.randint(0, frame_height),
-                'speed': random.uniform(1, 3),
-                'size': random.randint(15, 25),
-                'color': (255, random.randint(100, 255), random.randint(150, 255)),
-                'life': 120  # 더 오래 지속
-            })
+        # 화면 전체에 더 많은 하트 파티클 (더 오래 지속)
+        self.heart_particles.emit(
+            20, (0, frame_width), (0, frame_height),
+            vy=(-3, -1), size=(15, 25),
+            color=(255, (100, 255), (150, 255)), life=120
+        )
         
         # 화면 전체에 더 많은 반짝이 파티클
-        for _ in range(30):
-            self.sparkle_particles.append({
-                'x': random.randint(0, frame_width),
-                'y': random.randint(0, frame_height),
-                'speed': random.uniform(0.5, 2),
-                'size': random.randint(3, 8),
-                'color': (random.randint(200, 255), random.randint(200, 255), random.randint(100, 255)),
-                'life': 100
-            })
+        self.sparkle_particles.emit(
+            30, (0, frame_width), (0, frame_height),
+            size=(3, 8),
+            color=((200, 255), (200, 255), (100, 255)), life=100
+        )
 
     def create_score_particles(self, x, y):
         """점수 획득 시 귀여운 파티클 효과 생성"""
-        # 하트 파티클 생성
-        for _ in range(5):
-            self.heart_particles.append({
-                'x': x + random.randint(-20, 20),
-                'y': y + random.randint(-10, 10),
-                'speed': random.uniform(2, 4),
-                'size': random.randint(8, 15),
-                'color': (random.randint(200, 255), random.randint(100, 200), 255),
-                'life': 60  # 더 오래 지속
-            })
+        # 하트 파티클 생성 (더 오래 지속)
+        self.heart_particles.emit(
+            5, x, y, offset_x=(-20, 20), offset_y=(-10, 10),
+            vy=(-4, -2), size=(8, 15),
+            color=((200, 255), (100, 200), 255), life=60
+        )
         
         # 반짝이 파티클 생성
-        for _ in range(8):
-            self.sparkle_particles.append({
-                'x': x + random.randint(-30, 30),
-                'y': y + random.randint(-20, 20),
-                'life': 40,
-                'size': random.randint(3, 8),
-                'color': (255, 255, random.randint(100, 255)),
-                'vel_x': random.uniform(-2, 2),
-                'vel_y': random.uniform(-3, -1)
-            })
+        self.sparkle_particles.emit(
+            8, x, y, offset_x=(-30, 30), offset_y=(-20, 20),
+            vx=(-2, 2), vy=(-3, -1), size=(3, 8),
+            color=(255, 255, (100, 255)), life=40
+        )
     
     def update_particles(self, frame):
-        """파티클 업데이트"""
+        """파티클 업데이트 (배경 파티클 보충 + 일괄 이동/제거)"""
         h, w = frame.shape[:2]
         
-        # 하트 파티클 생성
+        # 하트 파티클 생성 (화면 아래에서 올라옴)
         if len(self.heart_particles) < 10:
-            self.heart_particles.append({
-                'x': np.random.randint(0, w),
-                'y': h,
-                'speed': np.random.uniform(1, 3),
-                'size': np.random.randint(3, 8),
-                'color': (np.random.randint(100, 255), np.random.randint(100, 255), 255)
-            })
+            self.heart_particles.emit(
+                1, (0, w - 1), h,
+                vy=(-3, -1), size=(3, 7),
+                color=((100, 254), (100, 254), 255)
+            )
         
         # 반짝이 파티클 생성
         if len(self.sparkle_particles) < 15:
-            self.sparkle_particles.append({
-                'x': np.random.randint(0, w),
-                'y': np.random.randint(0, h),
-                'life': 30,
-                'size': np.random.randint(2, 5),
-                'color': (255, 255, np.random.randint(150, 255))
-            })
+            self.sparkle_particles.emit(
+                1, (0, w - 1), (0, h - 1),
+                size=(2, 4),
+                color=(255, 255, (150, 254)), life=30
+            )
+        
+        self.heart_particles.update()
+        self.sparkle_particles.update()
     
-    def draw_particles(self, frame):
-        """귀여운 파티클 그리기"""
-        # 하트 파티클
-        for particle in self.heart_particles[:]:
-            # 위치 업데이트
-            particle['y'] -= particle['speed']
-            if hasattr(particle, 'life'):
-                particle['life'] -= 1
-                if particle['life'] <= 0:
-                    self.heart_particles.remove(particle)
-                    continue
-            elif particle['y'] < -10:
-                self.heart_particles.remove(particle)
-                continue
-            
-            # 하트 모양 그리기 (귀여운 효과)
-            x, y = int(particle['x']), int(particle['y'])
-            size = particle['size']
-            color = particle['color']
-            
-            # 하트의 두 원
-            cv2.circle(frame, (x - size//3, y - size//3), size//2, color, -1)
-            cv2.circle(frame, (x + size//3, y - size//3), size//2, color, -1)
-            # 하트의 삼각형 부분
-            triangle = np.array([[x, y + size//2], 
-                               [x - size//2, y], 
-                               [x + size//2, y]], np.int32)
-            cv2.fillPoly(frame, [triangle], color)
-        
-        # 반짝이 파티클 (별 모양)
-        for particle in self.sparkle_particles[:]:
-            if 'vel_x' in particle and 'vel_y' in particle:
-                particle['x'] += particle['vel_x']
-                particle['y'] += particle['vel_y']
-            
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.sparkle_particles.remove(particle)
-                continue
-            
-            # 별 모양 그리기
-            x, y = int(particle['x']), int(particle['y'])
-            size = particle['size']
-            color = particle['color']
-            
-            # 십자 모양의 별
-            cv2.line(frame, (x - size, y), (x + size, y), color, 2)
-            cv2.line(frame, (x, y - size), (x, y + size), color, 2)
-            cv2.line(frame, (x - size//2, y - size//2), (x + size//2, y + size//2), color, 1)
-            cv2.line(frame, (x + size//2, y - size//2), (x - size//2, y + size//2), color, 1)
+    def draw_particles(self, frame, alpha=1.0):
+        """귀여운 파티클 그리기 (alpha로 스텝 사이 위치 보간)"""
+        self.particle_renderer.draw(self.heart_particles, frame, alpha)
+        self.particle_renderer.draw(self.sparkle_particles, frame, alpha)
+    
+    def get_time_display(self):
+        """남은 시간 텍스트와 색상 (0.1초 단위)"""
+        remaining_time = max(0, self.game_duration - (time.time() - self.game_start_time))
+        
+        # 시간 표시 (파스텔 컬러)
+        if self.game_state == "waiting":
+            return "시작 준비!", (200, 150, 255, 255)  # 파스텔 퍼플
+        elif remaining_time > 10:
+            time_color = (150, 255, 150, 255)  # 파스텔 그린
+        elif remaining_time > 5:
+            time_color = (150, 220, 255, 255)  # 파스텔 블루
+        else:
+            time_color = (255, 180, 180, 255)  # 파스텔 핑크
+        return f"시간: {remaining_time:.1f}초", time_color
     
     def draw_ui(self, frame):
-        """UI 그리기 (PIL + neodgm 폰트 사용)"""
+        """UI 그리기 (내용이 바뀔 때만 RGBA 레이어를 다시 만들고, 덮는 행만 합성)"""
         h, w = frame.shape[:2]
         
-        # OpenCV frame을 PIL Image로 변환 (RGBA 모드 사용)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(frame_rgb).convert('RGBA')
+        # 레이어 내용을 결정하는 값들 (하나라도 바뀌면 다시 그림)
+        time_text, _ = self.get_time_display()
+        key = (w, h, self.game_state, self.score, time_text, self.heart_debug_info,
+               self.high_score, getattr(self, '_is_new_record', False))
+        if self.ui_overlay.is_stale(key):
+            self.ui_overlay.set_layer(self.build_ui_layer(w, h), key)
+        self.ui_overlay.draw(frame)
         
-        # 반투명 오버레이 생성
-        overlay = Image.new('RGBA', pil_image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        # OpenCV로 구역 표시 (PIL로는 복잡한 도형 그리기가 어려움)
+        self.draw_zones_opencv(frame, w, h)
+    
+    def build_ui_layer(self, w, h):
+        """UI 전체를 투명 BGRA 레이어에 그려서 반환 (neodgm 글리프 아틀라스 사용)"""
+        layer = np.zeros((h, w, 4), dtype=np.uint8)
         
         # 파스텔 배경 오버레이 (상단)
-        draw.rectangle([(0, 0), (w, 140)], fill=(250, 230, 255, 180))
+        layer[:141] = (255, 230, 250, 180)
         
         # 게임 제목 (neodgm 폰트)
         title_text = "친구들을 옮겨줘"
-        try:
-            title_bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-            title_width = title_bbox[2] - title_bbox[0]
-            draw.text(((w - title_width) // 2, 10), title_text, 
-                     fill=(150, 100, 200, 255), font=self.font_large)
-        except Exception as e:
-            print(f"[!] 제목 텍스트 렌더링 오류: {e}")
-            # 대체 텍스트 (영어)
-            draw.text((w//2 - 100, 10), "Move Friends!", 
-                     fill=(150, 100, 200, 255), font=self.font_large)
-        
-        # 오버레이를 원본 이미지에 합성
-        pil_image = Image.alpha_composite(pil_image, overlay)
+        title_width, _ = self.font_large.measure(title_text)
+        self.font_large.draw(layer, ((w - title_width) // 2, 10), title_text, (150, 100, 200, 255))
         
         # 게임 UI 표시
-        self.draw_game_ui_pil(ImageDraw.Draw(pil_image), w, h)
-        
-        # PIL에서 OpenCV로 다시 변환 (RGB로 변환 후)
-        pil_image = pil_image.convert('RGB')
-        frame_bgr = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        frame[:] = frame_bgr[:]
-        
-        # OpenCV로 구역 표시 (PIL로는 복잡한 도형 그리기가 어려움)
-        self.draw_zones_opencv(frame, w, h)
+        self.draw_game_ui(layer, w, h)
+        return layer
     
     def draw_zones_opencv(self, frame, w, h):
         """구역 표시 (OpenCV 사용)"""
@@ -923,167 +795,98 @@ class HandTrackingPixelPhotobooth:
         spawn_x = int(w * 0.3)
         cv2.rectangle(frame, (0, 180), (spawn_x, h), (200, 180, 255), 3)
     
-    def safe_draw_text(self, draw, position, text, color, font):
-        """안전한 텍스트 렌더링 (한글 지원)"""
+    def safe_draw_text(self, layer, position, text, color, font):
+        """글리프 아틀라스로 텍스트 그리기 (기존 레이아웃과 같게 10px 여백)"""
         try:
-            draw.text(position, text, fill=color, font=font)
+            font.draw(layer, (position[0] + 10, position[1] + 10), text, color)
         except Exception as e:
-            print(f"[!] 텍스트 렌더링 오류: {e}")
-            # 영어 대체 텍스트 또는 기본 폰트 사용
-            try:
-                draw.text(position, text, fill=color, font=ImageFont.load_default())
-            except:
-                # 최종 대체안: 간단한 ASCII 문자
-                draw.text(position, "TEXT", fill=color, font=ImageFont.load_default())
-    
-    def safe_draw_text(self, draw, position, text, color, font):
-        """한국어 텍스트를 안전하게 그리는 함수"""
-        try:
-            # RGBA 이미지에서 한국어 텍스트 렌더링
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            # 텍스트 이미지 생성
-            text_img = Image.new('RGBA', (text_width + 20, text_height + 20), (0, 0, 0, 0))
-            text_draw = ImageDraw.Draw(text_img)
-            text_draw.text((10, 10), text, fill=color, font=font)
-            
-            # 원본 이미지에 합성
-            draw._image.paste(text_img, position, text_img)
-        except Exception as e:
-            # 한국어 렌더링 실패 시 영어로 대체
-            english_text = "Game UI"
-            if "하트" in text or "Heart" in text:
-                english_text = "Make Heart to Start!"
-            elif "시작" in text:
-                english_text = "START"
-            elif "종료" in text:
-                english_text = "END"
-            elif "점수" in text or "Score" in text:
-                english_text = f"Score: {self.score}"
-            elif "시간" in text:
-                english_text = text.replace("시간:", "Time:").replace("초", "s")
-            elif "최고점" in text:
-                english_text = f"Best: {self.high_score}"
-                
-            draw.text(position, english_text, fill=color, font=font)
+            log.warning("텍스트 렌더링 오류: %s", e)
 
-    def draw_game_ui_pil(self, draw, w, h):
-        """게임 UI 표시 (PIL 버전)"""
-        current_time = time.time()
-        elapsed_time = current_time - self.game_start_time
-        remaining_time = max(0, self.game_duration - elapsed_time)
-        
-        # 시간 표시 (파스텔 컬러)
-        if self.game_state == "waiting":
-            time_color = (200, 150, 255, 255)  # 파스텔 퍼플
-            time_text = "시작 준비!"
-        elif remaining_time > 10:
-            time_color = (150, 255, 150, 255)  # 파스텔 그린
-            time_text = f"시간: {remaining_time:.1f}초"
-        elif remaining_time > 5:
-            time_color = (150, 220, 255, 255)  # 파스텔 블루
-            time_text = f"시간: {remaining_time:.1f}초"
-        else:
-            time_color = (255, 180, 180, 255)  # 파스텔 핑크
-            time_text = f"시간: {remaining_time:.1f}초"
+    def draw_game_ui(self, layer, w, h):
+        """게임 UI 표시 (BGRA 레이어에 그림)"""
+        time_text, time_color = self.get_time_display()
         
         # 안전한 텍스트 렌더링
-        self.safe_draw_text(draw, (20, 50), time_text, time_color, self.font_medium)
+        self.safe_draw_text(layer, (20, 50), time_text, time_color, self.font_medium)
         
         # 점수 표시 (핑크색)
         score_text = f"점수: {self.score}"
-        self.safe_draw_text(draw, (20, 80), score_text, (255, 150, 200, 255), self.font_medium)
+        self.safe_draw_text(layer, (20, 80), score_text, (255, 150, 200, 255), self.font_medium)
         
         # 하트 디버그 정보 표시 (작은 글씨, 상단 좌측)
         if hasattr(self, 'heart_debug_info') and self.heart_debug_info:
-            self.safe_draw_text(draw, (20, 110), self.heart_debug_info, (200, 200, 200, 180), self.font_small)
+            self.safe_draw_text(layer, (20, 110), self.heart_debug_info, (200, 200, 200, 180), self.font_small)
         
         # 최고 점수 표시 (핑크색)
         high_score_text = f"최고점: {self.high_score}"
-        try:
-            high_score_bbox = draw.textbbox((0, 0), high_score_text, font=self.font_medium)
-            high_score_width = high_score_bbox[2] - high_score_bbox[0]
-            self.safe_draw_text(draw, (w - high_score_width - 20, 50), high_score_text, 
-                               (255, 150, 200, 255), self.font_medium)
-        except:
-            # 대체 표시
-            self.safe_draw_text(draw, (w - 150, 50), f"Best: {self.high_score}", 
-                               (255, 150, 200, 255), self.font_medium)
+        high_score_width, _ = self.font_medium.measure(high_score_text)
+        self.safe_draw_text(layer, (w - high_score_width - 20, 50), high_score_text, 
+                           (255, 150, 200, 255), self.font_medium)
         
         # 게임 상태별 메시지
         if self.game_state == "waiting":
             # 시작 대기 메시지
             start_text = "손으로 하트를 그려 게임 시작!"
-            try:
-                start_bbox = draw.textbbox((0, 0), start_text, font=self.font_large)
-                start_width = start_bbox[2] - start_bbox[0]
-                self.safe_draw_text(draw, ((w - start_width) // 2, h // 2), start_text, 
-                                   (255, 200, 220, 255), self.font_large)
-            except:
-                # 대체 메시지
-                self.safe_draw_text(draw, (w//2 - 100, h//2), "Make Heart to Start!", 
-                                   (255, 200, 220, 255), self.font_large)
+            start_width, _ = self.font_large.measure(start_text)
+            self.safe_draw_text(layer, ((w - start_width) // 2, h // 2), start_text, 
+                               (255, 200, 220, 255), self.font_large)
             
             desc_text1 = "30초 안에 캐릭터들을"
             desc_text2 = "오른쪽으로 옮겨주세요!"
-            try:
-                self.safe_draw_text(draw, ((w - 300) // 2, h // 2 + 50), desc_text1, 
-                                   (200, 180, 255, 255), self.font_medium)
-                self.safe_draw_text(draw, ((w - 300) // 2, h // 2 + 80), desc_text2, 
-                                   (200, 180, 255, 255), self.font_medium)
-            except:
-                self.safe_draw_text(draw, ((w - 300) // 2, h // 2 + 50), "Move characters to", 
-                                   (200, 180, 255, 255), self.font_medium)
-                self.safe_draw_text(draw, ((w - 300) // 2, h // 2 + 80), "the right!", 
-                                   (200, 180, 255, 255), self.font_medium)
+            self.safe_draw_text(layer, ((w - 300) // 2, h // 2 + 50), desc_text1, 
+                               (200, 180, 255, 255), self.font_medium)
+            self.safe_draw_text(layer, ((w - 300) // 2, h // 2 + 80), desc_text2, 
+                               (200, 180, 255, 255), self.font_medium)
         
         elif self.game_state == "playing":
             # 10명 달성 시 특별 메시지
             if self.score >= 10:
                 celebration_text = "축하해!! 모두를 다 옮겼구나!!"
-                self.safe_draw_text(draw, ((w - 400) // 2, h // 2 - 50), celebration_text, 
+                self.safe_draw_text(layer, ((w - 400) // 2, h // 2 - 50), celebration_text, 
                                    (255, 100, 200, 255), self.font_large)
                 
                 perfect_text = "PERFECT!"
-                self.safe_draw_text(draw, ((w - 200) // 2, h // 2), perfect_text, 
+                self.safe_draw_text(layer, ((w - 200) // 2, h // 2), perfect_text, 
                                    (255, 200, 100, 255), self.font_large)
             else:
                 instruction_text1 = "캐릭터를 목표 구역으로"
                 instruction_text2 = "드래그하세요!"
-                self.safe_draw_text(draw, ((w - 300) // 2, h - 90), instruction_text1, 
+                self.safe_draw_text(layer, ((w - 300) // 2, h - 90), instruction_text1, 
                                    (180, 255, 200, 255), self.font_medium)
-                self.safe_draw_text(draw, ((w - 300) // 2, h - 60), instruction_text2, 
+                self.safe_draw_text(layer, ((w - 300) // 2, h - 60), instruction_text2, 
                                    (180, 255, 200, 255), self.font_medium)
         
         else:
             # 게임 종료 메시지
             # 반투명 배경
-            draw.rectangle([(w//2 - 250, h//2 - 100), (w//2 + 250, h//2 + 120)], 
-                          fill=(240, 230, 255, 220))
-            draw.rectangle([(w//2 - 250, h//2 - 100), (w//2 + 250, h//2 + 120)], 
-                          outline=(200, 150, 255), width=3)
+            x0, y0, x1, y1 = w//2 - 250, h//2 - 100, w//2 + 251, h//2 + 121
+            layer[y0:y1, x0:x1] = (255, 230, 240, 220)
+            # 테두리 (두께 3)
+            border = (255, 150, 200, 255)
+            layer[y0:y0 + 3, x0:x1] = border
+            layer[y1 - 3:y1, x0:x1] = border
+            layer[y0:y1, x0:x0 + 3] = border
+            layer[y0:y1, x1 - 3:x1] = border
             
             # 게임 오버 텍스트
             game_over_text = "게임 종료!"
-            self.safe_draw_text(draw, ((w - 150) // 2, h//2 - 60), game_over_text, 
+            self.safe_draw_text(layer, ((w - 150) // 2, h//2 - 60), game_over_text, 
                                (255, 100, 150, 255), self.font_large)
             
             # 최종 점수 (핑크색)
             final_score_text = f"최종 점수: {self.score}점"
-            self.safe_draw_text(draw, ((w - 200) // 2, h//2 - 10), final_score_text, 
+            self.safe_draw_text(layer, ((w - 200) // 2, h//2 - 10), final_score_text, 
                                (255, 150, 200, 255), self.font_medium)
             
             # 새 기록 표시
             if hasattr(self, '_is_new_record') and self._is_new_record:
                 new_record_text = "🎉 새로운 최고 기록! 🎉"
-                self.safe_draw_text(draw, ((w - 300) // 2, h//2 + 20), new_record_text, 
+                self.safe_draw_text(layer, ((w - 300) // 2, h//2 + 20), new_record_text, 
                                    (255, 200, 100, 255), self.font_medium)
             
             # 재시작 안내
             restart_text = "하트를 그려 다시 시작!"
-            self.safe_draw_text(draw, ((w - 250) // 2, h//2 + 60), restart_text, 
+            self.safe_draw_text(layer, ((w - 250) // 2, h//2 + 60), restart_text, 
                                (200, 200, 255, 255), self.font_medium)
     
     def start_game(self):
@@ -1094,19 +897,11 @@ class HandTrackingPixelPhotobooth:
         self.characters.clear()
         self.moved_characters.clear()
         self.spawn_timer = 0
-        self.is_pinching = False
-        self.selected_character = None
-        self.drag_mode = False
+        self.hand_interactions.clear()
         self._is_new_record = False
         
-        # 배경음악 재시작
-        try:
-            if os.path.exists("student-bgm.mp3"):
-                pygame.mixer.music.load("student-bgm.mp3")
-                pygame.mixer.music.set_volume(0.3)
-                pygame.mixer.music.play(-1)
-        except:
-            pass
+        # 배경음악 재시작 (이미 열어 둔 PCM을 처음부터 다시 스트리밍)
+        get_bgm_player().play(self.bgm_path)
         
         # 캐릭터 풀 리셋 (새 게임에서 모든 캐릭터 다시 사용 가능)
         self.reset_character_pool()
@@ -1117,10 +912,46 @@ class HandTrackingPixelPhotobooth:
         self.start_game()  # start_game과 동일한 로직
         print("게임 재시작! 새로운 캐릭터들과 함께!")
     
+    def open_camera(self, camera_index, host=None):
+        """카메라 열기 (호스트에서 실행 중이면 호스트가 열어둔 카메라 재사용), 실패하면 None"""
+        if clip_path():
+            # CAMERA_CLIP: 카메라 대신 녹화 영상 (벤치마크)
+            return open_clip()
+        if host is not None:
+            # 호스트가 열어둔 카메라 재사용 (release()해도 닫히지 않음)
+            cap = host.open_camera(camera_index)
+        else:
+            # 카메라 초기화 최적화
+            cap = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)  # DirectShow 백엔드 명시적 사용
+            
+            # 빠른 초기화를 위한 설정
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
+            cap.set(cv2.CAP_PROP_FPS, 30)  # FPS 설정
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        
+        # 카메라 연결 확인
+        if not cap.isOpened():
+            print("⚠️ 기본 백엔드로 재시도...")
+            cap = cv2.VideoCapture(camera_index)  # 기본 백엔드로 재시도
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            
+            if not cap.isOpened():
+                print("❌ 카메라를 열 수 없습니다!")
+                return None
+        return cap
+    
     def run(self):
         """메인 실행"""
-        # 가상환경 체크 및 자동 활성화
-        if not check_and_activate_venv():
+        # 게임 호스트에서 실행 중이면 카메라/모델을 공유하고 종료 시 로깅을 닫지 않음
+        host = active_host()
+        
+        # 로깅 초기화 (콘솔/파일 출력은 백그라운드 스레드에서 처리)
+        setup_logging("student_moving_game")
+        
+        # 가상환경 체크 및 자동 활성화 (호스트는 이미 실행 환경이 준비됨)
+        if host is None and not check_and_activate_venv():
             print("❌ 가상환경 설정을 확인해주세요.")
             input("Press Enter to exit...")
             return
@@ -1133,7 +964,7 @@ class HandTrackingPixelPhotobooth:
         print("*** 🎯 목표: 오른쪽 파스텔 목표 구역에 최대한 많은 캐릭터 이동!")
         print("*** 📊 최고 점수가 자동으로 저장됩니다!")
         print("*** 🎨 neodgm 폰트와 파스텔 UI로 업그레이드!")
-        print("*** 📸 S키: 스크린샷 저장, ESC: 종료")
+        print("*** 📸 S키: 스크린샷 저장, P키: 프레임 시간 HUD, F키: 프로파일 기록, ESC: 종료")
         print("=" * 60)
         
         # 환경변수에서 카메라 인덱스 가져오거나 USB 웹캠 자동 감지
@@ -1145,26 +976,10 @@ class HandTrackingPixelPhotobooth:
             print(f"🎮 캐릭터 옮기기 게임 - 자동 감지로 카메라 {camera_index} 사용 중...")
         
         print("📷 카메라 초기화 중...")
-        
-        # 카메라 초기화 최적화
-        cap = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)  # DirectShow 백엔드 명시적 사용
-        
-        # 빠른 초기화를 위한 설정
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
-        cap.set(cv2.CAP_PROP_FPS, 30)  # FPS 설정
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        
-        # 카메라 연결 확인
-        if not cap.isOpened():
-            print("⚠️ 기본 백엔드로 재시도...")
-            cap = cv2.VideoCapture(camera_index)  # 기본 백엔드로 재시도
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            
-            if not cap.isOpened():
-                print("❌ 카메라를 열 수 없습니다!")
-                return
+        with step("camera"):
+            cap = self.open_camera(camera_index, host)
+        if cap is None:
+            return
         
         print("✅ 카메라 초기화 완료!")
         
@@ -1173,12 +988,11 @@ class HandTrackingPixelPhotobooth:
         SCREEN_HEIGHT = 800
         
         # 창 생성 및 크기 설정 (food_eating_game.py 방식과 유사하게)
-        cv2.namedWindow('STUDENT MOVING GAME', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('STUDENT MOVING GAME', SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        # 창 위치 설정 (화면 중앙)
-        cv2.moveWindow('STUDENT MOVING GAME', 100, 50)
+        # imshow/waitKey는 프레젠터 스레드에서 처리 (게임 루프는 프레임만 넘기고 계속 진행)
+        presenter = FramePresenter('STUDENT MOVING GAME', size=(SCREEN_WIDTH, SCREEN_HEIGHT), position=(100, 50))
+        presenter.start()
         print(f"✓ 창모드 설정: {SCREEN_WIDTH}x{SCREEN_HEIGHT} (food_eating_game.py와 동일)")
+        print(f"✓ 화면 출력: {'별도 스레드' if presenter.threaded else '메인 스레드 (동기)'}")
         
         # UI 스케일링 팩터 (600x800에 맞춘 최적화)
         self.ui_scale = 1.0  # food_eating_game.py와 동일한 스케일
@@ -1189,42 +1003,76 @@ class HandTrackingPixelPhotobooth:
         
         particles_enabled = True
         
+        # GAME_AUTOSTART=1이면 하트 없이 바로 시작 (벤치마크용)
+        if os.environ.get('GAME_AUTOSTART') == '1':
+            self.start_game()
+        
+        # 고정 타임스텝 시뮬레이션 (카메라/렌더링 FPS와 무관하게 1/60초 단위로 파티클 진행)
+        sim_clock = FixedTimestep(1.0 / 60.0)
+        
+        # 단계별 프레임 시간 (P: HUD 켜기/끄기), 샘플링 프로파일러 (F 또는 SIGUSR1: 시작/저장)
+        profiler = get_profiler()
+        sampler = get_sampler()
+        # 프레임 타임라인 (TRACE=1: 단계는 profiler가 기록, 여기서는 카운터만)
+        tracer = get_tracer()
+        
         try:
             while True:
+                profiler.start_frame()
                 ret, frame = cap.read()
                 if not ret:
                     break
+                profiler.lap("capture")
                 
                 frame = cv2.flip(frame, 1)
                 
                 # 프레임을 food_eating_game.py와 동일한 600x800 크기로 리사이즈
                 frame = cv2.resize(frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 frame_height, frame_width = frame.shape[:2]
+                profiler.lap("filter")
                 
                 # 핸드 트래킹
                 if self.hands:
                     rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                     results = self.hands.process(rgb_frame)
+                    profiler.count("hands")
+                    profiler.lap("hands")
                     self.process_hand_tracking(frame, results)
                 
                 # 캐릭터 업데이트 및 그리기
                 self.update_characters(frame_width, frame_height)
+                profiler.lap("logic")
                 for character in self.characters:
                     self.draw_character(frame, character)
+                profiler.lap("characters")
                 
                 # 파티클 효과
+                sim_steps = sim_clock.tick()
                 if particles_enabled:
-                    self.update_particles(frame)
-                    self.draw_particles(frame)
+                    for _ in range(sim_steps):
+                        self.update_particles(frame)
+                    self.draw_particles(frame, sim_clock.alpha)
+                profiler.lap("particles")
+                tracer.counter("characters", len(self.characters))
+                tracer.counter("particles", len(self.heart_particles) + len(self.sparkle_particles))
                 
                 # UI 그리기
                 self.draw_ui(frame)
+                profiler.lap("ui")
                 
-                cv2.imshow('STUDENT MOVING GAME', frame)
+                profiler.draw_opencv(frame)
+                presenter.present(frame)
+                profiler.lap("present")
+                mark_first_frame()
+                profiler.end_frame()
                 
-                key = cv2.waitKey(1) & 0xFF
+                key = presenter.poll_key()
                 if key == 27:  # ESC - 종료
                     break
+                elif key == ord('p'):  # P - 프레임 시간 HUD
+                    profiler.toggle()
+                elif key == ord('f'):  # F - 샘플링 프로파일러 시작/저장
+                    sampler.toggle()
                 elif key == ord('s'):  # S - 스크린샷 저장
                     filename = f"pixel_game_{int(time.time())}.jpg"
                     cv2.imwrite(filename, frame)
@@ -1251,19 +1099,28 @@ class HandTrackingPixelPhotobooth:
         finally:
             # 배경음악 정지
             try:
-                pygame.mixer.music.stop()
+                get_bgm_player().stop()
                 print("✓ 배경음악 정지")
             except:
                 pass
             cap.release()
-            cv2.destroyAllWindows()
+            presenter.close()
+            stats = presenter.get_stats()
+            print(f"🖥️ 화면 출력: {stats['presented']}/{stats['submitted']} 프레임 표시 "
+                  f"(버림 {stats['dropped']}), 넘기기 평균 {stats['submit_ms']:.2f}ms, "
+                  f"imshow 평균 {stats['present_ms']:.2f}ms / p95 {stats['present_p95_ms']:.2f}ms")
+            if not presenter.headless:
+                cv2.destroyAllWindows()
             print("\n< 3 Hand Tracking Pixel Photobooth 종료!")
+            if host is None:
+                shutdown_logging()
 
 
 def main():
     try:
         print("< 3 Hand Tracking Pixel Photobooth 시작!")
-        photobooth = HandTrackingPixelPhotobooth()
+        with step("init"):
+            photobooth = HandTrackingPixelPhotobooth()
         photobooth.run()
         
     except Exception as e:
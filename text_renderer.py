@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+텍스트 렌더링 캐시
+- neodgm.ttf 등 폰트로 그린 텍스트 Surface를 LRU 캐시에 보관
+- (폰트, 크기, 텍스트, 색상) 조합이 같으면 FreeType 렌더링 없이 재사용
+- 메모리 예산(바이트)을 넘으면 오래된 항목부터 제거
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class CachedFont:
+    """pygame.font.Font와 같은 방식으로 쓰는 캐시 폰트"""
+
+    def __init__(self, renderer, font, font_key, size):
+        self.renderer = renderer
+        self.font = font
+        self.font_key = font_key
+        self.size_px = size
+
+    def render(self, text, antialias, color, background=None):
+        """캐시된 텍스트 Surface 반환 (반환된 Surface는 수정하지 말 것)"""
+        return self.renderer.render_with(self, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        # size(), get_height() 등 나머지는 원본 폰트에 위임
+        return getattr(self.font, name)
+
+
+class TextRenderer:
+    def __init__(self, font_path="neodgm.ttf", max_bytes=8 * 1024 * 1024):
+        """폰트 경로와 캐시 메모리 예산(바이트) 설정"""
+        self.font_path = font_path
+        self.max_bytes = max_bytes
+        self.fonts = {}
+        self.cache = OrderedDict()
+        self.current_bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size):
+        """크기별 캐시 폰트 반환 (폰트 로드 실패 시 기본 폰트)"""
+        cached = self.fonts.get(size)
+        if cached is not None:
+            return cached
+
+        try:
+            font = pygame.font.Font(self.font_path, size)
+            font_key = self.font_path
+        except Exception as e:
+            print(f"[!] 폰트 로드 실패 ({self.font_path}, {size}): {e}. 기본 폰트를 사용합니다.")
+            font = pygame.font.Font(None, size)
+            font_key = None
+
+        cached = CachedFont(self, font, font_key, size)
+        self.fonts[size] = cached
+        return cached
+
+    def render(self, text, size, color, antialias=True, background=None):
+        """크기 지정으로 바로 텍스트 렌더링"""
+        return self.render_with(self.font(size), text, antialias, color, background)
+
+    def render_with(self, cached_font, text, antialias, color, background=None):
+        """LRU 캐시를 거쳐 텍스트 Surface 반환"""
+        key = (cached_font.font_key, cached_font.size_px, text, tuple(color),
+               bool(antialias), tuple(background) if background is not None else None)
+
+        surface = self.cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = cached_font.font.render(text, antialias, color)
+        else:
+            surface = cached_font.font.render(text, antialias, color, background)
+
+        surface_bytes = self.surface_bytes(surface)
+        # 예산보다 큰 Surface는 캐시하지 않고 그대로 반환
+        if surface_bytes > self.max_bytes:
+            return surface
+
+        self.cache[key] = surface
+        self.current_bytes += surface_bytes
+        self.evict()
+        return surface
+
+    def evict(self):
+        """메모리 예산을 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+        while self.current_bytes > self.max_bytes and self.cache:
+            _, surface = self.cache.popitem(last=False)
+            self.current_bytes -= self.surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def surface_bytes(surface):
+        """Surface가 차지하는 픽셀 메모리 크기"""
+        return surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        """캐시 비우기 (폰트는 유지)"""
+        self.cache.clear()
+        self.current_bytes = 0
+
+    def get_stats(self):
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.cache),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
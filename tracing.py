@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+프레임 타임라인 추적 (Chrome trace / Perfetto)
+- 평균이 아니라 한 프레임 안에서 카메라, 추론, 프레젠터 스레드, 배경음악 스트리밍이
+  어떻게 겹치는지 보기 위한 구간(span) / 카운터 기록
+- 스레드마다 미리 만든 고정 크기 링 버퍼에 자기 스레드 이벤트만 쓰므로 기록할 때 잠금 없음
+  (가득 차면 오래된 이벤트부터 덮어씀 → 마지막 TRACE_BUFFER개만 남음)
+- 종료 시 Chrome trace event JSON으로 저장 → https://ui.perfetto.dev 또는 chrome://tracing 에서 열기
+- 꺼져 있으면 span()이 미리 만든 빈 컨텍스트를 돌려줄 뿐이라 비용이 거의 없음
+- 게임 루프 단계는 frame_profiler의 lap()/stage()가 그대로 구간으로 기록됨
+
+    TRACE=1                 추적 켜기
+    TRACE_OUT=경로          저장 위치 (기본: traces/<스크립트>_<시각>.json)
+    TRACE_BUFFER=65536      스레드당 보관할 이벤트 수
+
+    tracer = get_tracer()
+    with tracer.span("camera.read"):
+        ...
+    tracer.begin("decode"); ...; tracer.end("decode")
+    tracer.counter("particles", len(particles))
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+DEFAULT_BUFFER = 65536
+
+# 이벤트 종류 (Chrome trace event의 ph 값)
+BEGIN = 'B'
+END = 'E'
+COMPLETE = 'X'
+COUNTER = 'C'
+INSTANT = 'i'
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 쓰는 빈 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.tracer.begin(self.name, self.args)
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.end(self.name)
+        return False
+
+
+class _RingBuffer:
+    """스레드 하나의 이벤트 버퍼 (그 스레드만 씀)"""
+    __slots__ = ('events', 'size', 'index', 'tid', 'name')
+
+    def __init__(self, size):
+        self.events = [None] * size
+        self.size = size
+        self.index = 0            # 지금까지 쓴 이벤트 수 (다음 위치 = index % size)
+        thread = threading.current_thread()
+        self.tid = threading.get_ident()
+        self.name = thread.name
+
+    def append(self, event):
+        self.events[self.index % self.size] = event
+        self.index += 1
+
+    def snapshot(self):
+        """오래된 것부터 순서대로 (덮어쓴 만큼은 빠짐)"""
+        if self.index <= self.size:
+            return self.events[:self.index]
+        start = self.index % self.size
+        return self.events[start:] + self.events[:start]
+
+
+class Tracer:
+    def __init__(self, enabled=None, buffer_size=DEFAULT_BUFFER):
+        self.enabled = os.environ.get('TRACE') == '1' if enabled is None else enabled
+        self.buffer_size = max(16, buffer_size)
+        self.local = threading.local()
+        self.buffers = []         # 스레드별 버퍼 (등록할 때만 잠금)
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+
+    def _buffer(self):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            buffer = self.local.buffer = _RingBuffer(self.buffer_size)
+            with self.lock:
+                self.buffers.append(buffer)
+        return buffer
+
+    def span(self, name, **args):
+        """구간 기록 컨텍스트 (꺼져 있으면 아무것도 안 함)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args or None)
+
+    def begin(self, name, args=None):
+        if self.enabled:
+            self._buffer().append((BEGIN, name, time.perf_counter(), args))
+
+    def end(self, name):
+        if self.enabled:
+            self._buffer().append((END, name, time.perf_counter(), None))
+
+    def complete(self, name, start, duration, args=None):
+        """이미 끝난 구간 기록 (start/duration은 perf_counter 기준 초)"""
+        if self.enabled:
+            self._buffer().append((COMPLETE, name, start, (duration, args)))
+
+    def counter(self, name, value):
+        """값 변화 기록 (Perfetto에서 그래프로 표시)"""
+        if self.enabled:
+            self._buffer().append((COUNTER, name, time.perf_counter(), value))
+
+    def instant(self, name, args=None):
+        if self.enabled:
+            self._buffer().append((INSTANT, name, time.perf_counter(), args))
+
+    def clear(self):
+        with self.lock:
+            for buffer in self.buffers:
+                buffer.index = 0
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def _to_us(self, seconds):
+        return round((seconds - self.origin) * 1e6, 3)
+
+    def events(self):
+        """Chrome trace event 목록 (스레드 이름 메타데이터 포함)"""
+        pid = os.getpid()
+        with self.lock:
+            buffers = list(self.buffers)
+        trace = [{'ph': 'M', 'name': "process_name", 'pid': pid, 'tid': 0,
+                  'args': {'name': os.path.basename(sys.argv[0]) or "python"}}]
+        for buffer in buffers:
+            trace.append({'ph': 'M', 'name': "thread_name", 'pid': pid, 'tid': buffer.tid,
+                          'args': {'name': buffer.name}})
+            if buffer.name == "MainThread":
+                trace.append({'ph': 'M', 'name': "thread_sort_index", 'pid': pid, 'tid': buffer.tid,
+                              'args': {'sort_index': -1}})
+            depth = 0
+            for phase, name, ts, data in buffer.snapshot():
+                event = {'ph': phase, 'name': name, 'pid': pid, 'tid': buffer.tid, 'ts': self._to_us(ts)}
+                if phase == BEGIN:
+                    depth += 1
+                elif phase == END:
+                    if depth == 0:
+                        continue  # 짝이 되는 BEGIN이 링 버퍼에서 밀려남
+                    depth -= 1
+                elif phase == COMPLETE:
+                    duration, data = data
+                    event['dur'] = round(duration * 1e6, 3)
+                elif phase == COUNTER:
+                    data = {'value': data}
+                elif phase == INSTANT:
+                    event['s'] = 't'
+                if data:
+                    event['args'] = data
+                trace.append(event)
+        return trace
+
+    def export(self, path):
+        """Chrome trace JSON 저장"""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'traceEvents': self.events(), 'displayTimeUnit': "ms"}, f, ensure_ascii=False)
+        return path
+
+
+_tracer = None
+
+
+def _export_at_exit(tracer, path):
+    try:
+        tracer.export(path)
+        print(f"🧵 타임라인 저장: {path} (https://ui.perfetto.dev 에서 열기)")
+    except OSError as e:
+        print(f"⚠️ 타임라인 저장 실패: {e}")
+
+
+def get_tracer():
+    """프로세스 공용 추적기 (TRACE=1이면 종료 시 저장)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(buffer_size=int(os.environ.get('TRACE_BUFFER', DEFAULT_BUFFER)))
+        if _tracer.enabled:
+            name = os.path.splitext(os.path.basename(sys.argv[0]))[0] or "python"
+            path = os.environ.get('TRACE_OUT') or os.path.join(
+                "traces", f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            atexit.register(_export_at_exit, _tracer, path)
+    return _tracer
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+UI 레이어 합성기
+- 반투명 패널/고정 텍스트는 한 번만 그려서 캐시된 레이어에 보관
+- 값이 바뀐 위젯(점수, 남은 초, 입 상태 등)만 다시 그림
+- 매 프레임에는 완성된 레이어를 한 번만 blit
+- OpenCV 프레임용 FrameOverlay: 내용이 바뀔 때만 다시 만들고, 내용이 있는 행 구간만 합성
+"""
+
+import numpy as np
+import pygame
+
+from sprite_bank import Sprite, blend_sprite
+
+
+def fill_alpha(surface, rect, color, alpha):
+    """반투명 사각형을 레이어에 합성 (set_alpha 오버레이와 같은 효과)"""
+    rect = pygame.Rect(rect)
+    box = pygame.Surface(rect.size, pygame.SRCALPHA)
+    box.fill((*color[:3], alpha))
+    surface.blit(box, rect.topleft)
+
+
+class Widget:
+    def __init__(self, rect, draw_fn, value=None):
+        """레이어 안의 동적 영역 (rect 영역만 다시 그림)"""
+        self.rect = pygame.Rect(rect)
+        self.draw_fn = draw_fn
+        self.value = value
+        self.dirty = True
+
+
+class UILayer:
+    def __init__(self, width, height, build_fn=None):
+        """고정 배경을 build_fn으로 한 번 그리고 위젯을 위에 얹는 레이어"""
+        self.size = (width, height)
+        self.background = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, 0))
+        if build_fn:
+            build_fn(self.background)
+
+        self.surface = self.background.copy()
+        self.widgets = {}
+        self.redraw_count = 0
+
+    def add_widget(self, name, rect, draw_fn, value=None):
+        """동적 위젯 등록 (draw_fn(surface, rect, value))"""
+        self.widgets[name] = Widget(rect, draw_fn, value)
+        return self.widgets[name]
+
+    def set(self, name, value):
+        """위젯 값 변경 (값이 바뀐 경우에만 다시 그리도록 표시)"""
+        widget = self.widgets[name]
+        if widget.value != value:
+            widget.value = value
+            widget.dirty = True
+
+    def update(self, **values):
+        """여러 위젯 값을 한 번에 변경"""
+        for name, value in values.items():
+            self.set(name, value)
+
+    def restore_background(self, rect):
+        """위젯 영역을 고정 배경으로 되돌림 (알파 포함 그대로 복사)"""
+        self.surface.fill((0, 0, 0, 0), rect)
+        # 투명(0)으로 비운 뒤 MAX 블렌드 = 배경 픽셀을 알파까지 정확히 복사
+        self.surface.blit(self.background, rect.topleft, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def refresh(self):
+        """더티 위젯만 다시 그림"""
+        for widget in self.widgets.values():
+            if not widget.dirty:
+                continue
+            self.restore_background(widget.rect)
+            self.surface.set_clip(widget.rect)
+            try:
+                widget.draw_fn(self.surface, widget.rect, widget.value)
+            finally:
+                self.surface.set_clip(None)
+            widget.dirty = False
+            self.redraw_count += 1
+
+    def draw(self, screen, position=(0, 0)):
+        """변경된 위젯을 반영한 뒤 레이어를 한 번에 합성"""
+        self.refresh()
+        screen.blit(self.surface, position)
+
+
+class FrameOverlay:
+    def __init__(self):
+        """OpenCV BGR 프레임용 캐시 레이어 (내용 키가 바뀔 때만 다시 만듦)"""
+        self.key = None
+        self.spans = []  # (x, y, Sprite) - 알파가 있는 행 구간별 잘라낸 조각
+        self.rebuild_count = 0
+
+    def is_stale(self, key):
+        """내용 키가 바뀌었으면 True"""
+        return key != self.key
+
+    def set_layer(self, bgra, key):
+        """BGRA 레이어를 내용이 있는 행 구간으로 잘라서 보관"""
+        self.key = key
+        self.rebuild_count += 1
+        self.spans = []
+
+        alpha = bgra[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if len(rows) == 0:
+            return
+
+        # 연속된 행끼리 묶고, 각 구간은 알파가 있는 열 범위로 잘라냄
+        breaks = np.flatnonzero(np.diff(rows) > 1)
+        starts = np.concatenate(([rows[0]], rows[breaks + 1]))
+        ends = np.concatenate((rows[breaks], [rows[-1]])) + 1
+        for y0, y1 in zip(starts.tolist(), ends.tolist()):
+            cols = np.flatnonzero(alpha[y0:y1].any(axis=0))
+            x0, x1 = int(cols[0]), int(cols[-1]) + 1
+            self.spans.append((x0, y0, Sprite(np.ascontiguousarray(bgra[y0:y1, x0:x1]))))
+
+    def draw(self, frame):
+        """보관된 구간만 프레임에 합성"""
+        for x, y, sprite in self.spans:
+            blend_sprite(frame, sprite, x, y)